@@ -1,5 +1,6 @@
 from base import BaseTools
 from io_tools import IOTools
+from sql_tools import SQLTools
 from eda import EDATools
 from missing import MissingTools
 from outliers import OutliersTools
@@ -7,11 +8,16 @@ from encoding import EncodingTools
 from scaling import ScalingTools
 from features import FeatureTools
 from text_cleaning import TextCleaningTools
+from near_duplicates import NearDuplicateTools
 from types_tools import TypeTools
+from lazy import LazyTools
+from preprocessing import PreprocessingTools
+from profiling import ProfilingTools
 
 class DataTools(
     BaseTools,
     IOTools,
+    SQLTools,
     EDATools,
     MissingTools,
     OutliersTools,
@@ -19,7 +25,11 @@ class DataTools(
     ScalingTools,
     FeatureTools,
     TextCleaningTools,
-    TypeTools
+    NearDuplicateTools,
+    TypeTools,
+    LazyTools,
+    PreprocessingTools,
+    ProfilingTools
 ):
     """DataTools: One class that exposes all tools from all modules."""
     pass
@@ -1 +1,8 @@
-from .DataUtil import DataTools
\ No newline at end of file
+from .DataUtil import DataTools
+from .preprocessing import Preprocessor
+from .chunked import ChunkedDataTools
+from .io_tools import BatchWriter
+from .sql_tools import ConnectionPool
+from .import_cache import ImportCache
+from .incremental import IncrementalProfiler
+from .row_index import RowHashIndex
@@ -1,5 +1,14 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+from sketches import approx_quantile, resolve_rank_error
+
 """
 DataUtility Library
 -------------------
@@ -14,15 +23,60 @@ Design Rules
 - All “transform” methods respect inplace=True/False.
 - Column validation everywhere (friendly errors).
 - Numeric-only operations validate dtype.
+- copy=False skips the defensive copies: inplace transforms write the
+  affected columns straight into self.df (the frame is never duplicated).
+- n_jobs spreads per-column work over a thread pool (-1 => all cores).
+- Column statistics are cached per (column, statistic) and dropped only for
+  the columns a transform changes. After editing dt.df by hand, call
+  dt.clearStatsCache().
 """
 
 
+def _popcount(bits: np.ndarray) -> int:
+    """Set bits in a packed bitmap (np.bitwise_count needs numpy >= 2)."""
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bits).sum())
+    return int(np.unpackbits(bits).sum())
+
+
 class BaseTools:
     # ==========================================================
     """SECTION: Helpers (Foundation Utilities)"""
     # ==========================================================
-    def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+    def __init__(self, df: pd.DataFrame, *, copy: bool = True, n_jobs: int = 1, stats_cache_mb: float = 64):
+        """
+        copy:
+            True  => work on a private copy of df; transforms copy before writing (safe default)
+            False => copy-free mode: wrap df as-is and let inplace transforms
+                     assign only the columns they change
+
+        n_jobs:
+            default worker threads for per-column transforms
+            (1 => sequential, -1 => all cores); every such method also accepts n_jobs=
+
+        stats_cache_mb:
+            memory limit of the column-statistics cache (0 => no caching)
+        """
+        self.copy = copy
+        self.n_jobs = n_jobs
+        self.stats_cache_mb = stats_cache_mb
+        self._frame_copies = 0  # _copy_frame calls made so far
+        self._sample_rows, self._sampled_frame = None, None
+        self.df = self._copy_frame(df) if copy else df
+        self.clearStatsCache()
+
+    @property
+    def sample_population(self):
+        """
+        Rows self.df was sampled from (importData(sample=...)), else None.
+        Forgotten once dt.df is replaced or a transform changes its row count.
+        """
+        return self._sample_rows if self._sampled_frame is not None and self.df is self._sampled_frame else None
+
+    @sample_population.setter
+    def sample_population(self, rows):
+        self._sample_rows = rows
+        self._sampled_frame = None if rows is None else self.df
 
     def _require_columns(self, columns):
         """Validate columns exist. columns can be str or list[str]."""
@@ -68,9 +122,224 @@ class BaseTools:
             )
         return numeric
 
-    def _apply(self, new_df: pd.DataFrame, inplace: bool):
-        """Apply changes according to inplace behavior."""
+    def _working_df(self, inplace: bool, copy: bool = None):
+        """
+        Return the frame a transform should write into.
+        In copy-free mode (copy=False) an inplace transform gets self.df itself,
+        otherwise a full copy is made so self.df stays untouched.
+        copy=None => use the mode chosen in the constructor.
+        """
+        if copy is None:
+            copy = self.copy
+        if inplace and not copy:
+            return self.df
+        return self._copy_frame(self.df)
+
+    def _copy_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Full copy of df, counted in self._frame_copies."""
+        self._frame_copies = getattr(self, "_frame_copies", 0) + 1
+        return df.copy()
+
+    def _set_column(self, df: pd.DataFrame, column, values):
+        """
+        Assign values to df[column].
+        In copy-free mode (df is self.df) a same-dtype result is written into the
+        existing buffer, so the frame's storage is never split or duplicated.
+        Callers should not keep other Series of df alive across this call.
+        """
+        if (
+            df is self.df
+            and df.columns.is_unique
+            and isinstance(getattr(values, "dtype", None), np.dtype)
+            and values.dtype == df[column].dtype
+        ):
+            arr = np.asarray(values)
+            if np.may_share_memory(arr, df[column].to_numpy()):
+                return  # transform left the column unchanged
+            df.iloc[:, df.columns.get_loc(column)] = arr
+            return
+        df[column] = values
+
+    def _resolve_n_jobs(self, n_jobs: int = None) -> int:
+        """Turn n_jobs (None => constructor default, -1 => all cores) into a worker count."""
+        n = getattr(self, "n_jobs", 1) if n_jobs is None else n_jobs
+        if not n:
+            return 1
+        if n < 0:
+            return max(1, (os.cpu_count() or 1) + 1 + n)
+        return int(n)
+
+    def _map_columns(self, df: pd.DataFrame, func, columns, n_jobs: int = None):
+        """
+        Yield (column, func(column)) in column order; write each result before
+        asking for the next one. A None result means "leave the column as is"
+        (also returned when func hands back the column unchanged).
+
+        n_jobs > 1 runs func on a thread pool, n_jobs columns at a time:
+        workers read df's buffers directly (nothing is pickled), pandas/numpy
+        kernels release the GIL, and a window is only read after the previous
+        one has been written back.
+        """
+        def run(c):
+            values = func(c)
+            if (
+                values is not None
+                and isinstance(getattr(values, "dtype", None), np.dtype)
+                and isinstance(df[c].dtype, np.dtype)
+                and np.may_share_memory(np.asarray(values), df[c].to_numpy())
+            ):
+                return None
+            return values
+
+        columns = list(columns)
+        n_jobs = self._resolve_n_jobs(n_jobs)
+        if n_jobs == 1 or len(columns) < 2:
+            for c in columns:
+                yield c, run(c)
+            return
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            for start in range(0, len(columns), n_jobs):
+                window = columns[start:start + n_jobs]
+                results = list(pool.map(run, window))
+                for c in window:
+                    yield c, results.pop(0)
+
+    def _apply(self, new_df: pd.DataFrame, inplace: bool, changed=None):
+        """
+        Apply changes according to inplace behavior.
+        changed: columns the transform modified (None => anything may have changed);
+        cached statistics are dropped for those columns only.
+        """
         if inplace:
+            if changed is None:
+                self.clearStatsCache()
+            else:
+                self.clearStatsCache(changed)
+                self._stats_frame = new_df
+            if self.df is self._sampled_frame and len(new_df) == len(self.df):
+                self._sampled_frame = new_df  # same rows => still the same sample
             self.df = new_df
             return self.df
         return new_df
+
+    # ==========================================================
+    """SECTION: Column Statistics Cache"""
+    # ==========================================================
+    def clearStatsCache(self, columns=None):
+        """
+        Forget cached statistics (all, or only those involving the given columns).
+        Needed after modifying dt.df directly instead of through DataTools.
+        """
+        if columns is None or not hasattr(self, "_stats"):
+            self._stats = OrderedDict()
+            self._stats_bytes = 0
+            self._stats_lock = threading.Lock()
+            self._stats_frame = getattr(self, "df", None)
+            return
+        cols = set(self._ensure_list(columns))
+        with self._stats_lock:
+            for key in [k for k in self._stats if cols.intersection(k[0])]:
+                self._stats_bytes -= self._stats.pop(key)[1]
+
+    @staticmethod
+    def _stat_size(value) -> int:
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            return int(np.sum(value.memory_usage(deep=False))) + 64
+        if isinstance(value, (tuple, list)):
+            # e.g. (codes, uniques) of group modes: count the arrays, not just the container
+            return sys.getsizeof(value) + sum(BaseTools._stat_size(v) for v in value)
+        nbytes = getattr(value, "nbytes", None)
+        return int(nbytes) + 64 if nbytes is not None else sys.getsizeof(value)
+
+    def _stat(self, columns, stat, compute):
+        """
+        Cached statistic of self.df.
+        columns: column name or tuple of names the statistic depends on
+        stat:    hashable statistic id, e.g. "mean" or ("quantile", 0.25, 0.75)
+        compute: zero-argument function computing it from self.df
+        """
+        limit = float(getattr(self, "stats_cache_mb", 0) or 0) * 1024 ** 2
+        if limit <= 0:
+            return compute()
+        if self.df is not self._stats_frame:  # dt.df was replaced from outside
+            self.clearStatsCache()
+
+        key = ((columns,) if isinstance(columns, str) else tuple(columns), stat)
+        with self._stats_lock:
+            hit = self._stats.get(key)
+            if hit is not None:
+                self._stats.move_to_end(key)
+                return hit[0]
+
+        value = compute()
+        size = self._stat_size(value)
+        if size > limit:
+            return value
+        with self._stats_lock:
+            if key not in self._stats:
+                self._stats[key] = (value, size)
+                self._stats_bytes += size
+            while self._stats_bytes > limit and self._stats:
+                self._stats_bytes -= self._stats.popitem(last=False)[1][1]
+        return value
+
+    def _approx_quantiles(self, column, qs, approx):
+        """Sketch-based quantiles of one column (approx=True or a rank error), cached per error bound."""
+        rank_error = resolve_rank_error(approx)
+        qs = tuple(float(q) for q in qs)
+        return self._stat(
+            column, ("quantiles_approx", qs, rank_error),
+            lambda: tuple(approx_quantile(self.df[column], list(qs), rank_error=rank_error))
+        )
+
+    def _peek_stat(self, columns, stat):
+        """Cached value of a statistic, or None when it is not cached (never computes)."""
+        if float(getattr(self, "stats_cache_mb", 0) or 0) <= 0 or self.df is not self._stats_frame:
+            return None
+        key = ((columns,) if isinstance(columns, str) else tuple(columns), stat)
+        with self._stats_lock:
+            hit = self._stats.get(key)
+        return None if hit is None else hit[0]
+
+    def _column_stats(self, columns, stat, compute):
+        """
+        Per-column cached statistic for many columns at once, as a Series.
+        compute(sub_df) => Series indexed by column; only uncached columns are computed.
+        """
+        cols = list(columns)
+        cached = {}
+        if float(getattr(self, "stats_cache_mb", 0) or 0) > 0:
+            if self.df is not self._stats_frame:
+                self.clearStatsCache()
+            with self._stats_lock:
+                for c in cols:
+                    hit = self._stats.get(((c,), stat))
+                    if hit is not None:
+                        cached[c] = hit[0]
+        todo = [c for c in cols if c not in cached]
+        if todo:
+            computed = compute(self.df[todo])
+            for c in todo:
+                cached[c] = self._stat(c, stat, lambda v=computed[c]: v)
+        return pd.Series([cached[c] for c in cols], index=pd.Index(cols), dtype=object).infer_objects()
+
+    # ==========================================================
+    """SECTION: Null Bitmaps"""
+    # ==========================================================
+    def _null_bits(self, column) -> np.ndarray:
+        """Packed null mask of a column (one bit per row, np.packbits layout), cached."""
+        return self._stat(column, "null_bits", lambda: np.packbits(self.df[column].isna().to_numpy()))
+
+    def _null_counts(self, columns) -> pd.Series:
+        """Null count per column: popcount of its bitmap (cached as "null_count")."""
+        return self._column_stats(
+            columns, "null_count",
+            lambda d: pd.Series({c: _popcount(self._null_bits(c)) for c in d.columns}, dtype="int64")
+        )
+
+    def _seed_null_bits(self, bits: dict, keep: np.ndarray):
+        """After a row filter (self.df = old rows[keep]): carry bitmaps over instead of rescanning."""
+        for c, b in bits.items():
+            if c in self.df.columns:
+                self._stat(c, "null_bits", lambda b=b: np.packbits(np.unpackbits(b, count=len(keep))[keep]))
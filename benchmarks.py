@@ -0,0 +1,395 @@
+import argparse
+import gc
+import importlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from DataSetGenerator import DataSetGenerator
+from DataUtil import DataTools
+from preprocessing import Preprocessor
+from row_index import RowHashIndex
+
+
+"""
+Benchmark suite
+---------------
+Times the public DataTools methods on the DataSetGenerator datasets at
+several sizes, records throughput (rows/s) and peak memory, and compares
+the results with a stored baseline. Every public DataTools method needs a
+case (or a place in NOT_TIMED); run_benchmarks() refuses to run otherwise.
+
+    python benchmarks.py --sizes 10000 100000 --save-baseline bench_baseline.json
+    python benchmarks.py --sizes 10000 100000 --baseline bench_baseline.json --threshold 0.25
+
+From Python:
+    results = run_benchmarks(sizes=(10_000,), datasets=["sales"])
+    report = compare_to_baseline(results, "bench_baseline.json")
+"""
+
+
+DATASETS = {
+    "general": DataSetGenerator.generate_test_dataset,
+    "churn": DataSetGenerator.customer_churn_dataset,
+    "reviews": DataSetGenerator.fake_reviews_dataset,
+    "sales": DataSetGenerator.sales_orders_dataset,
+    "edge": DataSetGenerator.edge_cases_dataset,
+}
+
+# (case name, method, args, kwargs) per dataset; case names are unique per dataset
+CASES = {
+    "general": [
+        ("insights", "insights", (), {}),
+        ("head", "head", (), {}),
+        ("tail", "tail", (), {}),
+        ("overview", "overview", (), {}),
+        ("missingReport", "missingReport", (), {}),
+        ("naCount", "naCount", (), {}),
+        ("missingColumns", "missingColumns", (), {"threshold": 0.05}),
+        ("missingRows", "missingRows", (), {"threshold": 0.1}),
+        ("dropMissingValues", "dropMissingValues", (), {}),
+        ("fillMissingValues:median", "fillMissingValues", ("median",), {"columns": ["age", "salary", "rating"]}),
+        ("fillMissingValues:mode", "fillMissingValues", ("mode",), {"columns": ["city", "review_text"]}),
+        ("fillMissingGroupBy:median", "fillMissingGroupBy", ("department", "salary"), {}),
+        ("fillMissingGroupBy:mode", "fillMissingGroupBy", ("city", "rating"), {"strategy": "mode"}),
+        ("dropDuplicates", "dropDuplicates", (), {}),
+        ("outlier_mask_iqr", "outlier_mask_iqr", (), {}),
+        ("detect_outliers_iqr", "detect_outliers_iqr", (), {}),
+        ("clip_outliers_iqr", "clip_outliers_iqr", (), {}),
+        ("outlier_mask_zscore", "outlier_mask_zscore", (), {}),
+        ("detect_outliers_zscore", "detect_outliers_zscore", (), {}),
+        ("clip_outliers_zscore", "clip_outliers_zscore", (), {}),
+        ("oneHotEncode", "oneHotEncode", (["department", "city"],), {}),
+        ("labelEncode", "labelEncode", ("city",), {}),
+        ("scale:standard", "scale", (), {}),
+        ("scale:minmax", "scale", ("minmax",), {}),
+        ("combineFeatures", "combineFeatures", ("score", "rating * age"), {}),
+        ("cleanText", "cleanText", (["name", "review_text"],), {"remove_punct": True}),
+        ("to_float", "to_float", ("age",), {}),
+        ("to_string", "to_string", ("name",), {}),
+        ("to_bool", "to_bool", ("rating",), {}),
+        ("to_datetime", "to_datetime", ("join_date",), {}),
+        ("to_category", "to_category", ("department",), {}),
+        ("importData", "importData", (), {}),
+        ("importData:sample", "importData", (), {"sample": 0.1, "seed": 0}),
+        ("iterData", "iterData", ("data.parquet",), {"chunksize": 20_000}),
+        ("exportData:csv", "exportData", ("out.csv",), {}),
+        ("exportData:parquet", "exportData", ("out.parquet",), {}),
+        ("exportData:npy", "exportData", ("out.npy",), {}),
+        ("readSQL", "readSQL", ("SELECT * FROM bench", "bench.db"), {}),
+        ("readSQL:partitioned", "readSQL", ("SELECT * FROM bench", "bench.db"),
+         {"partition_column": "age", "partitions": 4}),
+        ("writeSQL", "writeSQL", ("bench_out", "bench.db"), {"if_exists": "replace"}),
+        ("insights:approx", "insights", (), {"approx": True}),
+        ("insights:sample", "insights", (), {"sample": 0.1, "seed": 0}),
+        ("overview:approx", "overview", (), {"approx": True}),
+        ("overview:sample", "overview", (), {"sample": 0.1, "seed": 0}),
+        ("missingReport:sample", "missingReport", (), {"sample": 0.1, "seed": 0}),
+        ("missingMask", "missingMask", (["age", "salary"],), {}),
+        ("missingPatterns", "missingPatterns", (), {}),
+        ("fillMissingValues:median_approx", "fillMissingValues", ("median",),
+         {"columns": ["age", "salary", "rating"], "approx": True}),
+        ("fillMissingValues:knn", "fillMissingValues", ("knn",), {"columns": ["age", "salary", "rating"]}),
+        ("fillMissingValues:interpolate", "fillMissingValues", ("interpolate",),
+         {"columns": ["age", "salary", "rating"], "time_col": "join_date"}),
+        ("fillMissingValues:ffill", "fillMissingValues", ("ffill",), {"time_col": "join_date"}),
+        ("fillMissingGroupBy:multi", "fillMissingGroupBy", (["department", "city"], ["salary", "age"]), {}),
+        ("clip_outliers_iqr:approx", "clip_outliers_iqr", (), {"approx": True}),
+        ("optimizeMemory", "optimizeMemory", (), {}),
+        ("dropSeenRows", "dropSeenRows", (), {}),
+        ("applyPreprocessor", "applyPreprocessor", (), {}),
+        ("lazy", "lazy", (), {}),
+    ],
+    "churn": [
+        ("overview", "overview", (), {}),
+        ("fillMissingValues:mean", "fillMissingValues", ("mean",), {"columns": ["age", "tenure_months", "total_charges"]}),
+        ("fillMissingGroupBy:mean", "fillMissingGroupBy", ("contract_type", "monthly_charges"), {"strategy": "mean"}),
+        ("clip_outliers_iqr", "clip_outliers_iqr", (), {}),
+        ("oneHotEncode", "oneHotEncode", (["gender", "contract_type", "payment_method"],), {}),
+        ("labelEncode", "labelEncode", ("customer_id",), {}),
+        ("to_int", "to_int", ("churn",), {}),
+        ("cleanText", "cleanText", ("notes",), {"remove_punct": True}),
+        ("dropDuplicates", "dropDuplicates", (), {}),
+    ],
+    "reviews": [
+        ("overview", "overview", (), {}),
+        ("missingReport", "missingReport", (), {}),
+        ("fillMissingGroupBy:mode", "fillMissingGroupBy", ("user_id", "rating"), {"strategy": "mode"}),
+        ("fillMissingGroupBy:median", "fillMissingGroupBy", ("product_id", "avg_product_rating"), {}),
+        ("cleanText", "cleanText", ("review_text",), {"remove_punct": True}),
+        ("labelEncode", "labelEncode", ("product_id",), {}),
+        ("dropDuplicates", "dropDuplicates", (), {}),
+        ("dropDuplicates:subset", "dropDuplicates", (["user_id", "product_id"],), {}),
+        ("nearDuplicateClusters", "nearDuplicateClusters", ("review_text",), {}),
+        ("dropNearDuplicates", "dropNearDuplicates", ("review_text",), {}),
+        ("clip_outliers_iqr", "clip_outliers_iqr", (["num_reviews_by_user", "num_reviews_for_product"],), {}),
+    ],
+    "sales": [
+        ("insights", "insights", (), {}),
+        ("fillMissingValues:median", "fillMissingValues", ("median",), {"columns": ["quantity", "unit_price", "shipping_cost"]}),
+        ("clip_outliers_iqr", "clip_outliers_iqr", (), {}),
+        ("clip_outliers_zscore", "clip_outliers_zscore", (), {}),
+        ("scale:standard", "scale", (), {}),
+        ("combineFeatures", "combineFeatures", ("gross", "quantity * unit_price"), {}),
+        ("oneHotEncode", "oneHotEncode", (["region", "channel", "category"],), {}),
+        ("to_category", "to_category", ("region",), {}),
+    ],
+    "edge": [
+        ("overview", "overview", (), {}),
+        ("missingColumns", "missingColumns", (), {"threshold": 0.5}),
+        ("fillMissingValues:mode", "fillMissingValues", ("mode",), {}),
+        ("scale:standard", "scale", (), {}),
+        ("cleanText", "cleanText", ("text_col",), {"remove_punct": True}),
+        ("to_string", "to_string", ("mixed_col",), {}),
+        ("labelEncode", "labelEncode", ("str_numbers",), {}),
+    ],
+}
+
+
+# Bookkeeping methods that do no data work; every other public method needs a case.
+NOT_TIMED = {"clearProfile", "clearStatsCache", "disableProfiling", "enableProfiling", "profileReport"}
+
+# cases that need an optional package (skipped, with NaN timings, when it is missing)
+REQUIRES = {"fillMissingValues:knn": "scipy"}
+
+
+def untimed_methods() -> list:
+    """Public DataTools methods without a benchmark case in any dataset."""
+    covered = {method for cases in CASES.values() for _, method, _, _ in cases}
+    public = [name for name, _ in inspect.getmembers(DataTools, inspect.isfunction) if not name.startswith("_")]
+    return [name for name in public if name not in covered and name not in NOT_TIMED]
+
+
+def _make_dataset(name: str, n_rows: int) -> pd.DataFrame:
+    return DATASETS[name](n_rows=n_rows, random_state=42)
+
+
+def _lazy_plan(dt):
+    num = list(dt.df.select_dtypes(include="number").columns)
+    return dt.lazy().fillMissingValues("median", columns=num).clip_outliers_iqr(num).scale(columns=num).collect()
+
+
+def _prepare(df: pd.DataFrame, method: str, args, kwargs, workdir: str):
+    """
+    Untimed setup of one case (input files, indexes, fitted objects).
+    Returns (args, kwargs, call) where call(dt, args, kwargs) is the timed work.
+    """
+    def call(dt, a, kw):
+        return getattr(dt, method)(*a, **kw)
+
+    if method == "importData":
+        args = (df,)
+    elif method == "exportData":
+        args = (os.path.join(workdir, args[0]),)
+    elif method == "iterData":
+        path = os.path.join(workdir, args[0])
+        if not os.path.exists(path):
+            df.to_parquet(path, index=False)
+        args = (path,)
+
+        def call(dt, a, kw):
+            return sum(len(chunk.df) for chunk in dt.iterData(*a, **kw))
+    elif method in ("readSQL", "writeSQL"):
+        url = "sqlite:///" + os.path.join(workdir, args[1])
+        if method == "readSQL" and not os.path.exists(url[len("sqlite:///"):]):
+            DataTools(df, copy=False).writeSQL("bench", url, if_exists="replace")
+        args = (args[0], url)
+    elif method == "dropSeenRows":
+        index = RowHashIndex().add(df.iloc[::2])  # every other row seen in an earlier load
+
+        def call(dt, a, kw):
+            return dt.dropSeenRows(index.copy(), **kw)
+    elif method == "applyPreprocessor":
+        num = list(df.select_dtypes(include="number").columns)
+        pre = Preprocessor().fillMissingValues("median", columns=num).scale(columns=num).fit(df)
+        args = (pre,)
+    elif method == "lazy":
+        def call(dt, a, kw):
+            return _lazy_plan(dt)
+    return args, kwargs, call
+
+
+def _run_case(df: pd.DataFrame, method: str, args, kwargs, track_memory: bool, workdir: str = None):
+    """Run one case on a fresh DataTools; return (wall seconds, peak MB or NaN)."""
+    args, kwargs, call = _prepare(df, method, args, kwargs, workdir)
+    dt = DataTools(df)
+    gc.collect()
+
+    start = time.perf_counter()
+    call(dt, args, kwargs)
+    wall = time.perf_counter() - start
+
+    peak = float("nan")
+    if track_memory:
+        dt = DataTools(df)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            call(dt, args, kwargs)
+            peak = tracemalloc.get_traced_memory()[1] / (1024 ** 2)
+        finally:
+            tracemalloc.stop()
+    return wall, peak
+
+
+def _available(case: str) -> bool:
+    module = REQUIRES.get(case)
+    if module is None:
+        return True
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        return False
+    return True
+
+
+def run_benchmarks(
+    sizes=(10_000, 100_000, 1_000_000, 10_000_000),
+    *,
+    datasets=None,
+    methods=None,
+    repeat: int = 1,
+    track_memory: bool = True,
+    verbose: bool = False
+) -> pd.DataFrame:
+    """
+    Time every benchmark case.
+
+    sizes:       n_rows passed to the DataSetGenerator functions
+    datasets:    subset of DATASETS keys (None => all)
+    methods:     subset of DataTools method names (None => all)
+    repeat:      runs per case; the fastest wall time is kept
+    track_memory: extra run per case under tracemalloc for peak memory (MB)
+
+    Returns one row per (dataset, rows, case) with wall_s, rows_per_s and peak_mem_MB.
+    Raises when a public DataTools method has no case (see untimed_methods()).
+    """
+    missing = untimed_methods()
+    if missing:
+        raise RuntimeError(f"Public DataTools method(s) without a benchmark case: {missing}. Add them to CASES.")
+    datasets = list(DATASETS) if datasets is None else list(datasets)
+    unknown = [d for d in datasets if d not in DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown dataset(s) {unknown}. Available: {list(DATASETS)}")
+
+    rows = []
+    workdir = tempfile.mkdtemp(prefix="datatools_bench_")
+    try:
+        for name in datasets:
+            for n_rows in sizes:
+                rows += _run_dataset(name, int(n_rows), methods, repeat, track_memory, verbose, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return pd.DataFrame(rows)
+
+
+def _run_dataset(name, n_rows, methods, repeat, track_memory, verbose, workdir) -> list:
+    rows = []
+    df = _make_dataset(name, n_rows)
+    for case, method, args, kwargs in CASES[name]:
+        if methods is not None and method not in methods:
+            continue
+        if not _available(case):
+            wall, peak = float("nan"), float("nan")
+        else:
+            walls, peak = [], float("nan")
+            for i in range(max(1, repeat)):
+                wall, mem = _run_case(df, method, args, kwargs, track_memory and i == 0, workdir)
+                walls.append(wall)
+                if i == 0:
+                    peak = mem
+            wall = min(walls)
+        rows.append({
+            "dataset": name,
+            "rows": len(df),
+            "case": case,
+            "method": method,
+            "wall_s": wall,
+            "rows_per_s": len(df) / wall if wall > 0 else float("inf"),
+            "peak_mem_MB": peak,
+        })
+        if verbose:
+            print(f"{name:8s} {len(df):>10,d}  {case:32s} {wall:9.4f}s  {peak:9.1f} MB")
+    # input files of this dataset / size are rebuilt for the next one
+    for f in os.listdir(workdir):
+        os.remove(os.path.join(workdir, f))
+    return rows
+
+
+# ==========================================================
+"""SECTION: Baseline"""
+# ==========================================================
+_KEY = ["dataset", "rows", "case"]
+
+
+def save_baseline(results: pd.DataFrame, path: str):
+    """Store results as the baseline (JSON records)."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results.to_dict(orient="records"), f, indent=1)
+
+
+def load_baseline(path: str) -> pd.DataFrame:
+    with open(path, encoding="utf-8") as f:
+        return pd.DataFrame(json.load(f))
+
+
+def compare_to_baseline(results: pd.DataFrame, baseline, *, threshold: float = 0.2) -> pd.DataFrame:
+    """
+    Compare results with a baseline (path or DataFrame).
+
+    threshold:
+        allowed relative slowdown / memory growth (0.2 => 20%)
+
+    Returns one row per matching case with time_ratio, mem_ratio and a
+    'regression' flag, worst time ratio first.
+    """
+    base = load_baseline(baseline) if isinstance(baseline, str) else baseline
+    merged = results.merge(base[_KEY + ["wall_s", "peak_mem_MB"]], on=_KEY, suffixes=("", "_base"))
+    merged["time_ratio"] = merged["wall_s"] / merged["wall_s_base"]
+    merged["mem_ratio"] = merged["peak_mem_MB"] / merged["peak_mem_MB_base"]
+    merged["regression"] = (merged["time_ratio"] > 1 + threshold) | (merged["mem_ratio"] > 1 + threshold)
+    return merged.sort_values("time_ratio", ascending=False).reset_index(drop=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="DataTools benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--datasets", nargs="+", default=None, choices=list(DATASETS))
+    parser.add_argument("--methods", nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    parser.add_argument("--baseline", help="compare against this baseline JSON")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--save-baseline", help="write results to this baseline JSON")
+    parser.add_argument("--output", help="write results to this CSV")
+    opts = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        opts.sizes, datasets=opts.datasets, methods=opts.methods,
+        repeat=opts.repeat, track_memory=not opts.no_memory, verbose=True
+    )
+    if opts.output:
+        results.to_csv(opts.output, index=False)
+    if opts.save_baseline:
+        save_baseline(results, opts.save_baseline)
+        print(f"Baseline saved to: {opts.save_baseline}")
+
+    if opts.baseline:
+        report = compare_to_baseline(results, opts.baseline, threshold=opts.threshold)
+        regressions = report[report["regression"]]
+        print(f"\n{len(report)} cases compared, {len(regressions)} regression(s) over {opts.threshold:.0%}")
+        if len(regressions):
+            print(regressions[_KEY + ["wall_s", "wall_s_base", "time_ratio", "mem_ratio"]].to_string(index=False))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import os
+
+from io_tools import BatchWriter, _detect_source_type, _iter_chunks
+from preprocessing import Preprocessor
+from row_index import RowHashIndex
+
+
+"""
+Out-of-core execution
+---------------------
+ChunkedDataTools records DataTools transforms against a file (CSV, JSON Lines,
+Parquet, Feather/Arrow IPC, ORC) that is too large for memory, then streams
+it in fixed-size chunks:
+
+    pass 1..n: reduce statistics chunk by chunk (one pass per group of
+               independent steps; a single transform needs one pass)
+    last pass: apply the statistics chunk by chunk and write the output
+
+    cdt = ChunkedDataTools("export.csv", chunksize=250_000)
+    cdt.fillMissingValues("median", columns=["age", "salary"])
+    cdt.clip_outliers_iqr(columns=["salary"]).cleanText("review_text")
+    cdt.run("clean.parquet")
+
+dropDuplicates() removes repeated source rows across the whole file (and,
+with a RowHashIndex, rows seen in earlier loads) before the transforms.
+"""
+
+
+# file types that can be read chunk by chunk
+_CHUNKED_TYPES = ("csv", "json", "parquet", "feather", "arrow", "orc")
+
+
+class ChunkedDataTools:
+    """
+    Chunked (out-of-core) backend for the statistic-based DataTools transforms.
+
+    Supported: fillMissingValues, fillMissingGroupBy, dropMissingValues, scale,
+    clip_outliers_iqr, clip_outliers_zscore, labelEncode, oneHotEncode, cleanText,
+    dropDuplicates.
+    Each call is recorded (and returns self for chaining); nothing is read until
+    fit() / run() / iterTransformed().
+    """
+    _RECORDABLE = (
+        "fillMissingValues", "fillMissingGroupBy", "dropMissingValues",
+        "scale", "clip_outliers_iqr", "clip_outliers_zscore",
+        "labelEncode", "oneHotEncode", "cleanText",
+    )
+
+    def __init__(self, source: str, *, chunksize: int = 100_000, source_type: str = None, **read_kwargs):
+        if not isinstance(source, str):
+            raise TypeError("source must be a file path.")
+        if not os.path.exists(source):
+            raise ValueError(f"Source file not found: {source}")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer.")
+        self.source = source
+        self.source_type = _detect_source_type(source) if source_type is None else source_type.lower()
+        if self.source_type not in _CHUNKED_TYPES:
+            raise ValueError(f"Unsupported chunked source_type: {self.source_type}. Supported: {list(_CHUNKED_TYPES)}")
+        self.chunksize = int(chunksize)
+        self.read_kwargs = read_kwargs
+        self.preprocessor = Preprocessor()
+        self._dedupe = None
+
+    def __getattr__(self, name):
+        if name in ChunkedDataTools._RECORDABLE:
+            def record(*args, **kwargs):
+                getattr(self.preprocessor, name)(*args, **kwargs)
+                return self
+            return record
+        raise AttributeError(
+            f"'{name}' is not available in chunked mode. Supported: {list(ChunkedDataTools._RECORDABLE)}"
+        )
+
+    def dropDuplicates(self, columns=None, *, index: RowHashIndex = None):
+        """
+        Drop repeated source rows across the whole file, before the recorded transforms.
+
+        columns:
+            rows are compared on these columns (None => all)
+        index:
+            RowHashIndex of earlier loads: rows recorded there are dropped too, and the
+            rows written by run() / iterTransformed() are added to it (statistics
+            passes work on a copy, so the index only changes once)
+        """
+        if index is not None:
+            if not isinstance(index, RowHashIndex):
+                raise TypeError("index must be a RowHashIndex.")
+            if columns is not None and index.columns is not None and list(index.columns) != list(
+                    [columns] if isinstance(columns, str) else columns):
+                raise ValueError(f"The index identifies rows by {index.columns}, not {columns}.")
+        self._dedupe = {"columns": columns, "index": index}
+        return self
+
+    def iterChunks(self):
+        """Yield raw source chunks (one new reader per call)."""
+        return _iter_chunks(self.source, self.source_type, self.chunksize, **self.read_kwargs)
+
+    def _source_chunks(self, record: bool = False):
+        """Source chunks, without duplicate rows when dropDuplicates() was called."""
+        if self._dedupe is None:
+            return self.iterChunks()
+        index = self._dedupe["index"]
+        if index is None:
+            index = RowHashIndex(self._dedupe["columns"])
+        elif not record:
+            index = index.copy()
+        return self._deduped(index)
+
+    def _deduped(self, index: RowHashIndex):
+        for chunk in self.iterChunks():
+            seen = index.update(chunk)
+            yield chunk[~seen] if seen.any() else chunk
+
+    def fit(self):
+        """Statistics passes over the source. Returns the fitted Preprocessor."""
+        return self.preprocessor.fit_chunks(self._source_chunks)
+
+    def iterTransformed(self):
+        """Yield transformed chunks (fits first if needed)."""
+        has_steps = bool(self.preprocessor.steps)
+        if has_steps and not self.preprocessor.is_fitted:
+            self.fit()
+        for chunk in self._source_chunks(record=True):
+            yield self.preprocessor.transform(chunk, copy=False) if has_steps else chunk
+
+    def run(self, dest: str, *, dest_type: str = None, **write_kwargs) -> int:
+        """
+        Fit (if needed), then transform chunk by chunk and write to dest
+        (CSV / Parquet / Feather / SQL table, see BatchWriter). Returns rows written.
+        """
+        with BatchWriter(dest, dest_type, **write_kwargs) as writer:
+            for chunk in self.iterTransformed():
+                writer.write(chunk)
+        return writer.rows
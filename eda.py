@@ -1,13 +1,77 @@
+import numpy as np
 import pandas as pd
 
+from sampling import mean_ci, proportion_ci, sample_frame
+from sketches import HyperLogLog, hash_values, resolve_rank_error
+
+# odd 64-bit multiplier used to fold column hashes into one hash per row
+_ROW_HASH_PRIME = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads small integer codes over all 64 bits."""
+    with np.errstate(over="ignore"):
+        x = x ^ (x >> np.uint64(30))
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(31)
+    return x
+
+
+def _describe_table(rows: dict) -> pd.DataFrame:
+    """describe(include="all").transpose() layout from {column: Series of statistics}."""
+    # same statistic order as describe(): shortest statistic lists first, first appearance wins
+    order = []
+    for names in sorted((stats.index for stats in rows.values()), key=len):
+        order += [name for name in names if name not in order]
+    return pd.DataFrame(rows, index=order, dtype=object).transpose()
+
 
 class EDATools:
     # ==========================================================
     """SECTION: Inspection / Quick EDA"""
     # ==========================================================
-    def insights(self):
-        """Return describe() summary (numeric + categorical)."""
-        return self.df.describe(include="all").transpose()
+    def insights(self, *, approx=False, sample=None, stratify: str = None, seed: int = None,
+                 confidence: float = 0.95):
+        """
+        Return describe() summary (numeric + categorical).
+        approx=True => numeric percentiles from a QuantileSketch (0.1% rank error;
+        a float sets the error); everything else stays exact.
+
+        sample:
+            describe a random sample instead (fraction or row count; stratify= keeps
+            each value of that column at its share) and add confidence intervals:
+            mean_low / mean_high for numeric means, top_% / top_%_low / top_%_high
+            for the share of the most frequent value
+        """
+        sampled = self._sampled(sample, stratify, seed)
+        if sampled is not None:
+            sub, population = sampled
+            return self._sample_describe(sub, population, approx, confidence)
+        if not approx:
+            return self._stat(self.df.columns, "describe", lambda: self.df.describe(include="all").transpose()).copy()
+        return self._stat(
+            self.df.columns, ("describe_approx", resolve_rank_error(approx)), lambda: self._approx_describe(approx)
+        ).copy()
+
+    def _approx_describe(self, approx):
+        """describe(include="all").transpose() layout with sketched numeric percentiles."""
+        df = self.df
+        numeric = set(df.select_dtypes(include="number").columns)
+        rows = {}
+        for c in df.columns:
+            s = df[c]
+            if c in numeric:
+                q1, q2, q3 = self._approx_quantiles(c, (0.25, 0.5, 0.75), approx)
+                stats = pd.Series({
+                    "count": float(s.count()), "mean": s.mean(), "std": s.std(), "min": s.min(),
+                    "25%": q1, "50%": q2, "75%": q3, "max": s.max(),
+                }, dtype=object)
+            else:
+                stats = s.describe()
+            rows[c] = stats
+        return _describe_table(rows)
 
     def head(self, n: int = 5):
         """Return first n rows."""
@@ -17,31 +81,209 @@ class EDATools:
         """Return last n rows."""
         return self.df.tail(n)
 
-    def overview(self):
+    def overview(self, *, approx: bool = False, n_jobs: int = None, sample=None, stratify: str = None,
+                 seed: int = None, confidence: float = 0.95):
         """
         Quick overview: shape, dtypes, missing %, duplicates, memory.
+        One fused pass per column (null mask, value hashes, memory); the
+        duplicate-row count reuses the column hashes.
+
+        approx=True:
+            distinct numeric/date values and duplicate rows estimated with
+            HyperLogLog instead of exact hash tables: constant memory per
+            column, faster on high-cardinality columns. Distinct counts are
+            within ~1%; the duplicate count is off by up to ~0.5% of the rows.
+
+        sample:
+            profile a random sample (fraction or row count, stratify= column):
+            missing counts and memory are scaled up to the full frame, missing %
+            gets missing_%_low / missing_%_high, and distinct values and duplicate
+            rows are reported as seen in the sample (unique_in_sample,
+            duplicates_in_sample).
+
         Returns:
             summary (dict), info_table (DataFrame)
         """
+        sampled = self._sampled(sample, stratify, seed)
+        if sampled is not None:
+            sub, population = sampled
+            summary, table = self._sample_tool(sub).overview(approx=approx, n_jobs=n_jobs)
+            table = self._missing_estimates(table, len(sub), population, confidence)
+            table = table.rename(columns={"unique": "unique_in_sample"})
+            scale = population / max(len(sub), 1)
+            return {
+                "rows": int(population),
+                "cols": summary["cols"],
+                "sample_rows": len(sub),
+                "confidence": confidence,
+                "duplicates_in_sample": summary["duplicates"],
+                "memory_MB": summary["memory_MB"] * scale,
+            }, table
+
+        profile = self._fused_profile(approx=approx, n_jobs=n_jobs)
+        missing = profile["missing_count"]
         info_table = pd.DataFrame({
             "dtype": self.df.dtypes.astype(str),
-            "missing_count": self.df.isna().sum(),
-            "missing_%": (self.df.isna().mean() * 100).round(2),
-            "unique": self.df.nunique(dropna=True)
+            "missing_count": missing,
+            "missing_%": (missing / len(self.df) * 100).round(2),
+            "unique": profile["unique"]
         }).sort_values("missing_%", ascending=False)
 
         summary = {
             "rows": int(self.df.shape[0]),
             "cols": int(self.df.shape[1]),
-            "duplicates": int(self.df.duplicated().sum()),
-            "memory_MB": float(self.df.memory_usage(deep=True).sum() / (1024 ** 2))
+            "duplicates": int(profile["duplicates"]),
+            "memory_MB": float((profile["memory"].sum() + self.df.index.memory_usage(deep=True)) / (1024 ** 2))
         }
         return summary, info_table
 
-    def missingReport(self):
-        """Return a table of missing values per column."""
+    def _fused_profile(self, *, approx: bool = False, n_jobs: int = None) -> dict:
+        """
+        Null counts, distinct counts, memory per column and the duplicate-row count,
+        from one hash of each column. Results go through the statistics cache, so
+        only columns changed since the last call are scanned again.
+        Equal rows always share a row hash; with approx=False rows whose hash repeats
+        are compared value by value, so the duplicate count is exact.
+        """
+        df = self.df
+        cols = list(df.columns)
+        n = len(df)
+        unique_stat = "nunique_approx" if approx else "nunique"
+        dup_stat = "duplicated_approx" if approx else "duplicated"
+        stats = ("null_count", unique_stat, "memory_deep")
+
+        duplicates = self._peek_stat(cols, dup_stat)
+        if duplicates is None:
+            todo = cols  # every column hash is needed for the row hash
+        else:
+            todo = [c for c in cols if any(self._peek_stat(c, st) is None for st in stats)]
+        todo_set = set(todo)
+        row_hash = np.zeros(n, dtype=np.uint64) if duplicates is None else None
+
+        def profile(c):
+            s = df[c]
+            if s.dtype.kind in "biufcmM":
+                # fixed-width values hash cheaply; HLL keeps memory constant
+                h = hash_values(s)
+                nulls = s.isna().to_numpy()
+                present = h[~nulls] if nulls.any() else h
+                if approx:
+                    unique = int(round(HyperLogLog().update_hashes(present).count()))
+                else:
+                    unique = int(len(pd.unique(present)))
+            else:
+                # text / categories: one factorize gives nulls, distinct count and a row key
+                codes, uniques = pd.factorize(s)
+                nulls = codes < 0
+                unique = len(uniques)
+                # null code -1 wraps to 2**64-1: one fixed key for all nulls that no
+                # real code (0..len(uniques)-1) can take before mixing
+                h = _mix64(codes.astype(np.uint64))
+            self._stat(c, "null_bits", lambda: np.packbits(nulls))  # for later missing-value queries
+            return {
+                "null_count": int(nulls.sum()),
+                unique_stat: unique,
+                "memory_deep": int(s.memory_usage(deep=True, index=False)),
+                "hash": h,
+            }
+
+        values = {st: {c: self._peek_stat(c, st) for c in cols if c not in todo_set} for st in stats}
+        for c, result in self._map_columns(df, profile, todo, n_jobs):
+            for st in stats:
+                values[st][c] = self._stat(c, st, lambda v=result[st]: v)
+            if row_hash is not None:
+                with np.errstate(over="ignore"):
+                    row_hash *= _ROW_HASH_PRIME
+                    row_hash += result["hash"]
+
+        if row_hash is not None:
+            if approx:
+                distinct_rows = min(n, int(round(HyperLogLog(p=16).update_hashes(row_hash).count())))
+                duplicates = self._stat(cols, dup_stat, lambda: n - distinct_rows)
+            else:
+                # only rows sharing a hash can be equal: confirm those exactly
+                candidates = pd.Series(row_hash).duplicated(keep=False).to_numpy()
+                exact = int(df[candidates].duplicated().sum()) if candidates.any() else 0
+                duplicates = self._stat(cols, dup_stat, lambda: exact)
+
+        def column_stat(st):
+            return pd.Series([values[st][c] for c in cols], index=pd.Index(cols), dtype=object)
+
+        return {
+            "missing_count": column_stat("null_count").astype("int64"),
+            "unique": column_stat(unique_stat).astype("int64"),
+            "memory": column_stat("memory_deep").astype("int64"),
+            "duplicates": duplicates,
+        }
+
+    def missingReport(self, *, sample=None, stratify: str = None, seed: int = None, confidence: float = 0.95):
+        """
+        Return a table of missing values per column.
+        sample => estimate from a random sample (fraction or row count, stratify= column),
+        with missing_%_low / missing_%_high at the given confidence.
+        """
+        sampled = self._sampled(sample, stratify, seed)
+        if sampled is not None:
+            sub, population = sampled
+            table = self._sample_tool(sub).missingReport()
+            return self._missing_estimates(table, len(sub), population, confidence)
+        missing = self._null_counts(self.df.columns)
         return pd.DataFrame({
-            "missing_count": self.df.isna().sum(),
-            "missing_%": (self.df.isna().mean() * 100).round(2),
+            "missing_count": missing,
+            "missing_%": (missing / len(self.df) * 100).round(2),
             "dtype": self.df.dtypes.astype(str)
         }).sort_values("missing_%", ascending=False)
+
+    # ==========================================================
+    """SECTION: Sampling (Estimates With Confidence Intervals)"""
+    # ==========================================================
+    def _sampled(self, sample, stratify, seed):
+        """
+        (sampled frame, population rows), or None to profile self.df exactly.
+        A frame loaded with importData(sample=...) is already a sample of
+        self.sample_population rows.
+        """
+        population = getattr(self, "sample_population", None)
+        if sample is None:
+            if stratify is not None:
+                raise ValueError("stratify needs sample= (a fraction or a row count).")
+            return None if population is None else (self.df, population)
+        if stratify is not None:
+            self._require_columns(stratify)
+        sub = sample_frame(self.df, sample, stratify=stratify, seed=seed)
+        return sub, population or len(self.df)
+
+    def _sample_tool(self, sub):
+        return type(self)(sub, copy=False, n_jobs=self.n_jobs, stats_cache_mb=0)
+
+    def _sample_describe(self, sub, population, approx, confidence):
+        table = self._sample_tool(sub).insights(approx=approx)
+        n = len(sub)
+        count = sub.count().astype(float)
+        if "mean" in table.columns:
+            numeric = list(sub.select_dtypes(include="number").columns)
+            mean = pd.Series(np.nan, index=table.index)
+            std = pd.Series(np.nan, index=table.index)
+            mean[numeric] = sub[numeric].mean()
+            std[numeric] = sub[numeric].std()
+            # non-null values in the population, estimated from the sample
+            low, high = mean_ci(mean, std, count, population=population * count / n, confidence=confidence)
+            table["mean_low"], table["mean_high"] = low, high
+        if "freq" in table.columns:
+            freq = pd.to_numeric(table["freq"], errors="coerce")
+            low, high = proportion_ci(freq, count, population=population * count / n, confidence=confidence)
+            table["top_%"] = (freq / count * 100).round(2)
+            table["top_%_low"] = (pd.Series(low, index=table.index) * 100).round(2)
+            table["top_%_high"] = (pd.Series(high, index=table.index) * 100).round(2)
+        return table
+
+    def _missing_estimates(self, table, n, population, confidence):
+        """Scale a sample's missing counts to the population and add missing % intervals."""
+        table = table.copy()
+        counts = table["missing_count"]
+        low, high = proportion_ci(counts, n, population=population, confidence=confidence)
+        table["missing_count"] = (counts * (population / max(n, 1))).round().astype("int64")
+        at = table.columns.get_loc("missing_%") + 1
+        table.insert(at, "missing_%_low", (pd.Series(low, index=table.index) * 100).round(2))
+        table.insert(at + 1, "missing_%_high", (pd.Series(high, index=table.index) * 100).round(2))
+        return table
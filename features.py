@@ -2,7 +2,7 @@ class FeatureTools:
     # ==========================================================
     """SECTION: Feature Combination (Equation-based)"""
     # ==========================================================
-    def combineFeatures(self, new_col: str, expression: str, *, inplace: bool = True):
+    def combineFeatures(self, new_col: str, expression: str, *, inplace: bool = True, copy: bool = None):
         """
         Create a new feature column from an expression using existing columns.
 
@@ -16,7 +16,7 @@ class FeatureTools:
         if not isinstance(expression, str) or not expression.strip():
             raise ValueError("expression must be a non-empty string.")
 
-        new_df = self.df.copy()
+        new_df = self._working_df(inplace, copy)
         try:
             new_df[new_col] = new_df.eval(expression, engine="python")
         except Exception as e:
@@ -24,4 +24,4 @@ class FeatureTools:
                 f"Invalid expression or column names.\nExpression: {expression}\nError: {e}"
             )
 
-        return self._apply(new_df, inplace)
+        return self._apply(new_df, inplace, changed=[new_col])
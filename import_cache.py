@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+
+"""
+Import cache
+------------
+Parsed imports stored as uncompressed Feather (Arrow IPC) files, keyed on the
+source file and the reader options. A repeat import of an unchanged file
+memory-maps the cached copy instead of parsing CSV / Excel / JSON again.
+
+    dt.importData("big.xlsx", sheet_name="2026", cache=True)       # parse + store
+    dt.importData("big.xlsx", sheet_name="2026", cache=True)       # mapped from cache
+
+    cache = ImportCache("/data/.import_cache", max_size_mb=20_000, key="hash")
+    dt.importData("export.csv", cache=cache)
+"""
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "DATATOOLS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "datatools", "imports")
+)
+
+
+class ImportCache:
+    """
+    On-disk LRU cache of parsed imports.
+
+    directory:
+        where cached frames live (default: $DATATOOLS_CACHE_DIR or ~/.cache/datatools/imports)
+    max_size_mb:
+        total size limit; least recently used entries are evicted first
+    key:
+        "stat" => path + size + modification time (no extra read)
+        "hash" => file content hash (survives copies / touch, costs one read of the file)
+    """
+
+    def __init__(self, directory: str = None, *, max_size_mb: float = 4096, key: str = "stat"):
+        if key not in ("stat", "hash"):
+            raise ValueError("key must be 'stat' or 'hash'.")
+        if max_size_mb <= 0:
+            raise ValueError("max_size_mb must be > 0.")
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_size_mb = max_size_mb
+        self.key = key
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __repr__(self):
+        return f"ImportCache({self.directory!r}, entries={len(self._entries())}, size_MB={self.size_mb():.1f})"
+
+    # ==========================================================
+    """SECTION: Keys"""
+    # ==========================================================
+    def _file_fingerprint(self, path: str) -> dict:
+        st = os.stat(path)
+        if self.key == "stat":
+            return {"path": os.path.abspath(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return {"size": st.st_size, "content": digest.hexdigest()}
+
+    def entry_key(self, path: str, source_type: str, options: dict) -> str:
+        """Hex key for a file + reader options (options are compared by their repr)."""
+        payload = {
+            "file": self._file_fingerprint(path),
+            "source_type": source_type,
+            "options": {k: repr(v) for k, v in sorted(options.items())},
+            "pandas": pd.__version__,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.feather")
+
+    # ==========================================================
+    """SECTION: Get / Put"""
+    # ==========================================================
+    def get(self, key: str):
+        """Cached frame or None. Numeric columns are memory-mapped, not copied."""
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        import pyarrow.feather as feather
+        try:
+            table = feather.read_table(path, memory_map=True)
+        except OSError:  # truncated / foreign file
+            self._remove(path)
+            return None
+        os.utime(path)  # recency for LRU eviction
+        return table.to_pandas(split_blocks=True)
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Store a frame; returns False when it cannot be represented in Arrow (nothing cached)."""
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return False  # e.g. object columns mixing numbers and strings
+
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            # uncompressed => can be memory-mapped on read
+            feather.write_feather(table, tmp, compression="uncompressed")
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self.evict()
+        return True
+
+    def load(self, path: str, source_type: str, options: dict, read):
+        """Cached result of read() for this file and options (read() runs on a miss)."""
+        key = self.entry_key(path, source_type, options)
+        df = self.get(key)
+        if df is None:
+            df = read()
+            self.put(key, df)
+        return df
+
+    # ==========================================================
+    """SECTION: Size / Eviction"""
+    # ==========================================================
+    def _entries(self) -> list:
+        """(last use, size, path) of every cached file, oldest first."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".feather"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return sorted(entries)
+
+    def size_mb(self) -> float:
+        return sum(size for _, size, _ in self._entries()) / (1024 ** 2)
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_size_mb."""
+        limit = self.max_size_mb * 1024 ** 2
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in entries:
+                if total <= limit:
+                    break
+                self._remove(path)
+                total -= size
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            for _, _, path in self._entries():
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+_DEFAULT_CACHE = None
+
+
+def resolve_cache(cache):
+    """cache= argument of importData: None/False, True (default cache), a directory, or an ImportCache."""
+    global _DEFAULT_CACHE
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = ImportCache()
+        return _DEFAULT_CACHE
+    if isinstance(cache, str):
+        return ImportCache(cache)
+    if isinstance(cache, ImportCache):
+        return cache
+    raise TypeError("cache must be True/False, a directory path or an ImportCache.")
@@ -0,0 +1,323 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+from eda import _ROW_HASH_PRIME, _describe_table
+from io_tools import _common_dtype
+from sketches import HyperLogLog, QuantileSketch, hash_values
+
+
+"""
+Incremental profiling
+---------------------
+Running per-column statistics for data that arrives in batches. Each batch
+is folded into the totals once; the EDATools tables can be produced at any
+time without scanning earlier batches again.
+
+    profiler = IncrementalProfiler()
+    for batch in micro_batches:
+        profiler.update(batch)
+        summary, info_table = profiler.overview()
+    profiler.missingReport()
+    profiler.insights()
+    profiler.valueCounts("country", top=20)
+"""
+
+
+class _ColumnState:
+    """Running statistics of one column."""
+
+    def __init__(self, nulls: int = 0):
+        self.dtype = None
+        self.nulls = nulls
+        self.memory = 0
+        self.hll = HyperLogLog()
+        # numeric: Welford / Chan running moments
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sketch = None
+        # non-numeric: exact value counts until there are too many values
+        self.counts = None
+        self.overflow = False
+
+
+def _is_numeric(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+class IncrementalProfiler:
+    """
+    Per-column running statistics over batches (DataFrames or DataTools).
+
+    Tracked per column: dtype, null count, memory, distinct count (HyperLogLog,
+    exact for text while counts are kept), Welford mean / variance, min / max,
+    quantile sketch (numeric) and value counts (non-numeric, up to max_categories
+    distinct values). Duplicate rows are estimated from a HyperLogLog of row hashes.
+
+    max_categories:
+        distinct values kept per non-numeric column before its value counts are
+        dropped (its distinct count then comes from the sketch)
+    quantiles:
+        keep a QuantileSketch per numeric column (25% / 50% / 75% in insights())
+
+    Profilers fed with different parts of a stream can be combined with merge().
+    """
+
+    def __init__(self, *, max_categories: int = 10_000, quantiles: bool = True):
+        if max_categories < 1:
+            raise ValueError("max_categories must be >= 1.")
+        self.max_categories = int(max_categories)
+        self.quantiles = quantiles
+        self.rows = 0
+        self.batches = 0
+        self._columns = {}
+        self._row_hll = HyperLogLog(p=16)
+
+    def __repr__(self):
+        return f"IncrementalProfiler(rows={self.rows}, cols={len(self._columns)}, batches={self.batches})"
+
+    # ==========================================================
+    """SECTION: Updates"""
+    # ==========================================================
+    def update(self, batch):
+        """Fold one batch (DataFrame or DataTools) into the running statistics."""
+        df = getattr(batch, "df", batch)
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("batch must be a pandas DataFrame or a DataTools object.")
+        n = len(df)
+        for c in df.columns:
+            if c not in self._columns:
+                self._columns[c] = _ColumnState(nulls=self.rows)  # absent from earlier batches
+        row_hash = np.zeros(n, dtype=np.uint64)
+
+        for c, state in self._columns.items():
+            if c not in df.columns:
+                state.nulls += n
+                continue
+            h = self._update_column(state, df[c])
+            with np.errstate(over="ignore"):
+                row_hash *= _ROW_HASH_PRIME
+                row_hash += h
+
+        self._row_hll.update_hashes(row_hash)
+        self.rows += n
+        self.batches += 1
+        return self
+
+    def _update_column(self, state: _ColumnState, s: pd.Series) -> np.ndarray:
+        """Fold one column of a batch into its state; returns the value hashes (for the row hash)."""
+        state.memory += int(s.memory_usage(deep=True, index=False))
+        if len(s) and s.isna().all():
+            # an all-null batch comes as object dtype: it tells nothing about the column's type
+            state.nulls += len(s)
+            return self._null_hashes(state, len(s))
+        state.dtype = s.dtype if state.dtype is None else _common_dtype([state.dtype, s.dtype])
+
+        if _is_numeric(s.dtype) or pd.api.types.is_datetime64_any_dtype(s.dtype):
+            # fixed-width values hash cheaply; distinct count from the sketch only
+            h = hash_values(s)
+            nulls = s.isna().to_numpy()
+            state.nulls += int(nulls.sum())
+            state.hll.update_hashes(h[~nulls])
+            if nulls.all():
+                return h
+            if _is_numeric(s.dtype):
+                values = s.to_numpy(dtype=float, na_value=np.nan)[~nulls]
+            else:
+                # datetimes: moments and quantiles of the nanosecond values
+                values = s.to_numpy(dtype="datetime64[ns]")[~nulls].astype(np.int64).astype(float)
+            mean = values.mean()
+            self._merge_moments(state, len(values), mean, float(np.square(values - mean).sum()))
+            if self.quantiles:
+                if state.sketch is None:
+                    state.sketch = QuantileSketch(rank_error=0.001)
+                state.sketch.update(values)
+            if _is_numeric(s.dtype):
+                lo, hi = values.min(), values.max()
+            else:
+                lo, hi = s.min(), s.max()
+            state.min = lo if state.min is None else min(state.min, lo)
+            state.max = hi if state.max is None else max(state.max, hi)
+            return h
+
+        # text / categories / bools: one factorize gives the null mask, the value
+        # counts, and hashes of the distinct values only
+        codes, uniques = pd.factorize(s)
+        nulls = codes < 0
+        state.nulls += int(nulls.sum())
+        if len(uniques) == 0:
+            return np.zeros(len(s), dtype=np.uint64)
+        values = np.asarray(uniques, dtype=object)
+        unique_hashes = hash_values(pd.Series(values))
+        state.hll.update_hashes(unique_hashes)
+        if not state.overflow:
+            counts = np.bincount(codes[~nulls], minlength=len(uniques))
+            state.counts = {} if state.counts is None else state.counts
+            for value, count in zip(values.tolist(), counts.tolist()):
+                state.counts[value] = state.counts.get(value, 0) + count
+            if len(state.counts) > self.max_categories:
+                state.counts, state.overflow = None, True
+        return np.where(nulls, np.uint64(0), unique_hashes[codes])
+
+    @staticmethod
+    def _null_hashes(state: _ColumnState, n: int) -> np.ndarray:
+        """Row-hash contribution of n nulls, as the column's own path would hash them."""
+        if state.dtype is not None and (_is_numeric(state.dtype) or pd.api.types.is_datetime64_any_dtype(state.dtype)):
+            null = np.nan if _is_numeric(state.dtype) else pd.NaT
+            dtype = float if _is_numeric(state.dtype) else state.dtype
+            return hash_values(pd.Series([null] * n, dtype=dtype))
+        return np.zeros(n, dtype=np.uint64)
+
+    @staticmethod
+    def _merge_moments(state: _ColumnState, n: int, mean: float, m2: float):
+        """Chan et al. parallel update of (count, mean, M2)."""
+        total = state.count + n
+        delta = mean - state.mean
+        state.mean += delta * n / total
+        state.m2 += m2 + delta * delta * state.count * n / total
+        state.count = total
+
+    def merge(self, other: "IncrementalProfiler"):
+        """Add the statistics of a profiler fed with other batches."""
+        for c, theirs in other._columns.items():
+            mine = self._columns.get(c)
+            if mine is None:
+                mine = self._columns[c] = _ColumnState(nulls=self.rows)
+            mine.dtype = theirs.dtype if mine.dtype is None else (
+                mine.dtype if theirs.dtype is None else _common_dtype([mine.dtype, theirs.dtype]))
+            mine.nulls += theirs.nulls
+            mine.memory += theirs.memory
+            mine.hll.merge(theirs.hll)
+            if theirs.count:
+                self._merge_moments(mine, theirs.count, theirs.mean, theirs.m2)
+            if theirs.min is not None:
+                mine.min = theirs.min if mine.min is None else min(mine.min, theirs.min)
+                mine.max = theirs.max if mine.max is None else max(mine.max, theirs.max)
+            if theirs.sketch is not None:
+                mine.sketch = copy.deepcopy(theirs.sketch) if mine.sketch is None else mine.sketch.merge(theirs.sketch)
+            if mine.overflow or theirs.overflow:
+                mine.counts, mine.overflow = None, True
+            elif theirs.counts is not None:
+                mine.counts = {} if mine.counts is None else mine.counts
+                for value, count in theirs.counts.items():
+                    mine.counts[value] = mine.counts.get(value, 0) + count
+                if len(mine.counts) > self.max_categories:
+                    mine.counts, mine.overflow = None, True
+        for c, mine in self._columns.items():
+            if c not in other._columns:
+                mine.nulls += other.rows
+        self._row_hll.merge(other._row_hll)
+        self.rows += other.rows
+        self.batches += other.batches
+        return self
+
+    # ==========================================================
+    """SECTION: Reports"""
+    # ==========================================================
+    @staticmethod
+    def _unique(state: _ColumnState) -> int:
+        if state.counts is not None:
+            return int(len(state.counts))
+        return int(round(state.hll.count()))
+
+    def _missing(self) -> pd.Series:
+        return pd.Series({c: st.nulls for c, st in self._columns.items()}, dtype="int64")
+
+    def _dtypes(self) -> pd.Series:
+        # columns only ever seen all-null are object, like pandas reads them
+        return pd.Series({
+            c: str(pd.api.types.pandas_dtype(object if st.dtype is None else st.dtype))
+            for c, st in self._columns.items()
+        }, dtype=object)
+
+    def overview(self):
+        """
+        Same tables as EDATools.overview(approx=True): distinct counts of numeric
+        (and overflowed text) columns and the duplicate-row count are estimates.
+        """
+        missing = self._missing()
+        info_table = pd.DataFrame({
+            "dtype": self._dtypes(),
+            "missing_count": missing,
+            "missing_%": (missing / max(self.rows, 1) * 100).round(2),
+            "unique": pd.Series({c: self._unique(st) for c, st in self._columns.items()}, dtype="int64"),
+        }).sort_values("missing_%", ascending=False)
+
+        distinct_rows = min(self.rows, int(round(self._row_hll.count())))
+        summary = {
+            "rows": int(self.rows),
+            "cols": len(self._columns),
+            "duplicates": int(self.rows - distinct_rows),
+            "memory_MB": float(sum(st.memory for st in self._columns.values()) / (1024 ** 2)),
+        }
+        return summary, info_table
+
+    def missingReport(self):
+        """Same table as EDATools.missingReport()."""
+        missing = self._missing()
+        return pd.DataFrame({
+            "missing_count": missing,
+            "missing_%": (missing / max(self.rows, 1) * 100).round(2),
+            "dtype": self._dtypes(),
+        }).sort_values("missing_%", ascending=False)
+
+    def insights(self):
+        """describe(include="all").transpose() layout from the running statistics."""
+        rows = {}
+        for c, st in self._columns.items():
+            count = float(self.rows - st.nulls)
+            if st.dtype is not None and _is_numeric(st.dtype):
+                q1, q2, q3 = st.sketch.quantile([0.25, 0.5, 0.75]) if st.sketch is not None else (np.nan,) * 3
+                std = np.sqrt(st.m2 / (st.count - 1)) if st.count > 1 else np.nan
+                rows[c] = pd.Series({
+                    "count": count, "mean": st.mean if st.count else np.nan, "std": std,
+                    "min": st.min, "25%": q1, "50%": q2, "75%": q3, "max": st.max,
+                }, dtype=object)
+                continue
+            if st.dtype is not None and pd.api.types.is_datetime64_any_dtype(st.dtype):
+                # describe() layout for datetimes: no std
+                q1, q2, q3 = st.sketch.quantile([0.25, 0.5, 0.75]) if st.sketch is not None else (np.nan,) * 3
+                as_time = self._timestamp_of(st.dtype)
+                rows[c] = pd.Series({
+                    "count": count, "mean": as_time(st.mean) if st.count else pd.NaT,
+                    "min": st.min, "25%": as_time(q1), "50%": as_time(q2), "75%": as_time(q3), "max": st.max,
+                }, dtype=object)
+                continue
+            stats = {"count": count, "unique": self._unique(st)}
+            if st.counts:
+                stats["top"] = max(st.counts, key=st.counts.get)  # first seen wins ties
+                stats["freq"] = st.counts[stats["top"]]
+            else:
+                stats["top"], stats["freq"] = np.nan, np.nan
+            rows[c] = pd.Series(stats, dtype=object)
+        return _describe_table(rows)
+
+    @staticmethod
+    def _timestamp_of(dtype):
+        """Nanosecond number => Timestamp in the column's time zone."""
+        tz = getattr(dtype, "tz", None)
+
+        def convert(value):
+            if value is None or np.isnan(value):
+                return pd.NaT
+            ts = pd.Timestamp(int(round(value)), unit="ns")
+            return ts.tz_localize("UTC").tz_convert(tz) if tz is not None else ts
+        return convert
+
+    def valueCounts(self, column, top: int = None) -> pd.Series:
+        """Frequency of each value of a non-numeric column, most frequent first."""
+        if column not in self._columns:
+            raise ValueError(f"Column '{column}' not seen. Available columns: {list(self._columns)}")
+        st = self._columns[column]
+        if st.overflow:
+            raise ValueError(f"Column '{column}' has more than {self.max_categories} distinct values; "
+                             "its value counts were not kept.")
+        if st.counts is None:
+            raise ValueError(f"No value counts for '{column}' (numeric or empty column).")
+        counts = pd.Series(st.counts, dtype="int64", name="count").sort_values(ascending=False, kind="stable")
+        counts.index.name = column
+        return counts if top is None else counts.head(top)
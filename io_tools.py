@@ -1,66 +1,667 @@
+import glob
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 
+from import_cache import resolve_cache
+from sampling import ReservoirSampler
+from sql_tools import borrow
+from types_tools import _infer_schema, _optimal_dtype
+
+
+# extension => source_type (checked in order; first match wins)
+_EXTENSIONS = (
+    ((".csv",), "csv"),
+    ((".xls", ".xlsx"), "excel"),
+    ((".json",), "json"),
+    ((".html", ".htm"), "html"),
+    ((".parquet", ".pq"), "parquet"),
+    ((".feather", ".ftr"), "feather"),
+    ((".arrow", ".ipc"), "arrow"),
+    ((".orc",), "orc"),
+)
+
+# columnar formats read through pyarrow.dataset (projection + filter pushdown)
+_ARROW_FORMATS = {"parquet": "parquet", "feather": "ipc", "arrow": "ipc", "orc": "orc"}
+
+
+# compression implied by a file suffix (exportData)
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd", ".lz4": "lz4"}
+
+
+# DataFrame.to_csv arguments the Arrow CSV writer understands (name => WriteOptions field)
+_ARROW_CSV_OPTIONS = {"sep": "delimiter", "header": "include_header", "na_rep": "null_string",
+                      "lineterminator": "eol"}
+
+
+def _arrow_csv_options(kwargs: dict):
+    """WriteOptions fields for to_csv-style kwargs, or None when only pandas can honour them."""
+    options = {}
+    for key, value in kwargs.items():
+        if key not in _ARROW_CSV_OPTIONS:
+            return None
+        if key == "sep" and len(value) != 1:
+            return None
+        if key == "header" and not isinstance(value, bool):
+            return None  # a list of aliases
+        options[_ARROW_CSV_OPTIONS[key]] = value
+    return options
+
+
+def _detect_source_type(source: str) -> str:
+    s = source.lower()
+    for extensions, source_type in _EXTENSIONS:
+        if s.endswith(extensions):
+            return source_type
+    raise ValueError(
+        "Cannot auto-detect file type. Provide source_type: "
+        "'csv'|'excel'|'json'|'html'|'parquet'|'feather'|'arrow'|'orc'|'sql'."
+    )
+
+
+def _read_columnar(source: str, source_type: str, *, columns=None, filters=None, arrow: bool = False, **kwargs):
+    """
+    Read Parquet / Feather (Arrow IPC) / ORC through pyarrow.dataset.
+    Only the requested columns are decoded; filters are pushed into the scan, so
+    Parquet row groups whose statistics cannot match are skipped.
+    """
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(f"Reading {source_type} files requires pyarrow (pip install pyarrow).")
+
+    expression = filters
+    if isinstance(filters, (list, tuple)):
+        # DNF list as in pandas.read_parquet: [("col", ">", 0), ...] or [[...], [...]]
+        expression = pq.filters_to_expression(filters)
+
+    dataset = ds.dataset(source, format=_ARROW_FORMATS[source_type], **kwargs)
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table.to_pandas(types_mapper=pd.ArrowDtype if arrow else None)
+
+
+def _iter_chunks(source, source_type: str, chunksize: int, *, columns=None, filters=None, arrow: bool = False,
+                 **kwargs):
+    """Yield DataFrames of at most chunksize rows; only one chunk is held in memory at a time."""
+    if isinstance(source, pd.DataFrame):
+        frame = source if columns is None else source[columns]
+        for start in range(0, len(frame), chunksize):
+            yield frame.iloc[start:start + chunksize]
+        return
+
+    if source_type in _ARROW_FORMATS:
+        try:
+            import pyarrow.dataset as ds
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(f"Reading {source_type} files requires pyarrow (pip install pyarrow).")
+        expression = pq.filters_to_expression(filters) if isinstance(filters, (list, tuple)) else filters
+        dataset = ds.dataset(source, format=_ARROW_FORMATS[source_type], **kwargs)
+        for batch in dataset.to_batches(columns=columns, filter=expression, batch_size=chunksize):
+            if batch.num_rows:
+                yield batch.to_pandas(types_mapper=pd.ArrowDtype if arrow else None)
+        return
+
+    if filters is not None:
+        raise ValueError("filters= is only supported for parquet/feather/arrow/orc sources.")
+    if arrow:
+        kwargs["dtype_backend"] = "pyarrow"
+
+    if source_type == "csv":
+        if columns is not None:
+            kwargs["usecols"] = columns
+        reader = pd.read_csv(source, chunksize=chunksize, **kwargs)
+    elif source_type == "json":
+        # only JSON Lines can be read incrementally
+        reader = pd.read_json(source, lines=True, chunksize=chunksize, **kwargs)
+    elif source_type == "sql":
+        yield from _iter_sql_chunks(source, chunksize, columns=columns, **kwargs)
+        return
+    else:
+        raise ValueError(f"Chunked reading is not supported for source_type: {source_type}")
+
+    with reader:
+        for chunk in reader:
+            yield chunk if columns is None or list(chunk.columns) == columns else chunk[columns]
+
+
+def _iter_sql_chunks(query: str, chunksize: int, *, con=None, columns=None, dtype_backend=None, **kwargs):
+    """
+    Stream a query result. SQLAlchemy engines/connections use a server-side cursor
+    (stream_results=True), DB-API connections fetch chunksize rows at a time.
+    """
+    if con is None:
+        raise ValueError("SQL import requires con=... (database connection/engine).")
+    if dtype_backend is not None:
+        kwargs["dtype_backend"] = dtype_backend
+
+    with borrow(con) as con:
+        owned = None
+        if hasattr(con, "execution_options"):
+            if hasattr(con, "dispose"):  # Engine => a dedicated connection for the cursor
+                con = owned = con.connect()
+            con = con.execution_options(stream_results=True, max_row_buffer=chunksize)
+        try:
+            for chunk in pd.read_sql(query, con, chunksize=chunksize, **kwargs):
+                yield chunk if columns is None else chunk[columns]
+        finally:
+            if owned is not None:
+                owned.close()
+
+
+class BatchWriter:
+    """
+    Incremental writer for a stream of DataFrames / DataTools batches
+    (CSV, Parquet, Feather/Arrow IPC, or a SQL table). The schema is taken from
+    the first batch; later batches are cast to it.
+
+    Examples:
+        with BatchWriter("clean.parquet") as out:
+            for batch in dt.iterData("raw.csv", chunksize=200_000):
+                batch.fillMissingValues("median", columns=["age"])
+                out.write(batch)
+
+        BatchWriter("users_clean", dest_type="sql", con=engine)
+    """
+
+    def __init__(self, dest: str, dest_type: str = None, **kwargs):
+        self.dest = dest
+        self.dest_type = _detect_source_type(dest) if dest_type is None else dest_type.lower()
+        if self.dest_type not in ("csv", "parquet", "feather", "arrow", "sql"):
+            raise ValueError(f"Unsupported dest_type for BatchWriter: {self.dest_type}")
+        if self.dest_type == "sql" and kwargs.get("con") is None:
+            raise ValueError("SQL export requires con=... (database connection/engine).")
+        self.kwargs = kwargs
+        self._writer = None
+        self._schema = None
+        self._started = False
+        self.rows = 0
+
+    def write(self, data):
+        """Append one batch (DataFrame or DataTools)."""
+        df = data if isinstance(data, pd.DataFrame) else data.df
+        if self.dest_type == "csv":
+            df.to_csv(self.dest, mode="a" if self._started else "w", header=not self._started,
+                      index=False, **self.kwargs)
+        elif self.dest_type == "sql":
+            kwargs = dict(self.kwargs)
+            con = kwargs.pop("con")
+            # first batch honours if_exists (default: fail), later batches always append
+            if self._started:
+                kwargs["if_exists"] = "append"
+            with borrow(con) as c:
+                df.to_sql(self.dest, c, index=False, **kwargs)
+        else:
+            self._write_arrow(df)
+        self._started = True
+        self.rows += len(df)
+        return self
+
+    def _write_arrow(self, df: pd.DataFrame):
+        import pyarrow as pa
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            if self.dest_type == "parquet":
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.dest, table.schema, **self.kwargs)
+            else:
+                self._writer = pa.ipc.new_file(self.dest, table.schema, **self.kwargs)
+            self._schema = table.schema
+        elif not table.schema.equals(self._schema):
+            table = table.cast(self._schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif not self._started and self.dest_type == "csv":
+            open(self.dest, "w").close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_source(source: str, t: str, *, columns=None, filters=None, arrow: bool = False, infer_schema=False,
+                 **kwargs) -> pd.DataFrame:
+    """Read one source of a known type into a DataFrame."""
+    if infer_schema and t in ("csv", "excel"):
+        return _read_with_schema(source, t, infer_schema, columns=columns, arrow=arrow, **kwargs)
+    if t in _ARROW_FORMATS:
+        return _read_columnar(source, t, columns=columns, filters=filters, arrow=arrow, **kwargs)
+
+    if filters is not None:
+        raise ValueError("filters= is only supported for parquet/feather/arrow/orc sources.")
+    if arrow:
+        kwargs["dtype_backend"] = "pyarrow"
+
+    if t == "csv":
+        if columns is not None:
+            kwargs["usecols"] = columns
+        df = pd.read_csv(source, **kwargs)
+    elif t == "excel":
+        if columns is not None:
+            kwargs["usecols"] = columns
+        df = pd.read_excel(source, **kwargs)
+    elif t == "json":
+        df = pd.read_json(source, **kwargs)
+    elif t == "html":
+        df = pd.read_html(source, **kwargs)[0]
+    elif t == "sql":
+        con = kwargs.pop("con", None)
+        if con is None:
+            raise ValueError("SQL import requires con=... (database connection/engine).")
+        sql_kwargs = {"dtype_backend": "pyarrow"} if arrow else {}
+        with borrow(con) as c:
+            df = pd.read_sql(source, c, **sql_kwargs)
+    else:
+        raise ValueError(f"Unsupported source_type: {t}")
+
+    if columns is not None and list(df.columns) != columns:
+        df = df[columns]
+    return df
+
+
+def _read_with_schema(source: str, t: str, infer_schema, *, columns=None, arrow: bool = False, **kwargs):
+    """
+    Read a CSV / Excel sample, infer compact dtypes from it and parse the whole
+    source straight into them; integer columns are then narrowed using their full range.
+    Falls back to a plain read if the inferred schema does not fit the full source.
+    """
+    sample_rows = 10_000 if infer_schema is True else int(infer_schema)
+    user_dtype = kwargs.get("dtype")
+    if user_dtype is not None and not isinstance(user_dtype, dict):
+        return _read_source(source, t, columns=columns, arrow=arrow, **kwargs)  # one dtype for all
+
+    sample = _read_source(source, t, columns=columns, arrow=arrow, **dict(kwargs, nrows=sample_rows))
+    schema = _infer_schema(sample)
+    dtype = {**schema["dtype"], **(user_dtype or {})}
+    parse_dates = kwargs.get("parse_dates", [c for c in schema["parse_dates"] if c not in dtype])
+
+    try:
+        df = _read_source(source, t, columns=columns, arrow=arrow,
+                          **dict(kwargs, dtype=dtype or None, parse_dates=parse_dates or None))
+    except (TypeError, ValueError, OverflowError):
+        # e.g. a fractional value after the sample in a column inferred as Int64
+        return _read_source(source, t, columns=columns, arrow=arrow, **kwargs)
+
+    for c in df.columns:
+        if pd.api.types.is_integer_dtype(df[c].dtype):
+            target = _optimal_dtype(df[c])
+            if target is not None:
+                df[c] = df[c].astype(target)
+    return df
+
+
+def _read_cached(source: str, t: str, cache, *, columns=None, filters=None, arrow: bool = False, **kwargs):
+    """_read_source through an ImportCache for text/spreadsheet files (columnar formats are read directly)."""
+    if cache is None or t in _ARROW_FORMATS or t == "sql" or not os.path.isfile(source):
+        return _read_source(source, t, columns=columns, filters=filters, arrow=arrow, **kwargs)
+    options = dict(kwargs, columns=columns, arrow=arrow)
+    return cache.load(source, t, options,
+                      lambda: _read_source(source, t, columns=columns, filters=filters, arrow=arrow, **kwargs))
+
+
+def _is_glob(source) -> bool:
+    return isinstance(source, str) and any(ch in source for ch in "*?[") and not os.path.exists(source)
+
+
+def _expand_glob(pattern: str) -> list:
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        raise ValueError(f"No files match: {pattern}")
+    return paths
+
+
+def _common_dtype(dtypes):
+    """dtype every file's column can be cast to without losing values (object as last resort)."""
+    unique = list(dict.fromkeys(dtypes))
+    if len(unique) == 1:
+        return unique[0]
+    if all(isinstance(d, pd.CategoricalDtype) for d in unique):
+        categories = pd.Index([]).append([d.categories for d in unique]).unique()
+        return pd.CategoricalDtype(categories)
+    if all(pd.api.types.is_bool_dtype(d) or pd.api.types.is_numeric_dtype(d) for d in unique):
+        if all(isinstance(d, np.dtype) for d in unique):
+            return np.result_type(*unique)
+        return pd.Float64Dtype() if any(pd.api.types.is_float_dtype(d) for d in unique) else pd.Int64Dtype()
+    if all(pd.api.types.is_string_dtype(d) and not isinstance(d, pd.CategoricalDtype) for d in unique):
+        return pd.StringDtype()
+    if all(pd.api.types.is_datetime64_any_dtype(d) for d in unique):
+        try:
+            return np.result_type(*unique)
+        except TypeError:  # tz-aware and naive mixed
+            return object
+    return object
+
+
+def _reconcile_schemas(frames: list, join: str = "outer") -> list:
+    """Cast each frame so a column has the same dtype in every file before the concat."""
+    columns = {}
+    for df in frames:
+        for c in df.columns:
+            columns.setdefault(c, []).append(df[c].dtype)
+    if join == "inner":
+        columns = {c: d for c, d in columns.items() if len(d) == len(frames)}
+
+    targets = {}
+    for c, dtypes in columns.items():
+        if join == "outer" and len(dtypes) < len(frames):
+            # the concat fills missing columns with NaN => integers/bools need a nullable/float home
+            dtypes = dtypes + [np.dtype("float64")] if all(
+                pd.api.types.is_numeric_dtype(d) and not pd.api.types.is_bool_dtype(d) for d in dtypes) else dtypes
+        targets[c] = _common_dtype(dtypes)
+
+    out = []
+    for df in frames:
+        casts = {c: t for c, t in targets.items() if c in df.columns and df[c].dtype != t}
+        out.append(df.astype(casts) if casts else df)
+    return out
+
 
 class IOTools:
     # ==========================================================
     """SECTION: Import / Load (Multi-Source)"""
     # ==========================================================
-    def importData(self, source, *, source_type: str = None, **kwargs):
+    def importData(self, source, *, source_type: str = None, columns=None, filters=None, arrow: bool = False,
+                   chunksize: int = None, source_column: str = None, join: str = "outer", n_jobs: int = None,
+                   cache=None, infer_schema=False, sample=None, seed: int = None, **kwargs):
         """
         Load data into self.df from:
         - DataFrame
         - CSV / Excel / JSON / HTML
+        - Parquet / Feather (Arrow IPC) / ORC (file or dataset directory, requires pyarrow)
         - SQL query (requires con=...)
+        - a list of paths or a glob pattern ("logs/2026-*.csv"): files are read in
+          parallel, column dtypes reconciled, then concatenated once
+
+        columns:
+            load only these columns (decoded only for Parquet/Feather/ORC, usecols for CSV/Excel)
+        filters:
+            row filter pushed into Parquet/Feather/ORC scans: DNF list like
+            [("year", "=", 2024), ("amount", ">", 0)] or a pyarrow.dataset expression
+        arrow:
+            Arrow-backed dtypes (pd.ArrowDtype / dtype_backend="pyarrow")
+        chunksize:
+            don't load: return iterData(...) instead (generator of DataTools batches)
+        source_column:
+            (several files) add a column with each row's file path
+        join:
+            (several files) "outer" => union of columns, "inner" => columns in every file
+        n_jobs:
+            (several files) reader threads (None => thread-pool default; reading is I/O bound)
+        infer_schema:
+            (CSV / Excel) infer compact dtypes from the first 10_000 rows (or the given
+            number of rows) and parse straight into them: categories for low-cardinality
+            text, parsed dates, nullable ints, narrowed integer widths
+        cache:
+            reuse parsed CSV / Excel / JSON files: True (default ImportCache), a cache
+            directory or an ImportCache. Keyed on the file and the reader options.
+        sample:
+            load only a random sample, streamed in chunks of chunksize (default
+            100_000) rows: a row count => reservoir sample, a fraction => each row
+            kept with that probability. self.sample_population records the rows
+            read, and insights / overview / missingReport then report estimates
+            with confidence intervals (until dt.df is replaced or its rows change).
 
         Examples:
             dt.importData(df)
             dt.importData("data.csv")
             dt.importData("data.xlsx", sheet_name="Sheet1")
             dt.importData("https://site.com/table.html")
+            dt.importData("sales.parquet", columns=["region", "revenue"], filters=[("revenue", ">", 0)])
+            dt.importData("lake/sales/", source_type="parquet", partitioning="hive")
+            dt.importData("logs/2026-*.csv", source_column="file")
+            dt.importData("big.xlsx", sheet_name="2026", cache=True)
+            dt.importData("export.csv", infer_schema=True)
+            dt.importData("events_50M.csv", sample=500_000, seed=0)
             dt.importData("SELECT * FROM users", source_type="sql", con=engine)
         """
+        if sample is not None:
+            return self._import_sample(source, sample, seed=seed, chunksize=chunksize or 100_000,
+                                       source_type=source_type, columns=columns, filters=filters,
+                                       arrow=arrow, **kwargs)
+        if chunksize is not None:
+            return self.iterData(source, chunksize=chunksize, source_type=source_type, columns=columns,
+                                 filters=filters, arrow=arrow, **kwargs)
+
+        self.sample_population = None
         if isinstance(source, pd.DataFrame):
-            self.df = source.copy()
+            self.df = self._copy_frame(source) if self.copy else source
+            return self.df
+
+        is_sql = source_type is not None and source_type.lower() == "sql"
+        if isinstance(source, (list, tuple)) or (not is_sql and _is_glob(source)):
+            paths = list(source) if isinstance(source, (list, tuple)) else _expand_glob(source)
+            self.df = self._import_many(paths, source_type=source_type, columns=columns, filters=filters,
+                                        arrow=arrow, source_column=source_column, join=join, n_jobs=n_jobs,
+                                        cache=cache, infer_schema=infer_schema, **kwargs)
             return self.df
 
         if not isinstance(source, str):
-            raise TypeError("source must be a pandas DataFrame or a string (path/url/sql query).")
+            raise TypeError("source must be a pandas DataFrame, a string (path/url/sql query) or a list of paths.")
 
         # Auto-detect by extension if source_type not provided
-        if source_type is None:
-            s = source.lower()
-
-            if s.endswith(".csv"):
-                self.df = pd.read_csv(source, **kwargs)
-            elif s.endswith((".xls", ".xlsx")):
-                self.df = pd.read_excel(source, **kwargs)
-            elif s.endswith(".json"):
-                self.df = pd.read_json(source, **kwargs)
-            elif s.endswith((".html", ".htm")):
-                self.df = pd.read_html(source, **kwargs)[0]
-            else:
-                raise ValueError(
-                    "Cannot auto-detect file type. Provide source_type: "
-                    "'csv'|'excel'|'json'|'html'|'sql'."
-                )
-            return self.df
+        t = _detect_source_type(source) if source_type is None else source_type.lower()
+        cols = None if columns is None else self._ensure_list(columns)
+        if infer_schema:
+            kwargs["infer_schema"] = infer_schema
+        self.df = _read_cached(source, t, resolve_cache(cache), columns=cols, filters=filters, arrow=arrow, **kwargs)
+        return self.df
+
+    def _import_many(self, paths, *, source_type=None, columns=None, filters=None, arrow=False,
+                     source_column=None, join="outer", n_jobs=None, cache=None, infer_schema=False,
+                     **kwargs) -> pd.DataFrame:
+        """Read several files on a thread pool and concatenate them once."""
+        if len(paths) == 0:
+            raise ValueError("No files to import.")
+        if join not in ("outer", "inner"):
+            raise ValueError("join must be 'outer' or 'inner'.")
+        for path in paths:
+            if not isinstance(path, str):
+                raise TypeError("Every source in the list must be a file path.")
+        cols = None if columns is None else self._ensure_list(columns)
+        cache = resolve_cache(cache)
+        if infer_schema:
+            kwargs["infer_schema"] = infer_schema
 
-        # Manual source_type
-        t = source_type.lower()
-        if t == "csv":
-            self.df = pd.read_csv(source, **kwargs)
-        elif t == "excel":
-            self.df = pd.read_excel(source, **kwargs)
-        elif t == "json":
-            self.df = pd.read_json(source, **kwargs)
-        elif t == "html":
-            self.df = pd.read_html(source, **kwargs)[0]
-        elif t == "sql":
-            con = kwargs.get("con", None)
-            if con is None:
-                raise ValueError("SQL import requires con=... (database connection/engine).")
-            self.df = pd.read_sql(source, con)
+        def read(path):
+            t = _detect_source_type(path) if source_type is None else source_type.lower()
+            if t == "sql":
+                raise ValueError("Lists / glob patterns are for files; pass SQL queries one at a time.")
+            return _read_cached(path, t, cache, columns=cols, filters=filters, arrow=arrow, **dict(kwargs))
+
+        workers = None if n_jobs is None else self._resolve_n_jobs(n_jobs)
+        if workers == 1 or len(paths) == 1:
+            frames = [read(p) for p in paths]
         else:
-            raise ValueError(f"Unsupported source_type: {source_type}")
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(read, paths))
+
+        frames = _reconcile_schemas(frames, join)
+        if source_column is not None:
+            origin = pd.Categorical.from_codes(
+                np.repeat(np.arange(len(paths)), [len(f) for f in frames]), categories=pd.Index(paths)
+            )
+        df = pd.concat(frames, ignore_index=True, join=join) if len(frames) > 1 else frames[0]
+        if source_column is not None:
+            df[source_column] = origin
+        return df
 
+    def _import_sample(self, source, sample, *, seed=None, chunksize=100_000, **kwargs) -> pd.DataFrame:
+        """One streamed pass: reservoir sample (row count) or Bernoulli sample (fraction)."""
+        batches = self.iterData(source, chunksize=chunksize, **kwargs)
+        if isinstance(sample, (int, np.integer)) and not isinstance(sample, bool):
+            sampler = ReservoirSampler(sample, seed=seed)
+            for batch in batches:
+                sampler.update(batch.df)
+            df, seen = sampler.result(), sampler.seen
+        else:
+            fraction = float(sample)
+            if not 0 < fraction <= 1:
+                raise ValueError("sample fraction must be in (0, 1]; pass an int for a row count.")
+            rng = np.random.default_rng(seed)
+            parts, seen = [], 0
+            for batch in batches:
+                parts.append(batch.df[rng.random(len(batch.df)) < fraction])
+                seen += len(batch.df)
+            df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else (parts[0] if parts else pd.DataFrame())
+
+        self.df = df
+        self.sample_population = seen
         return self.df
+
+    def iterData(self, source, *, chunksize: int = 100_000, source_type: str = None, columns=None, filters=None,
+                 arrow: bool = False, **kwargs):
+        """
+        Stream a source as DataTools batches of at most chunksize rows (self.df is not touched).
+        Sources: DataFrame, CSV, JSON Lines, Parquet / Feather / ORC, SQL query
+        (server-side cursor with SQLAlchemy). Each batch has this object's settings
+        and is never copied, so transforms on it run in place.
+
+        Examples:
+            with BatchWriter("clean.csv") as out:
+                for batch in dt.iterData("SELECT * FROM events", source_type="sql", con=engine,
+                                         chunksize=50_000):
+                    batch.cleanText("message")
+                    batch.dropDuplicates()
+                    out.write(batch)
+        """
+        if chunksize is None or int(chunksize) <= 0:
+            raise ValueError("chunksize must be a positive integer.")
+        if isinstance(source, pd.DataFrame):
+            t = "dataframe"
+        elif isinstance(source, str):
+            t = _detect_source_type(source) if source_type is None else source_type.lower()
+            if t != "sql" and "://" not in source and not os.path.exists(source):
+                raise ValueError(f"Source file not found: {source}")
+        else:
+            raise TypeError("source must be a pandas DataFrame or a string (path/url/sql query).")
+
+        cols = None if columns is None else self._ensure_list(columns)
+        chunks = _iter_chunks(source, t, int(chunksize), columns=cols, filters=filters, arrow=arrow, **kwargs)
+        return (type(self)(chunk, copy=False, n_jobs=self.n_jobs, stats_cache_mb=self.stats_cache_mb)
+                for chunk in chunks)
+
+    # ==========================================================
+    """SECTION: Export / Save"""
+    # ==========================================================
+    def exportData(self, dest: str, *, dest_type: str = None, columns=None, compression: str = None,
+                   n_jobs: int = None, **kwargs) -> str:
+        """
+        Write self.df (optionally only some columns) to:
+        - CSV     (pyarrow's multi-threaded writer when installed; gzip/bz2/zstd/lz4 compression).
+                  kwargs are DataFrame.to_csv arguments; sep/header/na_rep/lineterminator go to
+                  pyarrow, anything else (or a frame Arrow cannot convert) uses DataFrame.to_csv
+        - Parquet (compression: snappy (default) / zstd / gzip / lz4 / brotli / none)
+        - Feather / Arrow IPC (compression: lz4 / zstd / uncompressed)
+        - .npy    numeric columns (columns=None => all numeric) as one 2-D array, written block by block into a
+                  memory map (read back with np.load(dest, mmap_mode="r")); column
+                  names go to <dest without .npy>.columns.json
+
+        n_jobs: threads used for the Arrow conversion / encoding (None => constructor default)
+        Returns dest.
+
+        Examples:
+            dt.exportData("clean.parquet", compression="zstd")
+            dt.exportData("clean.csv.gz")
+            dt.exportData("features.npy", columns=["age", "salary"], dtype="float32")
+        """
+        if not isinstance(dest, str):
+            raise TypeError("dest must be a file path.")
+        cols = list(self.df.columns) if columns is None else self._ensure_list(columns)
+        self._require_columns(cols)
+
+        base, suffix = os.path.splitext(dest.lower())
+        if suffix in _COMPRESSION_SUFFIXES:
+            compression = compression or _COMPRESSION_SUFFIXES[suffix]
+        else:
+            base = dest.lower()
+
+        if dest_type is not None:
+            t = dest_type.lower()
+        elif base.endswith(".npy"):
+            t = "npy"
+        else:
+            t = _detect_source_type(base)
+
+        n_jobs = self._resolve_n_jobs(n_jobs)
+        if t == "npy":
+            if compression is not None:
+                raise ValueError(".npy output cannot be compressed.")
+            self._export_npy(dest, columns, **kwargs)
+        elif t in ("csv", "parquet", "feather", "arrow"):
+            self._export_arrow(dest, t, cols, compression, n_jobs, **kwargs)
+        else:
+            raise ValueError(f"Unsupported dest_type: {t}. Use 'csv'|'parquet'|'feather'|'arrow'|'npy'.")
+        return dest
+
+    def _export_arrow(self, dest, t, cols, compression, n_jobs, **kwargs):
+        df = self.df if cols == list(self.df.columns) else self.df[cols]
+        try:
+            import pyarrow as pa
+        except ImportError:
+            if t != "csv":
+                raise ImportError(f"Writing {t} files requires pyarrow (pip install pyarrow).")
+            df.to_csv(dest, index=False, compression=compression, **kwargs)
+            return
+
+        # CSV takes DataFrame.to_csv arguments whichever writer runs
+        options = _arrow_csv_options(kwargs) if t == "csv" else {}
+        if options is None:
+            df.to_csv(dest, index=False, compression=compression, **kwargs)
+            return
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False, nthreads=n_jobs)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            if t != "csv":
+                raise
+            # e.g. object columns mixing str and numbers: pandas writes them as text
+            df.to_csv(dest, index=False, compression=compression, **kwargs)
+            return
+
+        if t == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, dest, compression=compression or "snappy", **kwargs)
+        elif t in ("feather", "arrow"):
+            import pyarrow.feather as feather
+            feather.write_feather(table, dest, compression=compression, **kwargs)
+        else:
+            import pyarrow.csv as pacsv
+            write_options = pacsv.WriteOptions(**options) if options else None
+            if compression is None:
+                pacsv.write_csv(table, dest, write_options=write_options)
+            else:
+                with pa.CompressedOutputStream(dest, compression) as out:
+                    pacsv.write_csv(table, out, write_options=write_options)
+
+    def _export_npy(self, dest, columns, *, dtype=None, block_rows: int = 65_536):
+        numeric = self._numeric_columns(columns)
+        if len(numeric) == 0:
+            raise TypeError("No numeric columns to export as .npy.")
+        if dtype is None:
+            dtype = np.result_type(*[self.df[c].dtype.numpy_dtype if hasattr(self.df[c].dtype, "numpy_dtype")
+                                     else self.df[c].dtype for c in numeric])
+            # NaN needs a float
+            if not np.issubdtype(dtype, np.floating) and self._null_counts(numeric).any():
+                dtype = np.float64
+
+        n = len(self.df)
+        out = np.lib.format.open_memmap(dest, mode="w+", dtype=dtype, shape=(n, len(numeric)))
+        na_kw = {"na_value": np.nan} if np.issubdtype(np.dtype(dtype), np.floating) else {}
+        # row blocks: sequential writes into the map, bounded temporary memory
+        for start in range(0, n, block_rows):
+            block = self.df.iloc[start:start + block_rows][numeric]
+            out[start:start + len(block)] = block.to_numpy(dtype=dtype, **na_kw)
+        out.flush()
+        del out
+
+        with open(os.path.splitext(dest)[0] + ".columns.json", "w", encoding="utf-8") as f:
+            json.dump(numeric, f)
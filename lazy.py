@@ -0,0 +1,311 @@
+import inspect
+
+
+# Column-local transforms: every output column depends only on the same input column,
+# so the optimizer may merge them, prune them, and move column projections before them.
+# name -> argument that holds the target column(s)
+_COLUMN_LOCAL = {
+    "fillMissingValues": "columns",
+    "scale": "columns",
+    "clip_outliers_iqr": "columns",
+    "clip_outliers_zscore": "columns",
+    "cleanText": "columns",
+    "labelEncode": "column",
+    "to_int": "column",
+    "to_float": "column",
+    "to_string": "column",
+    "to_bool": "column",
+    "to_datetime": "column",
+    "to_category": "column",
+}
+
+# Column-local transforms that give the same result when repeated back-to-back.
+_IDEMPOTENT = {
+    "fillMissingValues", "cleanText",
+    "to_int", "to_float", "to_string", "to_bool", "to_datetime", "to_category",
+}
+
+# Whole-frame transforms: recorded as-is; the optimizer never moves work across them.
+_FRAME_WIDE = {
+    "dropMissingValues", "fillMissingGroupBy", "dropDuplicates", "oneHotEncode", "combineFeatures",
+}
+
+_PROJECTIONS = ("dropColumns", "selectColumns")
+
+# fillMissingValues strategies whose result depends on other rows' values of other
+# columns (features / time order): never merged, and projections never move past them
+_CROSS_COLUMN_FILLS = {"knn", "interpolate"}
+
+# Read-only calls: run at their place in the plan; results land in plan.results.
+_QUERIES = {"outlier_mask_iqr", "detect_outliers_iqr", "outlier_mask_zscore", "detect_outliers_zscore"}
+
+# Steps reading exact quartiles of their columns (name -> argument with the columns)
+_USES_QUARTILES = {"clip_outliers_iqr": "columns", "outlier_mask_iqr": "columns", "detect_outliers_iqr": "columns"}
+
+
+class LazyPlan:
+    """
+    Deferred DataTools pipeline created by dt.lazy().
+
+    Transform calls are only recorded; collect() optimizes the plan and runs it:
+        - column drops/selections are moved before column-local steps, so work on
+          discarded columns is pruned
+        - consecutive column-local steps with the same options are merged into one pass
+          (e.g. several clip_outliers_iqr calls compute their quantiles in one loop)
+        - back-to-back repeats of idempotent steps are removed
+        - statistics are shared through the statistics cache: the quartiles of
+          every IQR step reading unchanged columns come from one quantile pass
+          before the run, and an IQR clip that leaves them unchanged keeps them
+          for later steps
+        - the frame is copied at most once (never, for copy-free DataTools)
+
+    Outlier masks / detections can be recorded too; collect() stores what they
+    return, in recording order, in plan.results.
+    """
+
+    def __init__(self, tools):
+        self._tools = tools
+        self.steps = []
+        self.results = []
+
+    def __getattr__(self, name):
+        if name in _COLUMN_LOCAL or name in _FRAME_WIDE or name in _QUERIES:
+            def record(*args, **kwargs):
+                self.steps.append(self._bind(name, args, kwargs))
+                return self
+            return record
+        raise AttributeError(
+            f"'{name}' cannot be recorded in a lazy plan. "
+            f"Supported: {sorted(_COLUMN_LOCAL) + sorted(_FRAME_WIDE) + sorted(_QUERIES) + list(_PROJECTIONS)}"
+        )
+
+    def __repr__(self):
+        lines = [f"LazyPlan({len(self.steps)} recorded steps), optimized:"]
+        lines += [f"  {line}" for line in self.explain()]
+        return "\n".join(lines)
+
+    # ==========================================================
+    """SECTION: Recording"""
+    # ==========================================================
+    def _bind(self, name, args, kwargs):
+        """Normalize a recorded call into {'method': name, 'params': {...}}."""
+        if "inplace" in kwargs or "copy" in kwargs:
+            raise ValueError("Lazy steps always run inplace on the plan's working frame; remove inplace=/copy=.")
+        if kwargs.get("return_mapping"):
+            raise ValueError("return_mapping=True is not supported in a lazy plan.")
+
+        sig = inspect.signature(getattr(type(self._tools), name))
+        bound = sig.bind(self._tools, *args, **kwargs)
+        bound.apply_defaults()
+
+        params = dict(bound.arguments)
+        for key in ("self", "inplace", "copy"):
+            params.pop(key, None)
+
+        if _COLUMN_LOCAL.get(name) == "columns" or name in _USES_QUARTILES:
+            params["columns"] = self._tools._ensure_list(params["columns"])
+        return {"method": name, "params": params}
+
+    def dropColumns(self, columns):
+        """Record dropping columns (later steps never see them; earlier work on them is pruned)."""
+        self.steps.append({"method": "dropColumns", "params": {"columns": self._tools._ensure_list(columns)}})
+        return self
+
+    def selectColumns(self, columns):
+        """Record keeping only the given columns (earlier work on other columns is pruned)."""
+        self.steps.append({"method": "selectColumns", "params": {"columns": self._tools._ensure_list(columns)}})
+        return self
+
+    # ==========================================================
+    """SECTION: Optimizer"""
+    # ==========================================================
+    def _optimized_steps(self):
+        steps = [{"method": s["method"], "params": dict(s["params"])} for s in self.steps]
+        steps = self._push_down_projections(steps)
+        steps = self._merge_column_passes(steps)
+        return steps
+
+    @staticmethod
+    def _is_column_local(step) -> bool:
+        if step["method"] not in _COLUMN_LOCAL:
+            return False
+        if step["method"] == "fillMissingValues":
+            return str(step["params"].get("strategy", "")).lower() not in _CROSS_COLUMN_FILLS
+        return True
+
+    @staticmethod
+    def _extra_reads(step):
+        """Columns a step reads besides its targets (None => possibly any column)."""
+        if step["method"] != "fillMissingValues":
+            return set()
+        params = step["params"]
+        reads = set() if params.get("time_col") is None else {params["time_col"]}
+        if str(params.get("strategy", "")).lower() == "knn":
+            features = params.get("features")
+            if features is None:
+                return None
+            reads.update([features] if isinstance(features, str) else features)
+        return reads
+
+    @staticmethod
+    def _push_down_projections(steps):
+        """Move each drop/select before the column-local steps preceding it, pruning their columns."""
+        out = []
+        for step in steps:
+            if step["method"] not in _PROJECTIONS:
+                out.append(step)
+                continue
+
+            cols = set(step["params"]["columns"])
+            if step["method"] == "dropColumns":
+                def keep(c):
+                    return c not in cols
+            else:
+                def keep(c):
+                    return c in cols
+
+            def can_pass(prev):
+                reads = LazyPlan._extra_reads(prev)
+                return LazyPlan._is_column_local(prev) and reads is not None and all(keep(c) for c in reads)
+
+            i = len(out)
+            pruned = set()
+            while i > 0 and can_pass(out[i - 1]):
+                i -= 1
+                prev = out[i]
+                arg = _COLUMN_LOCAL[prev["method"]]
+                target = prev["params"][arg]
+                if target is None:
+                    continue  # "all columns" => the projection simply runs first
+                if arg == "column":
+                    if not keep(target):
+                        pruned.add(id(prev))
+                    continue
+                kept = [c for c in target if keep(c)]
+                if kept:
+                    prev["params"][arg] = kept
+                else:
+                    pruned.add(id(prev))
+
+            out.insert(i, step)
+            out = [s for s in out if id(s) not in pruned]
+        return out
+
+    @staticmethod
+    def _merge_column_passes(steps):
+        """Fuse consecutive column-local steps that share the same options."""
+        merged = []
+        for step in steps:
+            prev = merged[-1] if merged else None
+            name = step["method"]
+            if (prev is not None and prev["method"] == name
+                    and LazyPlan._is_column_local(prev) and LazyPlan._is_column_local(step)):
+                arg = _COLUMN_LOCAL[name]
+                a, b = prev["params"][arg], step["params"][arg]
+                options_a = {k: v for k, v in prev["params"].items() if k != arg}
+                options_b = {k: v for k, v in step["params"].items() if k != arg}
+                if options_a == options_b:
+                    if a == b and name in _IDEMPOTENT:
+                        continue  # exact repeat => no-op
+                    if arg == "columns" and a is not None and b is not None and not set(a) & set(b):
+                        prev["params"][arg] = a + b
+                        continue
+            merged.append(step)
+        return merged
+
+    def explain(self):
+        """Return the optimized plan as a list of readable step strings."""
+        lines = []
+        for step in self._optimized_steps():
+            args = ", ".join(f"{k}={v!r}" for k, v in step["params"].items())
+            lines.append(f"{step['method']}({args})")
+        return lines
+
+    # ==========================================================
+    """SECTION: Execution"""
+    # ==========================================================
+    def collect(self, *, inplace: bool = True):
+        """
+        Optimize and run the recorded plan.
+        inplace=True => result replaces dt.df (like any transform); returns the frame.
+        """
+        tools = self._tools
+        # the only copy of the run (none at all for inplace copy-free DataTools)
+        df = tools._working_df(inplace)
+        runner = type(tools)(df, copy=False, n_jobs=tools.n_jobs, stats_cache_mb=tools.stats_cache_mb)
+        self._share_stats(tools, runner)
+
+        steps = self._optimized_steps()
+        self._prefetch_quartiles(runner, steps)
+        self.results = []
+        for step in steps:
+            name, params = step["method"], step["params"]
+            if name == "dropColumns":
+                runner._require_columns(params["columns"])
+                runner.df = runner.df.drop(columns=params["columns"])
+            elif name == "selectColumns":
+                runner._require_columns(params["columns"])
+                runner.df = runner.df[params["columns"]]
+            elif name in _QUERIES:
+                self.results.append(getattr(runner, name)(**params))
+            else:
+                getattr(runner, name)(**params, inplace=True)
+
+        result = tools._apply(runner.df, inplace)
+        if inplace:
+            self._share_stats(runner, tools)  # statistics of the result stay usable
+        return result
+
+    @staticmethod
+    def _share_stats(source, target):
+        """Give target the cached statistics of source (both hold frames with the same content)."""
+        if source.df is not source._stats_frame:
+            return
+        with source._stats_lock:
+            target._stats = source._stats.copy()
+            target._stats_bytes = source._stats_bytes
+        target._stats_frame = target.df
+
+    @staticmethod
+    def _prefetch_quartiles(runner, steps):
+        """
+        One quantile pass for every IQR step that reads columns no earlier step
+        has changed; the steps then find their quartiles in the cache.
+        """
+        if float(runner.stats_cache_mb or 0) <= 0:
+            return
+        numeric = set(runner._numeric_columns())
+        changed, todo = set(), []
+        for step in steps:
+            name, params = step["method"], step["params"]
+            if name in _FRAME_WIDE:
+                break
+            if name in _USES_QUARTILES and not params.get("approx"):
+                cols = params[_USES_QUARTILES[name]]
+                cols = sorted(numeric) if cols is None else cols
+                todo += [c for c in cols if c in numeric and c not in changed and c not in todo]
+            if name in _COLUMN_LOCAL:
+                target = params[_COLUMN_LOCAL[name]]
+                if target is None:
+                    break  # every later read may see changed data
+                changed.update([target] if isinstance(target, str) else target)
+        if todo:
+            runner._quartiles(todo)
+
+
+class LazyTools:
+    # ==========================================================
+    """SECTION: Lazy Pipelines"""
+    # ==========================================================
+    def lazy(self):
+        """
+        Start a lazy plan: transform calls are recorded and run together by collect().
+
+        Examples:
+            plan = dt.lazy()
+            plan.fillMissingValues("median", columns=["age"]).clip_outliers_iqr(columns=["salary"])
+            plan.scale(columns=["age", "salary"]).dropColumns("salary")
+            plan.explain()    # optimized steps
+            plan.collect()    # runs once, updates dt.df
+        """
+        return LazyPlan(self)
@@ -1,7 +1,76 @@
+import os
+
 import numpy as np
 import pandas as pd
 import base
 
+from row_index import RowHashIndex
+
+
+def _unpack(bits: np.ndarray, n: int) -> np.ndarray:
+    return np.unpackbits(bits, count=n).view(bool)
+
+
+def _rows_with_nulls(bits: list, at_least: int, n: int) -> np.ndarray:
+    """Rows null in at least `at_least` of the packed null bitmaps."""
+    if at_least <= 0:
+        return np.ones(n, dtype=bool)
+    if at_least > len(bits):
+        return np.zeros(n, dtype=bool)
+    if at_least == 1:  # any: OR of the packed bytes, 8 rows per operation
+        return _unpack(np.bitwise_or.reduce(bits), n)
+    if at_least == len(bits):  # all: AND
+        return _unpack(np.bitwise_and.reduce(bits), n)
+    counts = np.zeros(n, dtype=np.int32)
+    for b in bits:
+        counts += np.unpackbits(b, count=n)
+    return counts >= at_least
+
+
+def _kdtree():
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        raise ImportError("strategy='knn' requires scipy (pip install scipy).")
+    return cKDTree
+
+
+def _knn_fill(features: np.ndarray, targets: np.ndarray, k: int, block_size: int, workers: int = 1) -> np.ndarray:
+    """
+    Targets (n, t) with NaNs replaced by the mean of the k nearest donor rows in
+    feature space (n, f; NaN = not observed). Rows are grouped by which features
+    they have and which targets they miss; each group gets one KD-tree over the
+    rows that have those features and targets, queried block_size rows at a time.
+    Rows without any usable feature or donor keep their NaNs.
+    """
+    cKDTree = _kdtree()
+    out = targets.copy()
+    missing = np.isnan(targets)
+    need = np.flatnonzero(missing.any(axis=1))
+    if len(need) == 0:
+        return out
+    observed = ~np.isnan(features)
+    patterns, inverse = np.unique(np.hstack([observed[need], missing[need]]), axis=0, return_inverse=True)
+    n_features = features.shape[1]
+
+    for p, pattern in enumerate(patterns):
+        feats, fills = pattern[:n_features], pattern[n_features:]
+        if not feats.any():
+            continue
+        donors = np.flatnonzero(observed[:, feats].all(axis=1) & ~missing[:, fills].any(axis=1))
+        if len(donors) == 0:
+            continue
+        tree = cKDTree(features[np.ix_(donors, feats)])
+        donor_values = targets[np.ix_(donors, fills)]
+        rows = need[inverse.ravel() == p]
+        kk = min(k, len(donors))
+        for start in range(0, len(rows), block_size):
+            block = rows[start:start + block_size]
+            _, idx = tree.query(features[np.ix_(block, feats)], k=kk, workers=workers)
+            idx = idx.reshape(len(block), kk)
+            out[np.ix_(block, np.flatnonzero(fills))] = donor_values[idx].mean(axis=1)
+    return out
+
 
 class MissingTools:
     # ==========================================================
@@ -11,8 +80,8 @@ class MissingTools:
         """Count missing values in a column (or all columns if None)."""
         if column:
             self._require_columns(column)
-            return int(self.df[column].isna().sum())
-        return self.df.isna().sum()
+            return int(self._null_counts([column]).iloc[0])
+        return self._null_counts(self.df.columns)
 
     def dropMissingValues(self, *, axis: int = 0, thresh: int = None, columns=None, inplace: bool = True):
         """
@@ -28,31 +97,119 @@ class MissingTools:
         columns:
             only used when axis=0 (rows) to consider missing in a subset of columns
         """
-        new_df = self.df.copy()
-
         if axis not in (0, 1):
             raise ValueError("axis must be 0 (rows) or 1 (columns).")
 
+        n = len(self.df)
         if axis == 1:
-            new_df = new_df.dropna(axis=1, thresh=thresh)
-            return self._apply(new_df, inplace)
+            nulls = self._null_counts(self.df.columns).to_numpy()
+            keep = nulls == 0 if thresh is None else n - nulls >= thresh
+            new_df = self.df.loc[:, keep]
+            return self._apply(new_df, inplace, changed=list(self.df.columns[~keep]))
 
-        # axis == 0
+        # axis == 0: answered from the null bitmaps, which carry over to the kept rows
         if columns is None:
-            new_df = new_df.dropna(axis=0, thresh=thresh)
+            cols = list(self.df.columns)
         else:
             cols = self._ensure_list(columns)
             self._require_columns(cols)
-            new_df = new_df.dropna(axis=0, thresh=thresh, subset=cols)
+        bits = {c: self._null_bits(c) for c in cols}
+        at_least = 1 if thresh is None else len(cols) - thresh + 1  # nulls that drop a row
+        keep = ~_rows_with_nulls(list(bits.values()), at_least, n)
 
-        return self._apply(new_df, inplace)
+        result = self._apply(self.df[keep], inplace)
+        if inplace:
+            self._seed_null_bits(bits, keep)
+        return result
+
+    def missingMask(self, columns=None, *, how: str = "all", present=None) -> pd.Series:
+        """
+        Boolean mask of rows by missing-value pattern, from the null bitmaps.
+
+        how:
+            'all' => missing in every one of columns, 'any' => in at least one
+        present:
+            column or list of columns that must NOT be missing
 
-    def fillMissingValues(self, strategy: str = "mean", *, value=None, columns=None, inplace: bool = True):
+        Examples:
+            dt.df[dt.missingMask(["age", "salary"])]                    # missing both
+            dt.missingMask(["age", "salary"], how="any").sum()
+            dt.missingMask("salary", present="age")                     # salary missing, age known
+        """
+        if how not in ("all", "any"):
+            raise ValueError("how must be 'all' or 'any'.")
+        cols = list(self.df.columns) if columns is None else self._ensure_list(columns)
+        others = [] if present is None else self._ensure_list(present)
+        self._require_columns(cols + others)
+        n = len(self.df)
+        if cols:
+            bits = [self._null_bits(c) for c in cols]
+            packed = np.bitwise_and.reduce(bits) if how == "all" else np.bitwise_or.reduce(bits)
+        else:
+            packed = np.packbits(np.ones(n, dtype=bool))
+        if others:
+            packed = packed & ~np.bitwise_or.reduce([self._null_bits(c) for c in others])
+        return pd.Series(_unpack(packed, n), index=self.df.index, name="missing")
+
+    def missingPatterns(self, columns=None, top: int = None) -> pd.DataFrame:
+        """
+        Missing-value patterns and how many rows have each, most common first
+        (one True/False column per input column, True = missing).
+        """
+        cols = list(self.df.columns) if columns is None else self._ensure_list(columns)
+        self._require_columns(cols)
+        n = len(self.df)
+        # row key: the row's null bits, 64 columns per uint64 word
+        keys = np.zeros((n, max(1, -(-len(cols) // 64))), dtype=np.uint64)
+        for i, c in enumerate(cols):
+            keys[:, i // 64] |= np.unpackbits(self._null_bits(c), count=n).astype(np.uint64) << np.uint64(i % 64)
+        patterns, counts = np.unique(keys, axis=0, return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        patterns, counts = patterns[order], counts[order]
+        if top is not None:
+            patterns, counts = patterns[:top], counts[:top]
+        table = pd.DataFrame({
+            c: ((patterns[:, i // 64] >> np.uint64(i % 64)) & np.uint64(1)).astype(bool) for i, c in enumerate(cols)
+        })
+        table["count"] = counts
+        table["%"] = (counts / max(n, 1) * 100).round(2)
+        return table
+
+    def fillMissingValues(
+        self,
+        strategy: str = "mean",
+        *,
+        value=None,
+        columns=None,
+        inplace: bool = True,
+        copy: bool = None,
+        n_jobs: int = None,
+        approx=False,
+        time_col: str = None,
+        n_neighbors: int = 5,
+        features=None,
+        block_size: int = 65_536
+    ):
         """
         Fill missing values using ONE unified API.
 
         strategy:
             'mean' | 'median' | 'min' | 'max' | 'mode' | 'value'
+            | 'knn' | 'interpolate' | 'ffill' | 'bfill'
+
+        approx:
+            (median) True => median from a QuantileSketch (0.1% rank error; a float sets the error)
+
+        knn (numeric columns, requires scipy):
+            mean of the n_neighbors nearest rows by standardized features
+            (None => all numeric columns; only the features a row has are used).
+            Neighbors come from a KD-tree (n log n, not n^2); rows are searched
+            block_size at a time. Works best with a handful of features.
+
+        interpolate / ffill / bfill:
+            in row order, or in time order of time_col (datetime or numeric;
+            rows without a time are left as is). interpolate is linear in time
+            for numeric columns and only fills between two observed values.
 
         columns:
             None => apply to all columns, but numeric-only strategies will affect numeric columns only
@@ -63,9 +220,11 @@ class MissingTools:
             dt.fillMissingValues("median", columns=["age"])     # one numeric column
             dt.fillMissingValues("mode", columns=["city"])      # categorical
             dt.fillMissingValues("value", value=0)              # fill with constant
+            dt.fillMissingValues("knn", columns=["salary"], features=["age", "salary"])
+            dt.fillMissingValues("interpolate", columns=["salary"], time_col="join_date")
         """
         strategy = strategy.lower()
-        new_df = self.df.copy()
+        new_df = self._working_df(inplace, copy)
 
         # Decide target columns
         if columns is None:
@@ -77,67 +236,225 @@ class MissingTools:
         if strategy in ("mean", "median", "min", "max"):
             num_cols = self._numeric_columns(target_cols)
 
-            for c in num_cols:
-                if strategy == "mean":
-                    new_df[c] = new_df[c].fillna(new_df[c].mean())
-                elif strategy == "median":
-                    new_df[c] = new_df[c].fillna(new_df[c].median())
-                elif strategy == "min":
-                    new_df[c] = new_df[c].fillna(new_df[c].min())
-                elif strategy == "max":
-                    new_df[c] = new_df[c].fillna(new_df[c].max())
+            def filled(c):
+                # statistic of the untouched column (self.df) => cacheable
+                if approx and strategy == "median":
+                    fill = self._approx_quantiles(c, (0.5,), approx)[0]
+                else:
+                    fill = self._stat(c, strategy, lambda: getattr(self.df[c], strategy)())
+                return new_df[c].fillna(fill)
+
+            target_cols = num_cols
+            updates = self._map_columns(new_df, filled, num_cols, n_jobs)
 
         elif strategy == "mode":
-            for c in target_cols:
-                mode_vals = new_df[c].mode(dropna=True)
+            def filled(c):
+                mode_vals = self._stat(c, "mode", lambda: self.df[c].mode(dropna=True))
                 if len(mode_vals) == 0:
-                    continue
-                new_df[c] = new_df[c].fillna(mode_vals.iloc[0])
+                    return None
+                return new_df[c].fillna(mode_vals.iloc[0])
+
+            updates = self._map_columns(new_df, filled, target_cols, n_jobs)
 
         elif strategy == "value":
             if value is None:
                 raise ValueError("strategy='value' requires value=...")
-            for c in target_cols:
-                new_df[c] = new_df[c].fillna(value)
+            updates = self._map_columns(new_df, lambda c: new_df[c].fillna(value), target_cols, n_jobs)
 
-        else:
-            raise ValueError("Invalid strategy. Use: mean|median|min|max|mode|value")
+        elif strategy == "knn":
+            target_cols = self._numeric_columns(columns)
+            updates = self._knn_filled(new_df, target_cols, features, n_neighbors, block_size, n_jobs)
 
-        return self._apply(new_df, inplace)
+        elif strategy in ("interpolate", "ffill", "bfill"):
+            if strategy == "interpolate":
+                target_cols = self._numeric_columns(columns)
+            order = self._time_order(time_col)
+            updates = self._map_columns(
+                new_df, lambda c: self._ordered_fill(new_df[c], order, strategy, time_col), target_cols, n_jobs
+            )
 
-    def fillMissingGroupBy(self, group_col: str, target_col: str, *, strategy: str = "median", inplace: bool = True):
+        else:
+            raise ValueError("Invalid strategy. Use: mean|median|min|max|mode|value|knn|interpolate|ffill|bfill")
+
+        for c, values in updates:
+            if values is not None:
+                self._set_column(new_df, c, values)
+
+        return self._apply(new_df, inplace, changed=target_cols)
+
+    @staticmethod
+    def _as_dtype_of(column: pd.Series, values: np.ndarray) -> np.ndarray:
+        """Integer columns get rounded fills (mean of neighbors, interpolation)."""
+        if pd.api.types.is_integer_dtype(column.dtype):
+            return np.round(values)
+        return values
+
+    def _knn_filled(self, new_df, target_cols, features, n_neighbors, block_size, n_jobs):
+        if n_neighbors < 1:
+            raise ValueError("n_neighbors must be >= 1.")
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1.")
+        feature_cols = self._numeric_columns(features)
+        if not target_cols:
+            return []
+        if not feature_cols:
+            raise TypeError("strategy='knn' needs at least one numeric feature column.")
+
+        # standardized features, so no column dominates the distance by its units
+        mean = self._column_stats(feature_cols, "mean", lambda d: d.mean())
+        std = self._column_stats(feature_cols, "std0", lambda d: d.astype(float).std(ddof=0))
+        std = std.replace(0, 1).fillna(1)
+        X = np.column_stack([
+            (self.df[c].to_numpy(dtype=float, na_value=np.nan) - mean[c]) / std[c] for c in feature_cols
+        ])
+        Y = np.column_stack([new_df[c].to_numpy(dtype=float, na_value=np.nan) for c in target_cols])
+        filled = _knn_fill(X, Y, n_neighbors, block_size, workers=self._resolve_n_jobs(n_jobs))
+        return [
+            (c, new_df[c].fillna(pd.Series(self._as_dtype_of(new_df[c], filled[:, i]), index=new_df.index)))
+            for i, c in enumerate(target_cols)
+        ]
+
+    def _time_order(self, time_col):
+        """Row positions in time order (rows with a missing time left out), cached; None => row order."""
+        if time_col is None:
+            return None
+        self._require_columns(time_col)
+        t = self.df[time_col]
+        if not (pd.api.types.is_datetime64_any_dtype(t.dtype) or pd.api.types.is_numeric_dtype(t.dtype)):
+            raise TypeError(f"time_col '{time_col}' must be a datetime or numeric column.")
+
+        def compute():
+            order = np.argsort(t.to_numpy(), kind="stable")
+            return order[t.notna().to_numpy()[order]]
+        return self._stat(time_col, "time_order", compute)
+
+    def _ordered_fill(self, s: pd.Series, order, strategy, time_col):
+        """ffill / bfill / interpolate of one column along order (None => row order)."""
+        if not s.isna().any():
+            return None
+        positions = np.arange(len(s)) if order is None else order
+        ordered = s.iloc[positions]
+        if strategy in ("ffill", "bfill"):
+            values = getattr(ordered.reset_index(drop=True), strategy)()
+        else:
+            y = ordered.to_numpy(dtype=float, na_value=np.nan, copy=True)
+            if order is None:
+                x = positions.astype(float)
+            else:
+                t = self.df[time_col].iloc[positions]
+                x = (t.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+                     if pd.api.types.is_datetime64_any_dtype(t.dtype) else t.to_numpy(dtype=float))
+            known = np.flatnonzero(~np.isnan(y))
+            if len(known) < 2:
+                return None
+            inside = np.isnan(y)
+            inside[:known[0]] = inside[known[-1] + 1:] = False
+            y[inside] = np.interp(x[inside], x[known], y[known])
+            values = pd.Series(self._as_dtype_of(s, y))
+        result = s.copy()
+        result.iloc[positions] = values.to_numpy()
+        return result
+
+    def fillMissingGroupBy(self, group_col, target_col, *, strategy: str = "median", fallback: bool = True,
+                           inplace: bool = True, copy: bool = None):
         """
-        Fill missing values in target_col based on groups in group_col.
+        Fill missing values in target column(s) based on groups of one or more key columns.
         strategy: 'mean' | 'median' | 'mode'
-        """
-        self._require_columns([group_col, target_col])
-        strategy = strategy.lower()
 
-        new_df = self.df.copy()
+        group_col:
+            key column or list of keys, finest grouping = all keys together
+        target_col:
+            column or list of columns; fill values for all of them come from one
+            groupby over the keys (mode: one count of (group, value) pairs per target)
+        fallback:
+            rows whose group has no value are filled from coarser groupings,
+            dropping the last key each time: [region, city, store] => [region, city] => [region]
 
-        if strategy in ("mean", "median"):
-            if not pd.api.types.is_numeric_dtype(new_df[target_col]):
-                raise TypeError(f"target_col '{target_col}' must be numeric for {strategy}.")
-
-            if strategy == "mean":
-                filler = new_df.groupby(group_col)[target_col].transform("mean")
-            else:
-                filler = new_df.groupby(group_col)[target_col].transform("median")
-
-            new_df[target_col] = new_df[target_col].fillna(filler)
-
-        elif strategy == "mode":
-            def mode_of_group(s):
-                m = s.mode(dropna=True)
-                return m.iloc[0] if len(m) else np.nan
-
-            filler = new_df.groupby(group_col)[target_col].transform(mode_of_group)
-            new_df[target_col] = new_df[target_col].fillna(filler)
-
-        else:
+        Examples:
+            dt.fillMissingGroupBy("user_id", "rating", strategy="mode")
+            dt.fillMissingGroupBy(["region", "city"], ["unit_price", "shipping_cost"])
+        """
+        keys = self._ensure_list(group_col)
+        targets = self._ensure_list(target_col)
+        if not keys or not targets:
+            raise ValueError("group_col and target_col must name at least one column each.")
+        self._require_columns(keys + targets)
+        overlap = set(keys) & set(targets)
+        if overlap:
+            raise ValueError(f"Column(s) {sorted(overlap)} cannot be both a group key and a target.")
+        strategy = strategy.lower()
+        if strategy not in ("mean", "median", "mode"):
             raise ValueError("strategy must be: mean | median | mode")
-
-        return self._apply(new_df, inplace)
+        if strategy in ("mean", "median"):
+            for t in targets:
+                if not pd.api.types.is_numeric_dtype(self.df[t]):
+                    raise TypeError(f"target_col '{t}' must be numeric for {strategy}.")
+
+        new_df = self._working_df(inplace, copy)
+        levels = [keys[:i] for i in range(len(keys), 0, -1)] if fallback else [keys]
+
+        for t in targets:
+            filled = new_df[t]
+            for level in levels:
+                missing = filled.isna().to_numpy()
+                if not missing.any():
+                    break
+                fill = self._group_fill_values(level, t, strategy)
+                filled = filled.where(~missing, pd.Series(fill, index=new_df.index))
+            self._set_column(new_df, t, filled)
+
+        return self._apply(new_df, inplace, changed=targets)
+
+    def _group_ids(self, keys):
+        """Group number of every row for these keys (-1 => a key is missing), cached."""
+        def compute():
+            ids = self.df.groupby(keys, sort=False, dropna=True, observed=True).ngroup()
+            return np.nan_to_num(ids.to_numpy(dtype=float), nan=-1).astype(np.int64)
+        return self._stat(keys, "group_ids", compute)
+
+    def _group_fill_values(self, keys, target, strategy):
+        """Per-row fill value: the target's mean / median / mode within the row's group (NA if none)."""
+        ids = self._group_ids(keys)
+
+        def compute():
+            if strategy in ("mean", "median"):
+                per_group = self.df.groupby(keys, sort=False, dropna=True, observed=True)[target].agg(strategy)
+                return per_group.to_numpy(dtype=float)
+            return self._group_modes(ids, self.df[target])
+
+        per_group = self._stat(keys + [target], ("group", strategy), compute)
+        if strategy == "mode":
+            codes, uniques = per_group
+            codes = np.where(ids >= 0, codes[np.maximum(ids, 0)], -1)
+            return pd.api.extensions.take(uniques, codes, allow_fill=True)
+        values = np.take(per_group, np.maximum(ids, 0))
+        return np.where(ids >= 0, values, np.nan)
+
+    @staticmethod
+    def _group_modes(ids, values: pd.Series):
+        """
+        Most frequent value per group from counts of (group, value) pairs
+        (ties => smallest value, like Series.mode). Returns (value code per group, values).
+        """
+        try:
+            codes, uniques = pd.factorize(values, sort=True)
+        except TypeError:  # unorderable mix of types
+            codes, uniques = pd.factorize(values)
+        uniques = uniques.array  # Index.take ignores allow_fill
+        n_groups = int(ids.max()) + 1 if len(ids) else 0
+        modes = np.full(n_groups, -1, dtype=np.int64)
+        present = (ids >= 0) & (codes >= 0)
+        if not present.any():
+            return modes, uniques
+
+        width = np.int64(len(uniques))
+        pairs, counts = np.unique(ids[present] * width + codes[present], return_counts=True)
+        group, value = np.divmod(pairs, width)
+        # per group: highest count first, then smallest value
+        order = np.lexsort((value, -counts, group))
+        first = order[np.r_[True, group[order][1:] != group[order][:-1]]]
+        modes[group[first]] = value[first]
+        return modes, uniques
 
     def dropDuplicates(self, columns=None, *, inplace: bool = True, keep="first"):
         """
@@ -154,6 +471,35 @@ class MissingTools:
 
         return self._apply(new_df, inplace)
 
+    def dropSeenRows(self, index, *, columns=None, update: bool = True, verify: bool = False,
+                     inplace: bool = True):
+        """
+        Drop rows recorded in a RowHashIndex (earlier loads) and rows repeating an
+        earlier row of this frame, without concatenating any history.
+
+        index:
+            RowHashIndex, or path of an index file (created when missing, saved
+            after the update)
+        columns / verify:
+            settings of a new index file (see RowHashIndex)
+        update:
+            record the kept rows in the index
+
+        Examples:
+            dt.importData("orders_2026-10-17.csv")
+            dt.dropSeenRows("orders_seen.npz", columns=["order_id"])
+        """
+        path = index if isinstance(index, str) else None
+        if path is not None:
+            index = RowHashIndex.load(path) if os.path.exists(path) else RowHashIndex(columns, verify=verify)
+        elif not isinstance(index, RowHashIndex):
+            raise TypeError("index must be a RowHashIndex or the path of an index file.")
+
+        seen = index.update(self.df) if update else index.duplicated(self.df)
+        if path is not None and update:
+            index.save(path)
+        return self._apply(self.df[~seen], inplace)
+
     def missingColumns(self,threshold:float = 0.5):
         """
             Return columns where missing-value ratio >= threshold.
@@ -165,7 +511,8 @@ class MissingTools:
         if not (0 <= threshold <= 1):
             raise ValueError("threshold must be between 0 and 1.")
 
-        missing_ratio = self.df.isna().mean()
+        null_count = self._null_counts(self.df.columns)
+        missing_ratio = null_count / len(self.df)
         return missing_ratio[missing_ratio >= threshold].index.tolist()
 
     def missingRows(self, threshold: float = 0.5, columns=None):
@@ -183,11 +530,15 @@ class MissingTools:
             raise ValueError("threshold must be between 0 and 1.")
 
         if columns is None:
-            subset_df = self.df
+            cols = list(self.df.columns)
         else:
             cols = self._ensure_list(columns)
             self._require_columns(cols)
-            subset_df = self.df[cols]
-
-        missing_ratio = subset_df.isna().mean(axis=1)
-        return self.df.loc[missing_ratio >= threshold]
+        if not cols:
+            return self.df.iloc[:0]
+
+        # fewest nulls with ratio >= threshold; then bitwise ops / counts instead of a float mean
+        k = len(cols)
+        at_least = int(np.argmax(np.arange(k + 1) / k >= threshold))
+        mask = _rows_with_nulls([self._null_bits(c) for c in cols], at_least, len(self.df))
+        return self.df.loc[mask]
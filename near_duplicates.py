@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+from eda import _mix64
+
+
+"""
+Near-duplicate text
+-------------------
+MinHash signatures of character shingles plus locality-sensitive hashing
+(LSH) find rows whose text is nearly the same, e.g. spam reviews that only
+differ by "!!!" or "??", without comparing every pair of rows.
+
+    clusters = dt.nearDuplicateClusters("review_text", threshold=0.8)
+    dt.dropNearDuplicates("review_text", threshold=0.8)
+
+Text is normalized first (lowercase, punctuation removed, spaces collapsed),
+and every distinct normalized text is signed once.
+"""
+
+_MAX_SHINGLE = 8  # shingles are packed into one 64-bit word
+
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz  # np.trapz before numpy 2
+
+
+def _normalize(texts: pd.Series) -> pd.Series:
+    s = texts.astype("string").str.lower()
+    s = s.str.replace(r"[^\w\s]", "", regex=True)
+    return s.str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def shingle_hashes(texts, k: int = 5):
+    """
+    Hashed character k-grams (k <= 8 bytes of UTF-8) of every text.
+    Returns (hashes, starts): the shingles of text i are hashes[starts[i]:starts[i + 1]].
+    Texts shorter than k give one shingle of the whole text (empty text => none).
+    """
+    if not 1 <= k <= _MAX_SHINGLE:
+        raise ValueError(f"shingle_size must be between 1 and {_MAX_SHINGLE}.")
+    encoded = [t.encode("utf-8") for t in texts]
+    lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    # one word per byte position: the k bytes starting there (zero-padded past the end)
+    padded = np.concatenate([buf, np.zeros(k, dtype=np.uint64)])
+    words = np.zeros(len(buf), dtype=np.uint64)
+    for j in range(k):
+        words |= padded[j:j + len(buf)] << np.uint64(8 * j)
+
+    # k-grams fully inside their text, or the whole text when it is shorter than k
+    counts = np.where(lengths >= k, lengths - k + 1, np.minimum(lengths, 1))
+    doc = np.repeat(np.arange(len(lengths)), counts)
+    pos = offsets[:-1][doc] + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+    # texts shorter than k: keep only their own bytes
+    size = np.minimum(lengths[doc], k).astype(np.uint64)
+    width = size * np.uint64(8)
+    keep = np.where(width >= 64, ~np.uint64(0), (np.uint64(1) << np.minimum(width, np.uint64(63))) - np.uint64(1))
+    grams = words[pos] & keep
+    starts = np.concatenate([[0], np.cumsum(counts)])
+    # shingle size mixed in keeps "ab" and "ab\0" apart
+    with np.errstate(over="ignore"):
+        return _mix64(grams + size * np.uint64(0x9E3779B97F4A7C15)), starts
+
+
+def minhash_signatures(hashes: np.ndarray, starts: np.ndarray, num_perm: int = 128, seed: int = 0) -> np.ndarray:
+    """
+    (n_texts, num_perm) uint32 MinHash signatures from shingle_hashes() output.
+    Permutations are multiply-shift hashes of the shingle hashes; texts without
+    shingles get an all-max signature.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+    b = rng.integers(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+    n = len(starts) - 1
+    signatures = np.full((n, num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    nonempty = np.flatnonzero(np.diff(starts) > 0)
+    if len(hashes) == 0:
+        return signatures
+    with np.errstate(over="ignore"):
+        for p in range(num_perm):
+            values = ((hashes * a[p] + b[p]) >> np.uint64(32)).astype(np.uint32)
+            signatures[nonempty, p] = np.minimum.reduceat(values, starts[nonempty])
+    return signatures
+
+
+def lsh_params(threshold: float, num_perm: int):
+    """(bands, rows per band) minimizing false positive + false negative probability mass."""
+    s = np.linspace(0, 1, 1001)
+    best, best_err = None, np.inf
+    for r in range(1, num_perm + 1):
+        if num_perm % r:
+            continue
+        b = num_perm // r
+        p = 1 - (1 - s ** r) ** b  # probability to become candidates at Jaccard s
+        err = _trapezoid(np.where(s < threshold, p, 1 - p), s)
+        if err < best_err:
+            best, best_err = (b, r), err
+    return best
+
+
+def _components(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Connected component label (smallest member) of n nodes joined by edges u-v."""
+    parent = np.arange(n)
+    while True:
+        pu, pv = parent[u], parent[v]
+        differ = pu != pv
+        if not differ.any():
+            return parent
+        np.minimum.at(parent, np.maximum(pu, pv)[differ], np.minimum(pu, pv)[differ])
+        while True:  # pointer jumping: every node points at its root
+            nxt = parent[parent]
+            if np.array_equal(nxt, parent):
+                break
+            parent = nxt
+
+
+def lsh_clusters(signatures: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Cluster label per signature row: rows sharing an LSH band bucket whose
+    estimated Jaccard similarity (matching signature positions) reaches the
+    threshold are joined, transitively.
+    """
+    n, num_perm = signatures.shape
+    bands, rows = lsh_params(threshold, num_perm)
+    u_parts, v_parts = [], []
+    for band in range(bands):
+        key = np.zeros(n, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for col in signatures[:, band * rows:(band + 1) * rows].T:
+                key = _mix64(key ^ col.astype(np.uint64))
+        order = np.argsort(key, kind="stable")
+        sorted_key = key[order]
+        first = np.r_[True, sorted_key[1:] != sorted_key[:-1]]
+        # pair every bucket member with the bucket's first member
+        head = order[np.flatnonzero(first)[np.cumsum(first) - 1]]
+        pair = head != order
+        u_parts.append(order[pair])
+        v_parts.append(head[pair])
+
+    u = np.concatenate(u_parts) if u_parts else np.empty(0, dtype=np.int64)
+    v = np.concatenate(v_parts) if v_parts else np.empty(0, dtype=np.int64)
+    if len(u):
+        pairs = np.unique(np.stack([u, v], axis=1), axis=0)
+        u, v = pairs[:, 0], pairs[:, 1]
+        # drop band collisions below the threshold
+        similar = np.empty(len(u), dtype=bool)
+        for start in range(0, len(u), 65_536):
+            stop = start + 65_536
+            similar[start:stop] = (signatures[u[start:stop]] == signatures[v[start:stop]]).mean(axis=1) >= threshold
+        u, v = u[similar], v[similar]
+    return _components(n, u, v)
+
+
+class NearDuplicateTools:
+    # ==========================================================
+    """SECTION: Near-Duplicate Text (MinHash / LSH)"""
+    # ==========================================================
+    def nearDuplicateClusters(self, columns, *, threshold: float = 0.8, shingle_size: int = 5,
+                              num_perm: int = 128, seed: int = 0) -> pd.Series:
+        """
+        Cluster id per row; rows whose text is a near duplicate (estimated Jaccard
+        similarity of character shingles >= threshold) share an id. Rows without
+        text get -1.
+
+        columns:
+            text column or list of columns (joined per row)
+        shingle_size:
+            characters per shingle (1..8); smaller => more tolerant of small edits
+        num_perm:
+            MinHash size; more => more accurate similarity estimates, slower
+
+        Examples:
+            dt.df["dup_cluster"] = dt.nearDuplicateClusters("review_text", threshold=0.7)
+        """
+        cols = self._ensure_list(columns)
+        self._require_columns(cols)
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1].")
+        if num_perm < 1:
+            raise ValueError("num_perm must be >= 1.")
+
+        text = _normalize(self.df[cols[0]])
+        for c in cols[1:]:
+            text = text.str.cat(_normalize(self.df[c]), sep=" | ", na_rep="")
+        text = text.mask(text.str.len() == 0)
+
+        # each distinct normalized text is shingled and signed once
+        codes, uniques = pd.factorize(text)
+        hashes, starts = shingle_hashes(list(uniques), shingle_size)
+        signatures = minhash_signatures(hashes, starts, num_perm, seed)
+        labels = lsh_clusters(signatures, threshold)
+
+        # renumber 0, 1, 2... in order of first appearance
+        present = codes >= 0
+        clusters = np.full(len(codes), -1, dtype=np.int64)
+        clusters[present] = pd.factorize(labels[codes[present]])[0]
+        return pd.Series(clusters, index=self.df.index, name="cluster")
+
+    def dropNearDuplicates(self, columns, *, threshold: float = 0.8, keep: str = "first",
+                           shingle_size: int = 5, num_perm: int = 128, seed: int = 0, inplace: bool = True):
+        """
+        Keep one row per near-duplicate cluster (see nearDuplicateClusters).
+        keep: 'first' | 'last'. Rows without text are always kept.
+        """
+        if keep not in ("first", "last"):
+            raise ValueError("keep must be 'first' or 'last'.")
+        clusters = self.nearDuplicateClusters(columns, threshold=threshold, shingle_size=shingle_size,
+                                              num_perm=num_perm, seed=seed)
+        drop = clusters.duplicated(keep=keep).to_numpy() & (clusters.to_numpy() >= 0)
+        return self._apply(self.df[~drop], inplace)
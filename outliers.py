@@ -1,22 +1,36 @@
 import numpy as np
+import pandas as pd
 
 
 class OutliersTools:
     # ==========================================================
     """SECTION: Outliers Detection (IQR)"""
     # ==========================================================
-    def outlier_mask_iqr(self, columns=None, k: float = 1.5):
+    def _quartiles(self, num_cols, approx=False):
+        """(q1, q3) Series for numeric columns, through the statistics cache."""
+        if approx:
+            quartiles = pd.Series({c: self._approx_quantiles(c, (0.25, 0.75), approx) for c in num_cols}, dtype=object)
+        else:
+            quartiles = self._column_stats(
+                num_cols, "quartiles",
+                lambda d: pd.Series({c: tuple(v) for c, v in d.quantile([0.25, 0.75]).items()}, dtype=object)
+            )
+        q1 = pd.Series([q[0] for q in quartiles], index=quartiles.index, dtype=float)
+        q3 = pd.Series([q[1] for q in quartiles], index=quartiles.index, dtype=float)
+        return q1, q3
+
+    def outlier_mask_iqr(self, columns=None, k: float = 1.5, *, approx=False):
         """
         Return boolean mask of rows that contain outliers using IQR in given numeric columns.
         columns=None => all numeric columns.
+        approx=True => quartiles from a QuantileSketch (0.1% rank error; a float sets the error).
         """
         num_cols = self._numeric_columns(columns)
         if len(num_cols) == 0:
             raise TypeError("No numeric columns to detect outliers.")
 
         numeric_df = self.df[num_cols]
-        q1 = numeric_df.quantile(0.25)
-        q3 = numeric_df.quantile(0.75)
+        q1, q3 = self._quartiles(num_cols, approx)
         iqr = q3 - q1
 
         lower = q1 - k * iqr
@@ -24,31 +38,59 @@ class OutliersTools:
 
         return ((numeric_df < lower) | (numeric_df > upper)).any(axis=1)
 
-    def detect_outliers_iqr(self, columns=None, k: float = 1.5):
+    def detect_outliers_iqr(self, columns=None, k: float = 1.5, *, approx=False):
         """Return rows that are outliers (based on IQR mask)."""
-        mask = self.outlier_mask_iqr(columns=columns, k=k)
+        mask = self.outlier_mask_iqr(columns=columns, k=k, approx=approx)
         return self.df[mask]
 
-    def clip_outliers_iqr(self, columns=None, k: float = 1.5, inplace: bool = True):
+    def clip_outliers_iqr(self, columns=None, k: float = 1.5, inplace: bool = True, copy: bool = None,
+                          n_jobs: int = None, approx=False):
         """
         Clip numeric columns to IQR bounds (winsorizing-like).
         Useful instead of dropping outliers.
+        approx=True => quartiles from a QuantileSketch (0.1% rank error; a float sets the error).
         """
         num_cols = self._numeric_columns(columns)
-        new_df = self.df.copy()
-
-        numeric_df = new_df[num_cols]
-        q1 = numeric_df.quantile(0.25)
-        q3 = numeric_df.quantile(0.75)
-        iqr = q3 - q1
-
-        lower = q1 - k * iqr
-        upper = q3 + k * iqr
-
-        for c in num_cols:
-            new_df[c] = new_df[c].clip(lower[c], upper[c])
-
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        kept = {}  # column => quartiles still valid after the clip
+
+        # per-column statistics: never materialize a copy of the whole numeric block
+        def clipped(c):
+            if approx:
+                q1, q3 = self._approx_quantiles(c, (0.25, 0.75), approx)
+            else:
+                q1, q3 = self._stat(c, "quartiles", lambda: tuple(self.df[c].quantile([0.25, 0.75])))
+            iqr = q3 - q1
+            lower, upper = q1 - k * iqr, q3 + k * iqr
+            s = new_df[c]
+            if not approx and k >= 0 and self._clip_keeps_quartiles(s, lower, upper):
+                kept[c] = (q1, q3)
+            return s.clip(lower, upper)
+
+        for c, values in self._map_columns(new_df, clipped, num_cols, n_jobs):
+            if values is not None:
+                self._set_column(new_df, c, values)
+
+        result = self._apply(new_df, inplace, changed=num_cols)
+        if inplace:
+            # e.g. a second clip of the same columns (lazy plans) needs no new quantile pass
+            for c, q in kept.items():
+                self._stat(c, "quartiles", lambda q=q: q)
+        return result
+
+    @staticmethod
+    def _clip_keeps_quartiles(s: pd.Series, lower, upper) -> bool:
+        """
+        True when clipping to [lower, upper] leaves the 25% / 75% quantiles unchanged:
+        clipping keeps the sort order, so they only move if a clipped value is one
+        of the order statistics they interpolate between.
+        """
+        values = s.to_numpy(dtype=float, na_value=np.nan)
+        m = int(np.count_nonzero(~np.isnan(values)))
+        if m == 0:
+            return True
+        below, above = int((values < lower).sum()), int((values > upper).sum())
+        return np.floor(0.25 * (m - 1)) >= below and np.ceil(0.75 * (m - 1)) <= m - 1 - above
 
     # ==========================================================
     """SECTION: Outliers Detection (Z-score)"""
@@ -63,8 +105,8 @@ class OutliersTools:
             raise TypeError("No numeric columns to detect outliers.")
 
         df_num = self.df[num_cols].astype(float)
-        mean = df_num.mean()
-        std = df_num.std(ddof=0)
+        mean = self._column_stats(num_cols, "mean", lambda d: d.mean())
+        std = self._column_stats(num_cols, "std0", lambda d: d.astype(float).std(ddof=0))
 
         std_replaced = std.replace(0, np.nan)
         zscores = (df_num - mean) / std_replaced
@@ -77,21 +119,21 @@ class OutliersTools:
         mask = self.outlier_mask_zscore(columns=columns, z=z)
         return self.df[mask]
 
-    def clip_outliers_zscore(self, columns=None, *, z: float = 3.0, inplace: bool = True):
+    def clip_outliers_zscore(self, columns=None, *, z: float = 3.0, inplace: bool = True, copy: bool = None,
+                             n_jobs: int = None):
         """
         Clip numeric columns to mean ± z*std.
         """
         num_cols = self._numeric_columns(columns)
-        new_df = self.df.copy()
-
-        df_num = new_df[num_cols].astype(float)
-        mean = df_num.mean()
-        std = df_num.std(ddof=0)
+        new_df = self._working_df(inplace, copy)
 
-        lower = mean - z * std
-        upper = mean + z * std
+        def clipped(c):
+            mean = self._stat(c, "mean", lambda: self.df[c].mean())
+            std = self._stat(c, "std0", lambda: self.df[c].astype(float).std(ddof=0))
+            return new_df[c].clip(mean - z * std, mean + z * std)
 
-        for c in num_cols:
-            new_df[c] = new_df[c].clip(lower[c], upper[c])
+        for c, values in self._map_columns(new_df, clipped, num_cols, n_jobs):
+            if values is not None:
+                self._set_column(new_df, c, values)
 
-        return self._apply(new_df, inplace)
+        return self._apply(new_df, inplace, changed=num_cols)
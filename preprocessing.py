@@ -0,0 +1,733 @@
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+
+from base import BaseTools
+from missing import MissingTools
+from sketches import QuantileSketch
+from text_cleaning import TextCleaningTools
+
+
+"""
+Fitted preprocessing
+--------------------
+A Preprocessor records the same transforms DataTools offers, learns their
+statistics ONCE with fit(), and replays them on new batches with transform().
+
+    pre = Preprocessor()
+    pre.fillMissingValues("median", columns=["age", "salary"])
+    pre.clip_outliers_iqr(columns=["salary"]).scale(columns=["age", "salary"])
+    pre.labelEncode("city").oneHotEncode(["department"])
+
+    pre.fit(train_df)                # means, medians, bounds, vocabularies...
+    scored = pre.transform(batch)    # no statistics recomputed on the batch
+    pre.save("prep.json")            # Preprocessor.load("prep.json") later
+
+Statistics are learned step by step on the output of the previous steps,
+so fit(train).transform(train) matches running the same DataTools calls.
+fit_chunks() learns the same statistics from a stream of chunks
+(medians / IQR bounds through QuantileSketch).
+"""
+
+
+class _Runner(BaseTools, MissingTools, TextCleaningTools):
+    """Copy-free tools used to run the stateless steps."""
+    pass
+
+
+def _tools(df: pd.DataFrame) -> _Runner:
+    """Wrap df (without copying) to reuse the DataTools validation and transforms."""
+    return _Runner(df, copy=False)
+
+
+def _mode_from_counts(counts: pd.Series) -> pd.Series:
+    """(group, value) -> count  =>  most frequent value per group (ties => smallest, like Series.mode)."""
+    counts = counts.rename("n").reset_index()
+    group_col, target_col = counts.columns[0], counts.columns[1]
+    counts = counts.sort_values(["n", target_col], ascending=[False, True], kind="stable")
+    first = counts.drop_duplicates(group_col)
+    return pd.Series(first[target_col].to_numpy(), index=first[group_col].to_numpy())
+
+
+def _group_mode(df: pd.DataFrame, group_col: str, target_col: str) -> pd.Series:
+    """Most frequent target value per group."""
+    return _mode_from_counts(df.groupby([group_col, target_col], dropna=True).size())
+
+
+def _fill_columns(df, p):
+    """Resolve fillMissingValues target columns (numeric strategies => numeric columns only)."""
+    tools = _tools(df)
+    numeric = p["strategy"] in ("mean", "median", "min", "max")
+    if p["columns"] is None:
+        return tools._numeric_columns() if numeric else list(df.columns)
+    cols = tools._ensure_list(p["columns"])
+    tools._require_columns(cols)
+    return tools._numeric_columns(cols) if numeric else cols
+
+
+def _one_hot_columns(df, p):
+    """Resolve oneHotEncode columns (None => object/category columns)."""
+    if p["columns"] is None:
+        return list(df.select_dtypes(include=["object", "category"]).columns)
+    tools = _tools(df)
+    cols = tools._ensure_list(p["columns"])
+    tools._require_columns(cols)
+    return cols
+
+
+def _drop_columns_for(non_null: pd.Series, n_rows: int, thresh):
+    """Columns dropna(axis=1, thresh) would drop, from non-null counts."""
+    limit = n_rows if thresh is None else thresh
+    return list(non_null[non_null < limit].index)
+
+
+# ==========================================================
+"""SECTION: Fit functions (df, params) -> state"""
+# ==========================================================
+def _fit_fill(df, p):
+    strategy = p["strategy"]
+    cols = _fill_columns(df, p)
+    if strategy in ("mean", "median", "min", "max"):
+        fill = getattr(df[cols], strategy)()
+    elif strategy == "mode":
+        fill = {}
+        for c in cols:
+            mode_vals = df[c].mode(dropna=True)
+            if len(mode_vals):
+                fill[c] = mode_vals.iloc[0]
+        fill = pd.Series(fill, dtype=object)
+    else:
+        fill = pd.Series({c: p["value"] for c in cols}, dtype=object)
+    return {"fill": fill.dropna()}
+
+
+def _fit_fill_group(df, p):
+    g, t, strategy = p["group_col"], p["target_col"], p["strategy"]
+    _tools(df)._require_columns([g, t])
+    if strategy in ("mean", "median"):
+        if not pd.api.types.is_numeric_dtype(df[t]):
+            raise TypeError(f"target_col '{t}' must be numeric for {strategy}.")
+        values = df.groupby(g)[t].agg(strategy)
+    else:
+        values = _group_mode(df, g, t)
+    return {"values": values.dropna()}
+
+
+def _fit_scale(df, p):
+    cols = _tools(df)._numeric_columns(p["columns"])
+    num = df[cols].astype(float)
+    if p["method"] == "standard":
+        center, width = num.mean(), num.std(ddof=0)
+    else:
+        center, width = num.min(), num.max() - num.min()
+    keep = (width != 0) & width.notna() & center.notna()
+    return {"center": center[keep], "width": width[keep]}
+
+
+def _fit_clip_iqr(df, p):
+    cols = _tools(df)._numeric_columns(p["columns"])
+    q = df[cols].quantile([0.25, 0.75])
+    q1, q3 = q.loc[0.25], q.loc[0.75]
+    iqr = q3 - q1
+    return {"lower": q1 - p["k"] * iqr, "upper": q3 + p["k"] * iqr}
+
+
+def _fit_clip_zscore(df, p):
+    cols = _tools(df)._numeric_columns(p["columns"])
+    num = df[cols].astype(float)
+    mean, std = num.mean(), num.std(ddof=0)
+    return {"lower": mean - p["z"] * std, "upper": mean + p["z"] * std}
+
+
+def _fit_label(df, p):
+    _tools(df)._require_columns(p["column"])
+    uniques = sorted(df[p["column"]].astype("string").dropna().unique())
+    return {"categories": list(uniques)}
+
+
+def _fit_one_hot(df, p):
+    cols = _one_hot_columns(df, p)
+    return {"vocab": {c: list(pd.Categorical(df[c].dropna()).categories) for c in cols}}
+
+
+def _fit_drop_missing(df, p):
+    if p["axis"] == 0:
+        return {}
+    return {"drop": _drop_columns_for(df.notna().sum(), len(df), p["thresh"])}
+
+
+def _fit_stateless(df, p):
+    return {}
+
+
+# ==========================================================
+"""SECTION: Transform functions (df, params, state) -> df"""
+# ==========================================================
+def _transform_fill(df, p, s):
+    fill = s["fill"]
+    _tools(df)._require_columns(list(fill.index))
+    for c, v in fill.items():
+        df[c] = df[c].fillna(v)
+    return df
+
+
+def _transform_fill_group(df, p, s):
+    g, t = p["group_col"], p["target_col"]
+    _tools(df)._require_columns([g, t])
+    df[t] = df[t].fillna(df[g].map(s["values"]))
+    return df
+
+
+def _transform_scale(df, p, s):
+    cols = list(s["center"].index)
+    _tools(df)._require_columns(cols)
+    df[cols] = (df[cols].astype(float) - s["center"]) / s["width"]
+    return df
+
+
+def _transform_clip(df, p, s):
+    cols = list(s["lower"].index)
+    _tools(df)._require_columns(cols)
+    df[cols] = df[cols].clip(s["lower"], s["upper"], axis=1)
+    return df
+
+
+def _transform_label(df, p, s):
+    c = p["column"]
+    _tools(df)._require_columns(c)
+    codes = pd.Index(s["categories"], dtype="string").get_indexer(df[c].astype("string"))
+    # integer codes as labelEncode gives; always nullable Int64 (missing / unseen
+    # category => <NA>) so every batch has the same dtype
+    df[c] = pd.arrays.IntegerArray(codes.astype(np.int64), codes < 0)
+    return df
+
+
+def _transform_one_hot(df, p, s):
+    vocab = s["vocab"]
+    if not vocab:
+        return df
+    _tools(df)._require_columns(list(vocab))
+    for c, categories in vocab.items():
+        df[c] = pd.Categorical(df[c], categories=categories)  # unseen => all-zero row
+    return pd.get_dummies(df, columns=list(vocab), drop_first=p["drop_first"])
+
+
+def _transform_drop_missing(df, p, s):
+    if p["axis"] == 1:
+        return df.drop(columns=[c for c in s["drop"] if c in df.columns])
+    return _tools(df).dropMissingValues(axis=0, thresh=p["thresh"], columns=p["columns"], inplace=True)
+
+
+def _transform_clean_text(df, p, s):
+    return _tools(df).cleanText(**p, inplace=True)
+
+
+_STEPS = {
+    "fillMissingValues": (_fit_fill, _transform_fill),
+    "fillMissingGroupBy": (_fit_fill_group, _transform_fill_group),
+    "scale": (_fit_scale, _transform_scale),
+    "clip_outliers_iqr": (_fit_clip_iqr, _transform_clip),
+    "clip_outliers_zscore": (_fit_clip_zscore, _transform_clip),
+    "labelEncode": (_fit_label, _transform_label),
+    "oneHotEncode": (_fit_one_hot, _transform_one_hot),
+    "dropMissingValues": (_fit_drop_missing, _transform_drop_missing),
+    "cleanText": (_fit_stateless, _transform_clean_text),
+}
+
+
+# ==========================================================
+"""SECTION: Chunk reducers (init, update, finalize) -> same state as the fit functions"""
+# ==========================================================
+class _Moments:
+    """Mergeable per-column count / mean / M2 / min / max (parallel Welford update)."""
+
+    def __init__(self):
+        self.count = None
+
+    def update(self, num: pd.DataFrame):
+        n = num.count().astype(float)
+        mean = num.mean().fillna(0.0)
+        m2 = (num.var(ddof=0) * n).fillna(0.0)
+        mn, mx = num.min(), num.max()
+        if self.count is None:
+            self.count, self.mean, self.m2, self.min, self.max = n, mean, m2, mn, mx
+            return
+        total = self.count + n
+        delta = mean - self.mean
+        ratio = (n / total).fillna(0.0)
+        self.mean = self.mean + delta * ratio
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * ratio
+        self.count = total
+        self.min = pd.concat([self.min, mn], axis=1).min(axis=1)
+        self.max = pd.concat([self.max, mx], axis=1).max(axis=1)
+
+    def result(self, name: str) -> pd.Series:
+        if self.count is None:
+            return pd.Series(dtype=float)
+        seen = self.count > 0
+        if name == "mean":
+            return self.mean.where(seen)
+        if name == "std":
+            return np.sqrt(self.m2 / self.count).where(seen)
+        return getattr(self, name)
+
+
+def _sketch_quantiles(sketches: dict, qs) -> pd.DataFrame:
+    """{column: QuantileSketch} => DataFrame indexed by q (like DataFrame.quantile(list))."""
+    return pd.DataFrame({c: sk.quantile(qs) for c, sk in sketches.items()}, index=qs)
+
+
+def _mode_of_counts(vc: pd.Series):
+    top = vc[vc == vc.max()]
+    try:
+        return top.sort_index().index[0]
+    except TypeError:  # mixed, unorderable values
+        return top.index[0]
+
+
+def _init_reducer(p):
+    return {"cols": None, "moments": _Moments(), "sketches": {}, "counts": {}, "rows": 0}
+
+
+def _update_fill(acc, df, p):
+    if acc["cols"] is None:
+        acc["cols"] = _fill_columns(df, p)
+    cols, strategy = acc["cols"], p["strategy"]
+    if strategy in ("mean", "min", "max"):
+        acc["moments"].update(df[cols].astype(float))
+    elif strategy == "median":
+        for c in cols:
+            acc["sketches"].setdefault(c, QuantileSketch()).update(df[c])
+    elif strategy == "mode":
+        for c in cols:
+            vc = df[c].value_counts()
+            acc["counts"][c] = vc if c not in acc["counts"] else acc["counts"][c].add(vc, fill_value=0)
+
+
+def _finalize_fill(acc, p):
+    strategy, cols = p["strategy"], acc["cols"] or []
+    if strategy in ("mean", "min", "max"):
+        fill = acc["moments"].result(strategy)
+    elif strategy == "median":
+        fill = pd.Series({c: acc["sketches"][c].quantile(0.5) for c in acc["sketches"]}, dtype=float)
+    elif strategy == "mode":
+        fill = pd.Series({c: _mode_of_counts(vc) for c, vc in acc["counts"].items() if len(vc)}, dtype=object)
+    else:
+        fill = pd.Series({c: p["value"] for c in cols}, dtype=object)
+    return {"fill": fill.dropna()}
+
+
+def _update_fill_group(acc, df, p):
+    g, t, strategy = p["group_col"], p["target_col"], p["strategy"]
+    if acc["cols"] is None:
+        _tools(df)._require_columns([g, t])
+        if strategy in ("mean", "median") and not pd.api.types.is_numeric_dtype(df[t]):
+            raise TypeError(f"target_col '{t}' must be numeric for {strategy}.")
+        acc["cols"] = [g, t]
+    if strategy == "mean":
+        part = df.groupby(g)[t].agg(["sum", "count"])
+        acc["counts"]["sum"] = part if "sum" not in acc["counts"] else acc["counts"]["sum"].add(part, fill_value=0)
+    elif strategy == "median":
+        for key, values in df.groupby(g)[t]:
+            acc["sketches"].setdefault(key, QuantileSketch()).update(values)
+    else:
+        part = df.groupby([g, t], dropna=True).size()
+        acc["counts"]["pairs"] = part if "pairs" not in acc["counts"] else acc["counts"]["pairs"].add(part, fill_value=0)
+
+
+def _finalize_fill_group(acc, p):
+    strategy = p["strategy"]
+    if strategy == "mean":
+        part = acc["counts"].get("sum")
+        values = pd.Series(dtype=float) if part is None else part["sum"] / part["count"].replace(0, np.nan)
+    elif strategy == "median":
+        values = pd.Series({k: sk.quantile(0.5) for k, sk in acc["sketches"].items()}, dtype=float)
+    else:
+        pairs = acc["counts"].get("pairs")
+        values = pd.Series(dtype=object) if pairs is None else _mode_from_counts(pairs)
+    return {"values": values.dropna()}
+
+
+def _update_numeric(acc, df, p):
+    if acc["cols"] is None:
+        acc["cols"] = _tools(df)._numeric_columns(p["columns"])
+    if acc["cols"]:
+        acc["moments"].update(df[acc["cols"]].astype(float))
+
+
+def _finalize_scale(acc, p):
+    m = acc["moments"]
+    if p["method"] == "standard":
+        center, width = m.result("mean"), m.result("std")
+    else:
+        center, width = m.result("min"), m.result("max") - m.result("min")
+    keep = (width != 0) & width.notna() & center.notna()
+    return {"center": center[keep], "width": width[keep]}
+
+
+def _finalize_clip_zscore(acc, p):
+    mean, std = acc["moments"].result("mean"), acc["moments"].result("std")
+    return {"lower": mean - p["z"] * std, "upper": mean + p["z"] * std}
+
+
+def _update_clip_iqr(acc, df, p):
+    if acc["cols"] is None:
+        acc["cols"] = _tools(df)._numeric_columns(p["columns"])
+    for c in acc["cols"]:
+        acc["sketches"].setdefault(c, QuantileSketch()).update(df[c])
+
+
+def _finalize_clip_iqr(acc, p):
+    q = _sketch_quantiles(acc["sketches"], [0.25, 0.75])
+    q1, q3 = q.loc[0.25], q.loc[0.75]
+    iqr = q3 - q1
+    return {"lower": q1 - p["k"] * iqr, "upper": q3 + p["k"] * iqr}
+
+
+def _update_label(acc, df, p):
+    c = p["column"]
+    _tools(df)._require_columns(c)
+    acc["counts"].setdefault(c, set()).update(df[c].astype("string").dropna().unique())
+
+
+def _finalize_label(acc, p):
+    return {"categories": sorted(acc["counts"].get(p["column"], set()))}
+
+
+def _update_one_hot(acc, df, p):
+    if acc["cols"] is None:
+        acc["cols"] = _one_hot_columns(df, p)
+    for c in acc["cols"]:
+        acc["counts"].setdefault(c, set()).update(df[c].dropna().unique())
+
+
+def _finalize_one_hot(acc, p):
+    vocab = {}
+    for c in acc["cols"] or []:
+        vocab[c] = list(pd.Categorical(pd.Series(list(acc["counts"].get(c, ())), dtype=object)).categories)
+    return {"vocab": vocab}
+
+
+def _update_drop_missing(acc, df, p):
+    non_null = df.notna().sum()
+    acc["counts"]["non_null"] = non_null if acc["cols"] is None else acc["counts"]["non_null"].add(non_null, fill_value=0)
+    acc["cols"] = list(df.columns)
+    acc["rows"] += len(df)
+
+
+def _finalize_drop_missing(acc, p):
+    non_null = acc["counts"].get("non_null", pd.Series(dtype=float))
+    return {"drop": _drop_columns_for(non_null, acc["rows"], p["thresh"])}
+
+
+_REDUCERS = {
+    "fillMissingValues": (_update_fill, _finalize_fill),
+    "fillMissingGroupBy": (_update_fill_group, _finalize_fill_group),
+    "scale": (_update_numeric, _finalize_scale),
+    "clip_outliers_iqr": (_update_clip_iqr, _finalize_clip_iqr),
+    "clip_outliers_zscore": (_update_numeric, _finalize_clip_zscore),
+    "labelEncode": (_update_label, _finalize_label),
+    "oneHotEncode": (_update_one_hot, _finalize_one_hot),
+    "dropMissingValues": (_update_drop_missing, _finalize_drop_missing),
+}
+
+
+def _is_stateful(step) -> bool:
+    """Does the step need statistics from the data (i.e. a pass over the chunks)?"""
+    if step["method"] == "dropMissingValues":
+        return step["params"]["axis"] == 1
+    return step["method"] in _REDUCERS
+
+
+def _step_io(step):
+    """(columns read, columns written) by a step; None => whole frame / unknown."""
+    m, p = step["method"], step["params"]
+    if m in ("fillMissingValues", "scale", "clip_outliers_iqr", "clip_outliers_zscore", "cleanText"):
+        cols = p["columns"]
+        if cols is None:
+            return None, None
+        cols = {cols} if isinstance(cols, str) else set(cols)
+        return cols, cols
+    if m == "labelEncode":
+        return {p["column"]}, {p["column"]}
+    if m == "fillMissingGroupBy":
+        return {p["group_col"], p["target_col"]}, {p["target_col"]}
+    return None, None  # oneHotEncode / dropMissingValues reshape the frame
+
+
+# ==========================================================
+"""SECTION: Persistence (tagged JSON for Series, timestamps and numpy scalars)"""
+# ==========================================================
+def _to_json(obj):
+    if isinstance(obj, pd.Series):
+        return {"__series__": {"index": _to_json(list(obj.index)), "values": _to_json(list(obj)),
+                               "dtype": str(obj.dtype)}}
+    if isinstance(obj, dict):
+        if all(isinstance(k, str) for k in obj):
+            return {k: _to_json(v) for k, v in obj.items()}
+        return {"__items__": [[_to_json(k), _to_json(v)] for k, v in obj.items()]}
+    if isinstance(obj, (list, tuple)):
+        return [_to_json(v) for v in obj]
+    if isinstance(obj, pd.Timestamp):
+        return {"__timestamp__": obj.isoformat()}
+    if isinstance(obj, pd.Timedelta):
+        return {"__timedelta__": obj.value}
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is None or isinstance(obj, (str, bool, int, float)):
+        return obj
+    raise TypeError(f"Cannot save a value of type {type(obj).__name__} in a preprocessor file.")
+
+
+def _from_json(obj):
+    if isinstance(obj, list):
+        return [_from_json(v) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+    if "__series__" in obj:
+        s = obj["__series__"]
+        values = [np.nan if v is None else v for v in _from_json(s["values"])]
+        index = pd.Index(_from_json(s["index"]))
+        return pd.Series(values, index=index, dtype=s["dtype"])
+    if "__items__" in obj:
+        return {_from_json(k): _from_json(v) for k, v in obj["__items__"]}
+    if "__timestamp__" in obj:
+        return pd.Timestamp(obj["__timestamp__"])
+    if "__timedelta__" in obj:
+        return pd.Timedelta(obj["__timedelta__"])
+    return {k: _from_json(v) for k, v in obj.items()}
+
+
+class Preprocessor:
+    """
+    Fitted version of the DataTools transforms (see module docstring).
+    Each step is {'method', 'params', 'state'}; state is filled by fit().
+    """
+    FORMAT_VERSION = 2
+
+    def __init__(self):
+        self.steps = []
+
+    def __repr__(self):
+        status = "fitted" if self.is_fitted else "not fitted"
+        names = ", ".join(s["method"] for s in self.steps)
+        return f"Preprocessor([{names}], {status})"
+
+    @property
+    def is_fitted(self) -> bool:
+        return bool(self.steps) and all(s["state"] is not None for s in self.steps)
+
+    def _add(self, step_name: str, **params):
+        self.steps.append({"method": step_name, "params": params, "state": None})
+        return self
+
+    # ==========================================================
+    """SECTION: Recording (same signatures as DataTools)"""
+    # ==========================================================
+    def fillMissingValues(self, strategy: str = "mean", *, value=None, columns=None):
+        """strategy: 'mean' | 'median' | 'min' | 'max' | 'mode' | 'value'"""
+        strategy = strategy.lower()
+        if strategy not in ("mean", "median", "min", "max", "mode", "value"):
+            raise ValueError("Invalid strategy. Use: mean|median|min|max|mode|value")
+        if strategy == "value" and value is None:
+            raise ValueError("strategy='value' requires value=...")
+        return self._add("fillMissingValues", strategy=strategy, value=value, columns=columns)
+
+    def fillMissingGroupBy(self, group_col: str, target_col: str, *, strategy: str = "median"):
+        """strategy: 'mean' | 'median' | 'mode' (fill values are learned per group)"""
+        if not isinstance(group_col, str) or not isinstance(target_col, str):
+            raise TypeError("Fitted fillMissingGroupBy takes one group column and one target column per step.")
+        strategy = strategy.lower()
+        if strategy not in ("mean", "median", "mode"):
+            raise ValueError("strategy must be: mean | median | mode")
+        return self._add("fillMissingGroupBy", group_col=group_col, target_col=target_col, strategy=strategy)
+
+    def scale(self, method: str = "standard", *, columns=None):
+        """method: 'standard' | 'minmax'"""
+        method = method.lower()
+        if method not in ("standard", "minmax"):
+            raise ValueError("method must be 'standard' or 'minmax'.")
+        return self._add("scale", method=method, columns=columns)
+
+    def clip_outliers_iqr(self, columns=None, k: float = 1.5):
+        """Clip to the training IQR bounds."""
+        return self._add("clip_outliers_iqr", columns=columns, k=k)
+
+    def clip_outliers_zscore(self, columns=None, *, z: float = 3.0):
+        """Clip to the training mean ± z*std."""
+        return self._add("clip_outliers_zscore", columns=columns, z=z)
+
+    def labelEncode(self, column: str):
+        """Encode with the training vocabulary; codes are float64, unseen values become NaN."""
+        return self._add("labelEncode", column=column)
+
+    def oneHotEncode(self, columns=None, *, drop_first: bool = False):
+        """One-hot with the training vocabulary, so every batch gets the same columns."""
+        return self._add("oneHotEncode", columns=columns, drop_first=drop_first)
+
+    def dropMissingValues(self, *, axis: int = 0, thresh: int = None, columns=None):
+        """
+        axis=0 => drop rows of each batch (stateless)
+        axis=1 => drop the columns that failed thresh on the training data
+        """
+        if axis not in (0, 1):
+            raise ValueError("axis must be 0 (rows) or 1 (columns).")
+        return self._add("dropMissingValues", axis=axis, thresh=thresh, columns=columns)
+
+    def cleanText(
+        self,
+        columns,
+        *,
+        lower: bool = True,
+        strip: bool = True,
+        remove_punct: bool = False,
+        remove_extra_spaces: bool = True
+    ):
+        """Stateless text cleaning (same options as DataTools.cleanText)."""
+        return self._add(
+            "cleanText", columns=columns, lower=lower, strip=strip,
+            remove_punct=remove_punct, remove_extra_spaces=remove_extra_spaces
+        )
+
+    # ==========================================================
+    """SECTION: Fit / Transform"""
+    # ==========================================================
+    @staticmethod
+    def _frame(data) -> pd.DataFrame:
+        """Accept a DataFrame or any DataTools-like object with .df."""
+        df = getattr(data, "df", data)
+        if not isinstance(df, pd.DataFrame):
+            raise TypeError("data must be a pandas DataFrame or a DataTools object.")
+        return df
+
+    def fit(self, data):
+        """Learn every step's statistics from data (a DataFrame or DataTools). Returns self."""
+        self.fit_transform(data)
+        return self
+
+    def fit_transform(self, data) -> pd.DataFrame:
+        """Fit on data and return the transformed copy."""
+        if not self.steps:
+            raise ValueError("Preprocessor has no steps. Add transforms before fit().")
+        df = self._frame(data).copy()
+        for step in self.steps:
+            fit_fn, transform_fn = _STEPS[step["method"]]
+            step["state"] = fit_fn(df, step["params"])
+            df = transform_fn(df, step["params"], step["state"])
+        return df
+
+    def transform(self, data, *, copy: bool = True) -> pd.DataFrame:
+        """
+        Apply the fitted statistics to a new batch.
+        copy=False writes the transformed columns into the given frame.
+        """
+        if not self.is_fitted:
+            raise ValueError("Preprocessor is not fitted. Call fit() first.")
+        df = self._frame(data)
+        if copy:
+            df = df.copy()
+        return self._run(df, self.steps)
+
+    @staticmethod
+    def _run(df: pd.DataFrame, steps) -> pd.DataFrame:
+        for step in steps:
+            df = _STEPS[step["method"]][1](df, step["params"], step["state"])
+        return df
+
+    def _stages(self):
+        """
+        Group step indices into passes: a step joins the current pass while it
+        does not read columns written by the steps already in that pass.
+        """
+        stages, current, written = [], [], set()
+        for i, step in enumerate(self.steps):
+            reads, writes = _step_io(step)
+            if current and (reads is None or written is None or reads & written):
+                stages.append(current)
+                current, written = [], set()
+            current.append(i)
+            written = None if (writes is None or written is None) else written | writes
+        if current:
+            stages.append(current)
+        return stages
+
+    def fit_chunks(self, chunks):
+        """
+        Fit from data that does not fit in memory.
+
+        chunks:
+            zero-argument callable returning a fresh iterator of DataFrames;
+            it is called once per statistics pass.
+
+        Steps that do not read each other's output share one pass, so a single
+        transform needs one pass. Mean/std/min/max, modes, vocabularies and
+        null counts are exact; medians and IQR bounds come from QuantileSketch.
+        """
+        if not self.steps:
+            raise ValueError("Preprocessor has no steps. Add transforms before fit().")
+        for step in self.steps:
+            step["state"] = None
+
+        for stage in self._stages():
+            stateful = [i for i in stage if _is_stateful(self.steps[i])]
+            if stateful:
+                prefix = self.steps[:stage[0]]
+                accs = {i: _init_reducer(self.steps[i]["params"]) for i in stateful}
+                for chunk in chunks():
+                    df = self._run(self._frame(chunk).copy(), prefix)
+                    for i in stateful:
+                        _REDUCERS[self.steps[i]["method"]][0](accs[i], df, self.steps[i]["params"])
+                for i in stateful:
+                    self.steps[i]["state"] = _REDUCERS[self.steps[i]["method"]][1](accs[i], self.steps[i]["params"])
+            for i in stage:
+                if self.steps[i]["state"] is None:
+                    self.steps[i]["state"] = {}
+        return self
+
+    # ==========================================================
+    """SECTION: Persistence"""
+    # ==========================================================
+    def save(self, path: str):
+        """
+        Save steps + fitted statistics as JSON (gzip-compressed when path ends
+        with '.gz'). Plain data only: loading a file never runs code.
+        """
+        payload = json.dumps({"version": self.FORMAT_VERSION, "steps": _to_json(self.steps)})
+        with (gzip.open if str(path).endswith(".gz") else open)(path, "wt", encoding="utf-8") as f:
+            f.write(payload)
+
+    @classmethod
+    def load(cls, path: str) -> "Preprocessor":
+        """Load a Preprocessor written by save()."""
+        try:
+            with (gzip.open if str(path).endswith(".gz") else open)(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (UnicodeDecodeError, json.JSONDecodeError, gzip.BadGzipFile):
+            payload = None
+        if not isinstance(payload, dict) or payload.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported preprocessor file: {path}")
+        pre = cls()
+        pre.steps = _from_json(payload["steps"])
+        return pre
+
+
+class PreprocessingTools:
+    # ==========================================================
+    """SECTION: Fitted Preprocessors"""
+    # ==========================================================
+    def applyPreprocessor(self, preprocessor: Preprocessor, *, inplace: bool = True, copy: bool = None):
+        """
+        Transform self.df with a fitted Preprocessor (no statistics recomputed).
+
+        Examples:
+            pre = Preprocessor().fillMissingValues("median").scale()
+            pre.fit(train_df)
+            dt.applyPreprocessor(pre)
+        """
+        new_df = self._working_df(inplace, copy)
+        new_df = preprocessor.transform(new_df, copy=False)
+        return self._apply(new_df, inplace)
@@ -0,0 +1,212 @@
+import functools
+import inspect
+import time
+import tracemalloc
+
+import pandas as pd
+
+
+# Column arguments used to count the columns a call touches.
+_COLUMN_ARGS = ("columns", "column", "group_col", "target_col", "new_col")
+
+
+def _buffer_address(s: pd.Series):
+    """Address of the column's value buffer (None when it cannot be told)."""
+    arr = s.array
+    try:
+        if hasattr(arr, "_pa_array"):  # Arrow-backed
+            chunks = arr._pa_array.chunks
+            buffers = [b for b in chunks[0].buffers() if b is not None] if chunks else []
+            return buffers[-1].address if buffers else None
+        if isinstance(arr, pd.Categorical):
+            values = arr.codes
+        elif hasattr(arr, "_mask"):
+            values = arr._data  # nullable Int / Float / boolean
+        else:
+            values = arr._ndarray  # numpy-backed, datetimes included
+        return values.__array_interface__["data"][0] if values.size else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _buffers(df) -> dict:
+    """Buffer address -> bytes for every column of df whose buffer can be told."""
+    if not isinstance(df, pd.DataFrame):
+        return {}
+    out = {}
+    for i in range(df.shape[1]):
+        s = df.iloc[:, i]
+        address = _buffer_address(s)
+        if address is not None:
+            out[address] = int(s.memory_usage(deep=False, index=False))
+    return out
+
+
+class ProfilingTools:
+    # ==========================================================
+    """SECTION: Profiling / Instrumentation (opt-in)"""
+    # ==========================================================
+    _PROFILING_CONTROL = ("enableProfiling", "disableProfiling", "profileReport", "clearProfile")
+
+    def enableProfiling(self, callback=None, *, track_memory: bool = True):
+        """
+        Record every public DataTools call made on this object.
+
+        Per call: wall time, CPU time, peak memory increase (tracemalloc),
+        rows / columns touched, output shape and new_data_MB: the column data
+        of the resulting frame held in buffers the input frame did not have
+        (a full copy => the whole frame; an in-place write => 0). Copies made
+        and dropped inside the call show up in peak memory instead.
+        Nested calls (e.g. detect_outliers_iqr -> outlier_mask_iqr) are recorded
+        too, with their depth.
+
+        callback:
+            optional function(record: dict) called after each call
+            (e.g. to push metrics to a monitoring system)
+
+        track_memory:
+            measure peak memory with tracemalloc (slows calls down noticeably)
+
+        Examples:
+            dt.enableProfiling()
+            dt.fillMissingValues("median"); dt.cleanText("review_text")
+            dt.profileReport()                 # one row per call
+            dt.profileReport(by_method=True)   # totals per method
+            dt.disableProfiling()
+        """
+        if getattr(self, "_profiling", None) is not None:
+            self.disableProfiling()
+
+        started_tracing = False
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+
+        self._profiling = {
+            "callback": callback,
+            "track_memory": track_memory,
+            "started_tracing": started_tracing,
+            "stack": [],
+            "wrapped": [],
+        }
+        if not hasattr(self, "_profile_records"):
+            self._profile_records = []
+
+        for name in dir(type(self)):
+            if name.startswith("_") or name in self._PROFILING_CONTROL:
+                continue
+            if not inspect.isfunction(getattr(type(self), name)):
+                continue
+            setattr(self, name, self._profiled(name, getattr(self, name)))
+            self._profiling["wrapped"].append(name)
+        return self
+
+    def disableProfiling(self):
+        """Stop recording (records are kept until clearProfile())."""
+        state = getattr(self, "_profiling", None)
+        if state is None:
+            return self
+        for name in state["wrapped"]:
+            self.__dict__.pop(name, None)
+        if state["started_tracing"] and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._profiling = None
+        return self
+
+    def clearProfile(self):
+        """Drop all recorded calls."""
+        self._profile_records = []
+        return self
+
+    def profileReport(self, by_method: bool = False) -> pd.DataFrame:
+        """
+        Recorded calls as a DataFrame.
+        by_method=True => one row per method with call counts and totals, slowest first.
+        """
+        records = pd.DataFrame(getattr(self, "_profile_records", []))
+        if not by_method or records.empty:
+            return records
+
+        top = records[records["depth"] == 0]
+        return top.groupby("method").agg(
+            calls=("method", "size"),
+            wall_s=("wall_s", "sum"),
+            cpu_s=("cpu_s", "sum"),
+            mean_wall_s=("wall_s", "mean"),
+            peak_mem_MB=("peak_mem_MB", "max"),
+            new_data_MB=("new_data_MB", "sum"),
+        ).sort_values("wall_s", ascending=False)
+
+    def _columns_touched(self, method, args, kwargs):
+        """Count of columns named by the call's column arguments (all columns if none given)."""
+        try:
+            bound = inspect.signature(method).bind_partial(*args, **kwargs).arguments
+        except TypeError:
+            bound = kwargs
+        cols = set()
+        for key in _COLUMN_ARGS:
+            value = bound.get(key)
+            if isinstance(value, str):
+                cols.add(value)
+            elif value is not None:
+                cols.update(value)
+        return len(cols) if cols else int(self.df.shape[1])
+
+    def _profiled(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            state = self._profiling
+            if state is None:
+                return method(*args, **kwargs)
+
+            stack = state["stack"]
+            memory = state["track_memory"] and tracemalloc.is_tracing()
+            if memory:
+                if stack:
+                    stack[-1]["peak"] = max(stack[-1]["peak"], tracemalloc.get_traced_memory()[1])
+                mem_start = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            frame = {"peak": 0}
+            stack.append(frame)
+
+            df = getattr(self, "df", None)
+            rows = int(df.shape[0]) if isinstance(df, pd.DataFrame) else 0
+            cols = self._columns_touched(method, args, kwargs) if isinstance(df, pd.DataFrame) else 0
+            buffers_start = _buffers(df)
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+
+            error = None
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                error = type(e).__name__
+                raise
+            finally:
+                wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+                stack.pop()
+                peak_mb = 0.0
+                if memory:
+                    peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                    peak_mb = max(0.0, (peak - mem_start) / (1024 ** 2))
+                    if stack:
+                        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+
+                out = getattr(self, "df", None)
+                new_bytes = sum(n for a, n in _buffers(out).items() if a not in buffers_start)
+                record = {
+                    "method": name,
+                    "depth": len(stack),
+                    "wall_s": wall,
+                    "cpu_s": cpu,
+                    "peak_mem_MB": peak_mb,
+                    "rows": rows,
+                    "cols_touched": cols,
+                    "rows_out": int(out.shape[0]) if isinstance(out, pd.DataFrame) else 0,
+                    "cols_out": int(out.shape[1]) if isinstance(out, pd.DataFrame) else 0,
+                    "new_data_MB": new_bytes / (1024 ** 2),
+                    "error": error,
+                }
+                self._profile_records.append(record)
+                if state["callback"] is not None:
+                    state["callback"](record)
+        return wrapper
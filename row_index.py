@@ -0,0 +1,252 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from eda import _ROW_HASH_PRIME
+
+
+"""
+Row-hash index
+--------------
+64-bit fingerprints of the rows already loaded, kept as sorted arrays and
+saved to disk, so a new batch can be deduplicated against all earlier loads
+without reading them again.
+
+    index = RowHashIndex.load("seen.npz") if os.path.exists("seen.npz") else RowHashIndex()
+    dt.importData("orders_2026-10-17.csv")
+    dt.dropSeenRows(index)         # drops re-sent rows, records the new ones
+    index.save("seen.npz")
+
+    dt.dropSeenRows("seen.npz")    # same, loading / saving the index file itself
+"""
+
+# second, independent hash key for verify=True
+_CHECK_KEY = "datatools-verify"
+
+
+def _column_hash(s: pd.Series, hash_key: str = None) -> np.ndarray:
+    """uint64 per value; equal values hash equal across batches (1 == 1.0, -0.0 == 0.0)."""
+    key = {} if hash_key is None else {"hash_key": hash_key}
+    if pd.api.types.is_numeric_dtype(s.dtype) and not pd.api.types.is_bool_dtype(s.dtype):
+        s = s.astype("float64") + 0.0  # int in one load, float (NaN present) in the next
+        return pd.util.hash_pandas_object(s, index=False, **key).to_numpy()
+    if s.dtype.kind in "mM":
+        return pd.util.hash_pandas_object(s, index=False, **key).to_numpy()
+    head = s.iloc[:10_000]
+    if len(s) > len(head) and head.nunique() > len(head) // 2:
+        # mostly distinct text (ids, free text): factorizing first would not save any hashing
+        h = pd.util.hash_pandas_object(s, index=False, **key).to_numpy()
+        return np.where(s.isna().to_numpy(), np.uint64(0), h)
+    # text / categories: hash the distinct values only
+    codes, uniques = pd.factorize(s)
+    if len(uniques) == 0:
+        return np.zeros(len(s), dtype=np.uint64)
+    hashes = pd.util.hash_pandas_object(pd.Series(np.asarray(uniques, dtype=object)), index=False, **key).to_numpy()
+    return np.where(codes < 0, np.uint64(0), hashes[codes])
+
+
+def hash_rows(df: pd.DataFrame, columns=None, *, hash_key: str = None) -> np.ndarray:
+    """uint64 fingerprint per row of df[columns] (all columns when None), in the given column order."""
+    cols = list(df.columns) if columns is None else list(columns)
+    h = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for c in cols:
+            h *= _ROW_HASH_PRIME
+            h += _column_hash(df[c], hash_key)
+    return h
+
+
+class RowHashIndex:
+    """
+    Set of row fingerprints (sorted uint64 arrays, 8 bytes per row) for
+    deduplicating batches against everything recorded before; a batch costs
+    one hash per row and a binary search per row and sorted run.
+
+    columns:
+        rows are identified by these columns (None => all columns of the
+        first batch; later batches must have them too)
+    verify:
+        store a second, independent 64-bit hash per row and require both to
+        match (a 64-bit collision alone no longer drops a row; 16 bytes per row
+        instead of 8)
+
+    Examples:
+        index = RowHashIndex(columns=["order_id", "order_date"])
+        seen = index.update(batch_df)         # True => already seen; new rows recorded
+        batch_df = batch_df[~seen]
+        index.save("orders.npz")
+    """
+
+    def __init__(self, columns=None, *, verify: bool = False):
+        self.columns = None if columns is None else ([columns] if isinstance(columns, str) else list(columns))
+        self.verify = verify
+        self.collisions = 0  # primary-hash matches rejected by the check hash
+        # sorted runs of (hashes, checks or None), largest first; neighbouring runs are
+        # merged when the newer one grows to a quarter of the older (O(log n) runs)
+        self._runs = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return sum(len(h) for h, _ in self._runs)
+
+    def __repr__(self):
+        cols = "all" if self.columns is None else self.columns
+        return f"RowHashIndex(rows={len(self)}, columns={cols}, verify={self.verify})"
+
+    # ==========================================================
+    """SECTION: Hashing / Lookup"""
+    # ==========================================================
+    def _fingerprints(self, df: pd.DataFrame):
+        df = getattr(df, "df", df)
+        if self.columns is None:
+            self.columns = list(df.columns)
+        missing = [c for c in self.columns if c not in df.columns]
+        if missing:
+            raise ValueError(f"Column(s) {missing} of the index not found in the batch.")
+        h = hash_rows(df, self.columns)
+        c = hash_rows(df, self.columns, hash_key=_CHECK_KEY) if self.verify else None
+        return h, c
+
+    def _find(self, hashes, checks, h, c):
+        """Membership of sorted query hashes h (checks c aligned with h) in one sorted run."""
+        left = np.searchsorted(hashes, h, side="left")
+        at = np.minimum(left, len(hashes) - 1)
+        found = hashes[at] == h
+        if c is None or not found.any():
+            return found
+        match = found & (checks[at] == c)
+        # several rows share a primary hash (rare): compare against each of them
+        for i in np.flatnonzero(found & ~match):
+            right = np.searchsorted(hashes, h[i], side="right")
+            match[i] = bool((checks[left[i]:right] == c[i]).any())
+        self.collisions += int((found & ~match).sum())
+        return match
+
+    def _contains(self, h, c) -> np.ndarray:
+        if not self._runs:
+            return np.zeros(len(h), dtype=bool)
+        # sorted queries: each binary search starts where the previous one ended
+        order = np.argsort(h, kind="stable")
+        hs, cs = h[order], None if c is None else c[order]
+        seen_sorted = np.zeros(len(h), dtype=bool)
+        for hashes, checks in self._runs:
+            seen_sorted |= self._find(hashes, checks, hs, cs)
+        seen = np.empty(len(h), dtype=bool)
+        seen[order] = seen_sorted
+        return seen
+
+    def _batch_duplicated(self, h, c) -> np.ndarray:
+        if c is None:
+            return pd.Series(h).duplicated().to_numpy()
+        return pd.DataFrame({"h": h, "c": c}).duplicated().to_numpy()
+
+    def contains(self, df) -> np.ndarray:
+        """True for rows already recorded in the index."""
+        h, c = self._fingerprints(df)
+        with self._lock:
+            return self._contains(h, c)
+
+    def duplicated(self, df) -> np.ndarray:
+        """True for rows already recorded or repeating an earlier row of the same batch."""
+        h, c = self._fingerprints(df)
+        with self._lock:
+            return self._contains(h, c) | self._batch_duplicated(h, c)
+
+    # ==========================================================
+    """SECTION: Updates"""
+    # ==========================================================
+    @staticmethod
+    def _sorted_run(h, c):
+        # stable sort = timsort/radix: merging already sorted runs is close to linear
+        if c is None:
+            return np.sort(h, kind="stable"), None
+        order = np.argsort(h, kind="stable")
+        return h[order], c[order]
+
+    def _insert(self, h, c):
+        if len(h) == 0:
+            return
+        self._runs.append(self._sorted_run(h, c))
+        while len(self._runs) > 1 and 4 * len(self._runs[-1][0]) >= len(self._runs[-2][0]):
+            (h2, c2), (h1, c1) = self._runs.pop(), self._runs.pop()
+            self._runs.append(self._sorted_run(
+                np.concatenate([h1, h2]), None if c1 is None else np.concatenate([c1, c2])
+            ))
+
+    def _compact(self):
+        """Merge every run into one (before saving / copying)."""
+        if len(self._runs) > 1:
+            hashes = np.concatenate([h for h, _ in self._runs])
+            checks = None if not self.verify else np.concatenate([c for _, c in self._runs])
+            self._runs = [self._sorted_run(hashes, checks)]
+
+    def add(self, df):
+        """Record the rows of df (rows already present are not stored twice)."""
+        self.update(df)
+        return self
+
+    def update(self, df) -> np.ndarray:
+        """
+        Mark and record a batch in one step: returns True for rows already seen
+        (in the index or earlier in the batch); the other rows are added.
+        """
+        h, c = self._fingerprints(df)
+        with self._lock:
+            seen = self._contains(h, c) | self._batch_duplicated(h, c)
+            new = ~seen
+            self._insert(h[new], None if c is None else c[new])
+        return seen
+
+    def merge(self, other: "RowHashIndex"):
+        """Add every fingerprint of another index built on the same columns."""
+        if other.verify != self.verify:
+            raise ValueError("Cannot merge indexes with different verify settings.")
+        if self.columns is not None and other.columns is not None and self.columns != other.columns:
+            raise ValueError("Cannot merge indexes built on different columns.")
+        self.columns = self.columns or other.columns
+        with self._lock:
+            for h, c in list(other._runs):
+                new = ~self._contains(h, c)
+                self._insert(h[new], None if c is None else c[new])
+        return self
+
+    def copy(self) -> "RowHashIndex":
+        with self._lock:
+            self._compact()
+            out = RowHashIndex(self.columns, verify=self.verify)
+            out._runs = [(h.copy(), None if c is None else c.copy()) for h, c in self._runs]
+        return out
+
+    # ==========================================================
+    """SECTION: Save / Load"""
+    # ==========================================================
+    def save(self, path: str):
+        """Write the index to an .npz file (atomically: a crash never leaves a partial index)."""
+        with self._lock:
+            self._compact()
+            hashes, checks = self._runs[0] if self._runs else (np.empty(0, dtype=np.uint64), None)
+            arrays = {"hashes": hashes}
+            if self.verify:
+                arrays["checks"] = np.empty(0, dtype=np.uint64) if checks is None else checks
+            meta = json.dumps({"columns": self.columns, "verify": self.verify, "version": 1})
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    np.savez(f, meta=np.array(meta), **arrays)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+    @classmethod
+    def load(cls, path: str) -> "RowHashIndex":
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            index = cls(meta["columns"], verify=meta["verify"])
+            hashes = data["hashes"]
+            if len(hashes):
+                index._runs = [(hashes, data["checks"] if index.verify else None)]
+        return index
@@ -0,0 +1,184 @@
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+"""
+Sampling
+--------
+Row samples for interactive exploration of large frames, and the confidence
+intervals that go with estimates taken from them.
+
+    sub = sample_frame(df, 0.01, stratify="region", seed=0)
+    low, high = proportion_ci(sub["age"].isna().sum(), len(sub), population=len(df))
+
+    sampler = ReservoirSampler(100_000, seed=0)
+    for chunk in pd.read_csv("huge.csv", chunksize=200_000):
+        sampler.update(chunk)
+    sub = sampler.result()        # uniform sample of every row seen
+"""
+
+
+def sample_size(sample, population: int) -> int:
+    """Rows to draw: a fraction in (0, 1] or a row count (capped at the population)."""
+    if isinstance(sample, (bool, np.bool_)):
+        raise TypeError("sample must be a fraction in (0, 1] or a row count.")
+    if isinstance(sample, (int, np.integer)):
+        if sample < 1:
+            raise ValueError("sample row count must be >= 1.")
+        return min(int(sample), population)
+    sample = float(sample)
+    if not 0 < sample <= 1:
+        raise ValueError("sample fraction must be in (0, 1]; pass an int for a row count.")
+    return min(population, max(1, int(round(sample * population))))
+
+
+def sample_frame(df: pd.DataFrame, sample, *, stratify=None, seed=None) -> pd.DataFrame:
+    """
+    Simple random sample of df's rows (original order kept).
+
+    sample:
+        fraction in (0, 1] or number of rows
+    stratify:
+        column name: every value (NaN included) gets its proportional share of
+        the sample, so rare groups are not lost to chance
+    """
+    n_rows = len(df)
+    n = sample_size(sample, n_rows)
+    if n >= n_rows:
+        return df
+    rng = np.random.default_rng(seed)
+    if stratify is None:
+        rows = np.sort(rng.choice(n_rows, size=n, replace=False))
+        return df.iloc[rows]
+
+    codes, uniques = pd.factorize(df[stratify], use_na_sentinel=False)
+    sizes = np.bincount(codes, minlength=len(uniques))
+    # proportional allocation, largest remainders get the leftover rows
+    share = sizes * (n / n_rows)
+    alloc = np.floor(share).astype(np.int64)
+    leftover = n - int(alloc.sum())
+    if leftover:
+        alloc[np.argsort(alloc - share, kind="stable")[:leftover]] += 1
+
+    # random order within each stratum, then the first alloc[g] rows of stratum g
+    perm = rng.permutation(n_rows)
+    perm = perm[np.argsort(codes[perm], kind="stable")]
+    starts = np.repeat(np.cumsum(sizes) - sizes, sizes)
+    keep = (np.arange(n_rows) - starts) < np.repeat(alloc, sizes)
+    return df.iloc[np.sort(perm[keep])]
+
+
+class ReservoirSampler:
+    """
+    Uniform sample of fixed size over a stream of DataFrame chunks (one pass,
+    memory bounded by the sample). Every row gets a random key and the rows
+    with the smallest keys are kept, so samplers fed with different parts of
+    a stream can be merged.
+
+    Examples:
+        sampler = ReservoirSampler(50_000, seed=1)
+        for batch in dt.iterData("events.parquet", chunksize=500_000):
+            sampler.update(batch)
+        sample, seen = sampler.result(), sampler.seen
+    """
+
+    def __init__(self, size: int, seed: int = None):
+        if int(size) < 1:
+            raise ValueError("size must be >= 1.")
+        self.size = int(size)
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+        self._keys = np.empty(0)
+        self._rows = None
+
+    def __repr__(self):
+        return f"ReservoirSampler(size={self.size}, seen={self.seen}, kept={len(self._keys)})"
+
+    def _keep(self, keys: np.ndarray, rows: pd.DataFrame):
+        if len(keys) > self.size:
+            keep = np.sort(np.argpartition(keys, self.size - 1)[:self.size])  # arrival order kept
+            keys, rows = keys[keep], rows.iloc[keep]
+        self._keys, self._rows = keys, rows.reset_index(drop=True)
+
+    def update(self, chunk):
+        """Offer a DataFrame (or DataTools batch) of rows to the sample."""
+        chunk = getattr(chunk, "df", chunk)
+        keys = self._rng.random(len(chunk))
+        self.seen += len(chunk)
+        if len(self._keys) == self.size:
+            # only rows beating the current largest kept key can enter
+            hit = keys < self._keys.max()
+            if not hit.any():
+                return self
+            keys, chunk = keys[hit], chunk[hit]
+        if self._rows is None:
+            self._keep(keys, chunk)
+        else:
+            self._keep(np.concatenate([self._keys, keys]), pd.concat([self._rows, chunk], ignore_index=True))
+        return self
+
+    def merge(self, other: "ReservoirSampler"):
+        """Combine with a sampler of another part of the stream (same size)."""
+        if other.size != self.size:
+            raise ValueError("Only samplers of the same size can be merged.")
+        self.seen += other.seen
+        if other._rows is not None:
+            if self._rows is None:
+                self._keep(other._keys, other._rows)
+            else:
+                self._keep(np.concatenate([self._keys, other._keys]),
+                           pd.concat([self._rows, other._rows], ignore_index=True))
+        return self
+
+    def result(self) -> pd.DataFrame:
+        """The sampled rows (empty frame when nothing was seen)."""
+        return pd.DataFrame() if self._rows is None else self._rows
+
+
+# ==========================================================
+"""SECTION: Confidence Intervals"""
+# ==========================================================
+def _z(confidence: float) -> float:
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be in (0, 1).")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def _fpc(n, population):
+    """Finite population correction of the standard error (0 when the sample is everything)."""
+    if population is None:
+        return 1.0
+    population = np.asarray(population, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fpc = np.sqrt(np.clip((population - n) / (population - 1), 0, 1))
+    return np.where(population > 1, fpc, 0.0)
+
+
+def proportion_ci(successes, n, *, population: int = None, confidence: float = 0.95):
+    """
+    Wilson score interval for a proportion estimated from n sampled rows
+    (works elementwise on arrays / Series). Returns (low, high) as fractions.
+    """
+    successes = np.asarray(successes, dtype=float)
+    n = np.asarray(n, dtype=float)
+    z = _z(confidence)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p = successes / n
+        # the finite population correction shrinks the variance like a larger sample would
+        n_eff = n / np.square(_fpc(n, population))
+        center = (p + z * z / (2 * n_eff)) / (1 + z * z / n_eff)
+        half = z * np.sqrt(p * (1 - p) / n_eff + z * z / (4 * n_eff * n_eff)) / (1 + z * z / n_eff)
+        low, high = np.clip(center - half, 0, 1), np.clip(center + half, 0, 1)
+    exact = ~np.isfinite(n_eff)  # the whole population was sampled
+    return np.where(exact, p, low), np.where(exact, p, high)
+
+
+def mean_ci(mean, std, n, *, population: int = None, confidence: float = 0.95):
+    """Normal interval for a mean from n sampled values with sample standard deviation std."""
+    n = np.asarray(n, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        half = _z(confidence) * np.asarray(std, dtype=float) / np.sqrt(n) * _fpc(n, population)
+    half = np.where(n > 1, half, np.nan)
+    return mean - half, mean + half
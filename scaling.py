@@ -5,7 +5,8 @@ class ScalingTools:
     # ==========================================================
     """SECTION: Scaling (Standardization + MinMax)"""
     # ==========================================================
-    def scale(self, method: str = "standard", *, columns=None, inplace: bool = True):
+    def scale(self, method: str = "standard", *, columns=None, inplace: bool = True, copy: bool = None,
+              n_jobs: int = None):
         """
         Scale numeric columns.
 
@@ -14,25 +15,30 @@ class ScalingTools:
             'minmax'   => (x - min) / (max - min)
         """
         method = method.lower()
+        if method not in ("standard", "minmax"):
+            raise ValueError("method must be 'standard' or 'minmax'.")
         num_cols = self._numeric_columns(columns)
 
-        new_df = self.df.copy()
-        for c in num_cols:
-            s = new_df[c].astype(float)
+        new_df = self._working_df(inplace, copy)
 
+        def scaled(c):
+            # statistics read the untouched column (self.df => cacheable);
+            # no Series of new_df is kept alive across the write (copy-free mode relies on it)
             if method == "standard":
-                std = s.std(ddof=0)
+                std = self._stat(c, "std0", lambda: self.df[c].astype(float).std(ddof=0))
                 if std == 0 or pd.isna(std):
-                    continue
-                new_df[c] = (s - s.mean()) / std
+                    return None
+                mean = self._stat(c, "mean", lambda: self.df[c].mean())
+                return (new_df[c].astype(float) - mean) / std
 
-            elif method == "minmax":
-                mn, mx = s.min(), s.max()
-                if mn == mx or pd.isna(mn) or pd.isna(mx):
-                    continue
-                new_df[c] = (s - mn) / (mx - mn)
+            mn = float(self._stat(c, "min", lambda: self.df[c].min()))
+            mx = float(self._stat(c, "max", lambda: self.df[c].max()))
+            if mn == mx or pd.isna(mn) or pd.isna(mx):
+                return None
+            return (new_df[c].astype(float) - mn) / (mx - mn)
 
-            else:
-                raise ValueError("method must be 'standard' or 'minmax'.")
+        for c, values in self._map_columns(new_df, scaled, num_cols, n_jobs):
+            if values is not None:
+                self._set_column(new_df, c, values)
 
-        return self._apply(new_df, inplace)
+        return self._apply(new_df, inplace, changed=num_cols)
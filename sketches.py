@@ -0,0 +1,203 @@
+import math
+
+import numpy as np
+
+
+"""
+Streaming sketches
+------------------
+Small, mergeable summaries that can be built chunk by chunk (or per worker)
+and combined afterwards, for statistics that have no exact streaming form.
+"""
+
+
+class QuantileSketch:
+    """
+    KLL-style mergeable quantile sketch over a numeric stream (NaN ignored).
+
+    k:
+        compactor size; rank error is typically ~1.7 / k and rarely above 2.5 / k
+        (k=2000 => ~0.1%). Exact while fewer than k values were seen.
+    rank_error:
+        alternative to k: bound on the rank error (k = 2.5 / rank_error; 0.001 => k=2500)
+
+    Examples:
+        sk = QuantileSketch()
+        for chunk in chunks:
+            sk.update(chunk["salary"])
+        q1, q3 = sk.quantile([0.25, 0.75])
+        sk.merge(other_sketch)
+    """
+
+    def __init__(self, k: int = 2000, seed: int = None, *, rank_error: float = None):
+        if rank_error is not None:
+            k = max(8, math.ceil(2.5 / resolve_rank_error(rank_error)))
+        if k < 8:
+            raise ValueError("k must be >= 8.")
+        self.k = int(k)
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __repr__(self):
+        return f"QuantileSketch(k={self.k}, n={self.n}, stored={sum(len(l) for l in self.levels)})"
+
+    def _capacity(self, h: int) -> int:
+        """Top level holds k items; each level below holds 2/3 of the one above."""
+        depth = len(self.levels) - h - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if len(level) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(level)
+                odd = len(level) % 2
+                # keep one item back when odd, promote every other item (random offset) with 2x weight
+                body = level[odd:]
+                promoted = body[self._rng.integers(2)::2]
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+                self.levels[h] = level[:odd]
+            h += 1
+
+    def update(self, values):
+        """Add an array/Series of values to the sketch."""
+        v = np.asarray(values, dtype=float).ravel()
+        v = v[~np.isnan(v)]
+        if v.size == 0:
+            return self
+        self.n += int(v.size)
+        # large inputs go in blocks: many small sorts instead of one big one
+        block = max(8 * self.k, 1 << 15)
+        for start in range(0, v.size, block):
+            self.levels[0] = np.concatenate([self.levels[0], v[start:start + block]])
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch"):
+        """Merge another sketch into this one (chunks / workers)."""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Estimated quantile(s); q is a float or list of floats in [0, 1].
+        Exact (linear interpolation, like pandas) while the sketch holds every value.
+        Returns NaN when empty.
+        """
+        scalar = np.isscalar(q)
+        qs = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.n == 0:
+            out = np.full(qs.shape, np.nan)
+            return float(out[0]) if scalar else out
+
+        if len(self.levels) == 1:
+            out = np.quantile(self.levels[0], qs)
+        else:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(l), 2.0 ** h) for h, l in enumerate(self.levels)])
+            order = np.argsort(values, kind="stable")
+            values, cum = values[order], np.cumsum(weights[order])
+            idx = np.searchsorted(cum, qs * cum[-1], side="left")
+            out = values[np.clip(idx, 0, len(values) - 1)]
+        return float(out[0]) if scalar else out
+
+
+DEFAULT_RANK_ERROR = 0.001
+
+
+def resolve_rank_error(approx) -> float:
+    """approx=True => DEFAULT_RANK_ERROR; a float in (0, 1) is the rank error itself."""
+    if approx is True:
+        return DEFAULT_RANK_ERROR
+    if isinstance(approx, (int, float)) and not isinstance(approx, bool) and 0 < approx < 1:
+        return float(approx)
+    raise ValueError("approx must be True/False or a rank error in (0, 1), e.g. 0.001.")
+
+
+def approx_quantile(values, q, *, rank_error: float = DEFAULT_RANK_ERROR, seed: int = 0):
+    """
+    Quantile(s) of values (NaN ignored) from one streaming pass through a QuantileSketch.
+    Exact when there are fewer values than the sketch holds.
+    """
+    sketch = QuantileSketch(seed=seed, rank_error=rank_error)
+    return sketch.update(values).quantile(q)
+
+
+def hash_values(values) -> np.ndarray:
+    """uint64 hash per value (pandas' hashing; equal values => equal hashes, NaN included)."""
+    import pandas as pd
+    if isinstance(values, pd.Series):
+        if values.dtype.kind == "f":
+            values = values + 0.0  # -0.0 => 0.0 (equal values, different bits)
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind == "f":
+        values = values + 0.0
+    return pd.util.hash_array(values)
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch (HyperLogLog with linear counting for small sets).
+
+    p:
+        2**p one-byte registers; relative error is roughly 1.04 / sqrt(2**p)
+        (p=14 => 16 KB, ~0.8%)
+
+    Examples:
+        hll = HyperLogLog()
+        for chunk in chunks:
+            hll.update(chunk["user_id"].dropna())
+        hll.count()
+    """
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18.")
+        self.p = int(p)
+        self.m = 1 << self.p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def __repr__(self):
+        return f"HyperLogLog(p={self.p}, estimate={self.count():.0f})"
+
+    def update(self, values):
+        """Add values (array/Series); use update_hashes() for precomputed uint64 hashes."""
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes):
+        h = np.asarray(hashes, dtype=np.uint64)
+        if h.size == 0:
+            return self
+        bits = 64 - self.p
+        idx = (h >> np.uint64(bits)).astype(np.intp)
+        rest = h & np.uint64((1 << bits) - 1)
+        # rank = position of the first 1-bit in the remaining `bits` bits (bits + 1 if none)
+        _, exponent = np.frexp(rest.astype(np.float64))
+        rank = np.where(rest == 0, bits + 1, bits - exponent + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+        return self
+
+    def merge(self, other: "HyperLogLog"):
+        if other.p != self.p:
+            raise ValueError("Cannot merge sketches with different p.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> float:
+        m = float(self.m)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            return float(m * np.log(m / zeros))  # linear counting
+        return float(estimate)
@@ -0,0 +1,394 @@
+import datetime
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+"""
+SQL subsystem
+-------------
+Pooled connections, partitioned parallel reads and batched writes.
+
+    pool = ConnectionPool("sqlite:///warehouse.db", size=4)
+    dt.readSQL("SELECT * FROM orders", pool, partition_column="order_id", partitions=8)
+    dt.writeSQL("orders_clean", pool, if_exists="replace", batch_size=50_000)
+
+`con` may be a ConnectionPool, a database URL (pooled per URL and reused
+across calls: sqlite:/// built in, others through SQLAlchemy), a SQLAlchemy
+engine (already pooled) or a plain DB-API connection (used as is, one query
+at a time).
+"""
+
+
+# idle-queue token for a slot whose connection was discarded: the taker opens a new one
+_FREE_SLOT = object()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    target:
+        "sqlite:///path/to.db" or a zero-argument function returning a new
+        DB-API connection (e.g. lambda: psycopg2.connect(dsn))
+    size:
+        maximum number of open connections
+
+    Examples:
+        pool = ConnectionPool("sqlite:///local.db", size=4)
+        with pool.connection() as con:
+            con.execute("CREATE INDEX IF NOT EXISTS ix_day ON events(day)")
+        pool.close()
+    """
+
+    def __init__(self, target, *, size: int = 4):
+        if size < 1:
+            raise ValueError("size must be >= 1.")
+        if isinstance(target, str):
+            self._factory = _url_factory(target)
+        elif callable(target):
+            self._factory = target
+        else:
+            raise TypeError("target must be a database URL or a function returning a connection.")
+        self.size = int(size)
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __repr__(self):
+        return f"ConnectionPool(size={self.size}, open={self._opened}, idle={self._idle.qsize()})"
+
+    def _acquire(self):
+        if self._closed:
+            raise ValueError("ConnectionPool is closed.")
+        try:
+            con = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                reserved = self._opened < self.size
+                if reserved:
+                    self._opened += 1
+            # wait for a connection to come back, or for a discarded one's slot
+            con = _FREE_SLOT if reserved else self._idle.get()
+        if con is not _FREE_SLOT:
+            return con
+        if self._closed:
+            self._drop_slot()
+            raise ValueError("ConnectionPool is closed.")
+        try:
+            return self._factory()
+        except Exception:
+            self._idle.put(_FREE_SLOT)  # the next waiter may try again
+            raise
+
+    def _drop_slot(self):
+        with self._lock:
+            self._opened -= 1
+
+    def _release(self, con, broken: bool = False):
+        if broken or self._closed:
+            try:
+                con.close()
+            except Exception:
+                pass
+            # the slot stays counted: whoever takes the token opens a new connection
+            self._idle.put(_FREE_SLOT)
+            return
+        self._idle.put(con)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; it is returned to the pool (or discarded on error)."""
+        con = self._acquire()
+        try:
+            yield con
+        except Exception:
+            try:
+                con.rollback()
+                self._release(con)
+            except Exception:
+                self._release(con, broken=True)
+            raise
+        else:
+            self._release(con)
+
+    def close(self):
+        """Close idle connections; borrowed ones are closed when returned."""
+        self._closed = True
+        while True:
+            try:
+                con = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if con is not _FREE_SLOT:
+                try:
+                    con.close()
+                except Exception:
+                    pass
+            self._drop_slot()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _url_factory(url: str):
+    prefix = "sqlite:///"
+    if not url.startswith(prefix):
+        raise ValueError(
+            "Only sqlite:/// URLs are built in; pass a SQLAlchemy engine or a connection "
+            "factory for other databases."
+        )
+    path = url[len(prefix):]
+    if path in ("", ":memory:"):
+        raise ValueError("An in-memory SQLite database cannot be shared by a pool; use a file path.")
+    return lambda: sqlite3.connect(path, check_same_thread=False)
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(url: str, *, size: int = 4) -> ConnectionPool:
+    """Process-wide pool for a URL (created on first use, then reused)."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(url)
+        if pool is None or pool._closed:
+            pool = _POOLS[url] = ConnectionPool(url, size=size)
+        return pool
+
+
+def _get_engine(url: str):
+    """Process-wide SQLAlchemy engine (it pools its own connections) for a non-SQLite URL."""
+    with _POOLS_LOCK:
+        engine = _POOLS.get(url)
+        if engine is None:
+            try:
+                import sqlalchemy
+            except ImportError:
+                raise ImportError(
+                    f"Connecting to {url.split(':', 1)[0]} URLs requires SQLAlchemy (pip install sqlalchemy)."
+                )
+            engine = _POOLS[url] = sqlalchemy.create_engine(url)
+        return engine
+
+
+def _is_engine(con) -> bool:
+    return hasattr(con, "dispose") and hasattr(con, "connect")
+
+
+def _resolve(con):
+    """sqlite:/// URL => shared ConnectionPool, other URL => shared engine, anything else as is."""
+    if con is None:
+        raise ValueError("SQL requires con=... (pool, URL, engine or connection).")
+    if isinstance(con, str):
+        return get_pool(con) if con.startswith("sqlite:///") else _get_engine(con)
+    return con
+
+
+@contextmanager
+def borrow(con):
+    """Yield something pandas can read from / write to, for any supported `con`."""
+    con = _resolve(con)
+    if isinstance(con, ConnectionPool):
+        with con.connection() as c:
+            yield c
+    else:
+        yield con
+
+
+def _can_parallelize(con) -> bool:
+    con = _resolve(con)
+    return isinstance(con, ConnectionPool) or _is_engine(con)
+
+
+def _literal(value) -> str:
+    """SQL literal for a partition boundary (values come from the database or from linspace)."""
+    if isinstance(value, (datetime.date, np.datetime64)):
+        value = pd.Timestamp(value).isoformat(sep=" ")
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, (bool, np.bool_)):
+        return str(int(value))
+    if isinstance(value, (int, np.integer)):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _split_bounds(lo, hi, partitions: int) -> list:
+    """partitions+1 increasing boundaries from lo to hi (numbers or dates); ends kept as given."""
+    if isinstance(lo, (int, float, np.integer, np.floating)) and not isinstance(lo, bool):
+        inner = np.linspace(float(lo), float(hi), partitions + 1)[1:-1]
+        if isinstance(lo, (int, np.integer)) and isinstance(hi, (int, np.integer)):
+            inner = np.unique(np.ceil(inner).astype(np.int64))
+            inner = inner[(inner > lo) & (inner <= hi)]
+        return [lo] + list(inner) + [hi]
+
+    try:
+        start, end = pd.Timestamp(lo), pd.Timestamp(hi)  # strings from e.g. SQLite are parsed
+    except (TypeError, ValueError):
+        raise TypeError(f"partition key must be numeric or datetime (got {lo!r}).") from None
+    inner = pd.date_range(start, end, periods=partitions + 1)[1:-1]
+    return [lo] + list(inner) + [hi]
+
+
+def _align_partitions(frames: list) -> list:
+    """
+    Cast partition frames to the dtypes their columns have where they hold values
+    (the NULL-key partition reads its key as an all-None object column), so the
+    concat gives the dtypes of a single read.
+    """
+    from io_tools import _common_dtype  # io_tools imports this module
+
+    targets = {}
+    for c in frames[0].columns:
+        dtypes = [f[c].dtype for f in frames if f[c].notna().any()]
+        if dtypes:
+            targets[c] = _common_dtype(dtypes)
+    out = []
+    for f in frames:
+        casts = {}
+        for c, t in targets.items():
+            if f[c].dtype == t:
+                continue
+            if f[c].notna().any():
+                casts[c] = t
+            elif pd.api.types.is_integer_dtype(t) and isinstance(t, np.dtype):
+                casts[c] = np.float64  # ints with NULLs read as float64
+            elif not pd.api.types.is_bool_dtype(t) or not isinstance(t, np.dtype):
+                casts[c] = t
+        out.append(f.astype(casts) if casts else f)
+    return out
+
+
+def partition_queries(query: str, column: str, bounds: list) -> list:
+    """
+    One query per range between the inner boundaries, plus one for NULL keys.
+    The outer ranges are open (key < b_1, key >= b_n-1): bounds only place the
+    split points, so keys outside [bounds[0], bounds[-1]] are still read.
+    """
+    base = f"SELECT * FROM ({query}) AS _part WHERE "
+    inner = [_literal(b) for b in bounds[1:-1]]
+    if not inner:
+        return [f"{base}{column} IS NOT NULL", f"{base}{column} IS NULL"]
+    queries = [f"{base}{column} < {inner[0]}"]
+    for lo, hi in zip(inner[:-1], inner[1:]):
+        queries.append(f"{base}{column} >= {lo} AND {column} < {hi}")
+    queries.append(f"{base}{column} >= {inner[-1]}")
+    queries.append(f"{base}{column} IS NULL")
+    return queries
+
+
+class SQLTools:
+    # ==========================================================
+    """SECTION: SQL (Pooled / Partitioned Reads, Bulk Writes)"""
+    # ==========================================================
+    def readSQL(
+        self,
+        query: str,
+        con,
+        *,
+        partition_column: str = None,
+        partitions: int = 4,
+        bounds=None,
+        n_jobs: int = None,
+        arrow: bool = False
+    ):
+        """
+        Load a query result into self.df.
+
+        partition_column:
+            numeric or date key: the query is split into `partitions` key ranges
+            (plus NULL keys) that are read in parallel and concatenated once
+        bounds:
+            (low, high) the split points are spread over; None => SELECT MIN/MAX first.
+            Only places the splits: keys outside it land in the first / last partition
+        n_jobs:
+            reader threads (None => one per partition). Parallel reads need a
+            pool, URL or engine; a single DB-API connection reads the ranges one by one.
+
+        Examples:
+            dt.readSQL("SELECT * FROM events", "sqlite:///events.db",
+                       partition_column="event_time", partitions=8)
+        """
+        kwargs = {"dtype_backend": "pyarrow"} if arrow else {}
+        if partition_column is None:
+            with borrow(con) as c:
+                self.df = pd.read_sql(query, c, **kwargs)
+            return self.df
+
+        if partitions < 1:
+            raise ValueError("partitions must be >= 1.")
+        if bounds is None:
+            with borrow(con) as c:
+                row = pd.read_sql(
+                    f"SELECT MIN({partition_column}) AS lo, MAX({partition_column}) AS hi FROM ({query}) AS _b", c
+                ).iloc[0]
+            bounds = (row["lo"], row["hi"])
+        lo, hi = bounds
+        if not pd.isna(lo):
+            try:
+                _split_bounds(lo, hi, 1)
+            except TypeError:
+                raise TypeError(
+                    f"partition_column '{partition_column}' must be numeric or datetime (got {lo!r})."
+                ) from None
+
+        if pd.isna(lo):  # empty result or only NULL keys
+            queries = [query]
+        else:
+            queries = partition_queries(query, partition_column, _split_bounds(lo, hi, partitions))
+
+        def read(q):
+            with borrow(con) as c:
+                return pd.read_sql(q, c, **kwargs)
+
+        workers = len(queries) if n_jobs is None else self._resolve_n_jobs(n_jobs)
+        if workers == 1 or len(queries) == 1 or not _can_parallelize(con):
+            frames = [read(q) for q in queries]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(read, queries))
+
+        frames = [f for f in frames if len(f)] or frames[:1]
+        self.df = pd.concat(_align_partitions(frames), ignore_index=True) if len(frames) > 1 else frames[0]
+        return self.df
+
+    def writeSQL(
+        self,
+        table: str,
+        con,
+        *,
+        columns=None,
+        if_exists: str = "fail",
+        batch_size: int = 10_000,
+        method: str = None
+    ) -> int:
+        """
+        Write self.df to a table with batched bulk inserts (executemany per batch,
+        or multi-row VALUES with method="multi"), inside one transaction.
+
+        if_exists: "fail" | "replace" | "append"
+        Returns rows written.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1.")
+        df = self.df
+        if columns is not None:
+            cols = self._ensure_list(columns)
+            self._require_columns(cols)
+            df = df[cols]
+
+        with borrow(con) as c:
+            df.to_sql(table, c, if_exists=if_exists, index=False, chunksize=batch_size, method=method)
+            if hasattr(c, "commit"):
+                c.commit()
+        return len(df)
@@ -0,0 +1,82 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataUtil import DataTools
+
+ROWS, COLS = 400_000, 20
+
+
+def _frame():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(ROWS, COLS))
+    values[rng.random((ROWS, COLS)) < 0.05] = np.nan
+    return pd.DataFrame(values, columns=[f"c{i}" for i in range(COLS)])
+
+
+def _cleaning_chain(dt):
+    dt.fillMissingValues("mean")
+    dt.clip_outliers_iqr()
+    dt.clip_outliers_zscore(z=3.0)
+    dt.scale("standard")
+    dt.to_float("c0")
+
+
+def _peak_extra(df, copy):
+    """Peak bytes allocated above the starting frame while the chain runs."""
+    dt = DataTools(df, copy=copy, n_jobs=1, stats_cache_mb=0)
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        _cleaning_chain(dt)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start, dt
+
+
+def test_copy_free_chain_stays_near_one_frame():
+    df = _frame()
+    frame_bytes = int(df.memory_usage(index=False).sum())
+    column_bytes = frame_bytes // COLS
+
+    copy_peak, copied = _peak_extra(df.copy(), copy=True)
+    free_peak, free = _peak_extra(df, copy=False)
+
+    # the copy mode duplicates the frame; the copy-free mode only needs a few column temporaries
+    assert copy_peak >= 0.9 * frame_bytes
+    assert free_peak <= 5 * column_bytes
+    assert free_peak <= 0.3 * frame_bytes
+    assert free.df is df
+    assert free._frame_copies == 0
+    pd.testing.assert_frame_equal(free.df, copied.df)
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_modes_give_the_same_result(copy):
+    df = _frame().head(5_000)
+    dt = DataTools(df.copy(), copy=copy)
+    _cleaning_chain(dt)
+    reference = DataTools(df.copy())
+    _cleaning_chain(reference)
+    pd.testing.assert_frame_equal(dt.df, reference.df)
+
+
+def test_profiler_reports_new_column_data():
+    df = _frame().head(10_000)
+    frame_mb = df.memory_usage(index=False).sum() / (1024 ** 2)
+    reports = {}
+    for copy in (True, False):
+        dt = DataTools(df.assign(k=np.where(df["c0"] > 0, "a", "b")).copy(), copy=copy)
+        dt.enableProfiling(track_memory=False)
+        dt.fillMissingValues("mean", columns=list(df.columns))
+        dt.scale("standard", columns=["c1"])
+        dt.oneHotEncode("k")  # a new frame, but only the dummy columns are new data
+        reports[copy] = dt.profileReport().set_index("method")["new_data_MB"]
+    assert reports[True]["fillMissingValues"] >= 0.9 * frame_mb
+    assert reports[False]["fillMissingValues"] == 0
+    assert reports[False]["scale"] == 0
+    assert 0 < reports[False]["oneHotEncode"] < 0.1 * frame_mb
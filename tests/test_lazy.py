@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataUtil import DataTools
+
+
+def _frame(rows=200):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "t": rng.permutation(rows).astype(float),
+        "v": rng.normal(size=rows),
+        "w": rng.normal(size=rows),
+        "x": rng.normal(size=rows) * 10,
+    })
+    for c in ("v", "w", "x"):
+        df.loc[rng.random(rows) < 0.15, c] = np.nan
+    return df
+
+
+def _eager(df, calls):
+    dt = DataTools(df.copy(), n_jobs=1)
+    for name, args, kwargs in calls:
+        if name == "selectColumns":
+            dt.df = dt.df[args[0]]
+        elif name == "dropColumns":
+            dt.df = dt.df.drop(columns=args[0])
+        else:
+            getattr(dt, name)(*args, **kwargs)
+    return dt.df
+
+
+def _lazy(df, calls):
+    plan = DataTools(df.copy(), n_jobs=1).lazy()
+    for name, args, kwargs in calls:
+        plan = getattr(plan, name)(*args, **kwargs)
+    return plan.collect()
+
+
+def _assert_same(df, calls):
+    pd.testing.assert_frame_equal(_lazy(df, calls), _eager(df, calls))
+
+
+def test_interpolate_then_select_keeps_time_col():
+    _assert_same(_frame(), [
+        ("fillMissingValues", ("interpolate",), {"columns": ["v"], "time_col": "t"}),
+        ("selectColumns", (["v"],), {}),
+    ])
+
+
+def test_ffill_time_col_not_dropped_before_fill():
+    _assert_same(_frame(), [
+        ("fillMissingValues", ("ffill",), {"columns": ["v", "w"], "time_col": "t"}),
+        ("dropColumns", ("t",), {}),
+    ])
+
+
+def test_column_local_chain_matches_eager():
+    _assert_same(_frame(), [
+        ("fillMissingValues", ("median",), {"columns": ["v"]}),
+        ("fillMissingValues", ("median",), {"columns": ["w"]}),
+        ("clip_outliers_iqr", (), {"columns": ["v", "w"]}),
+        ("dropColumns", ("x",), {}),
+    ])
+
+
+def test_knn_fills_are_not_merged():
+    pytest.importorskip("scipy")
+    df = _frame()
+    calls = [
+        ("fillMissingValues", ("knn",), {"columns": ["v"], "features": ["t", "w"]}),
+        ("fillMissingValues", ("knn",), {"columns": ["w"], "features": ["t", "w"]}),
+        ("selectColumns", (["v", "w"],), {}),
+    ]
+    plan = DataTools(df.copy(), n_jobs=1).lazy()
+    for name, args, kwargs in calls:
+        plan = getattr(plan, name)(*args, **kwargs)
+    assert sum(s.startswith("fillMissingValues") for s in plan.explain()) == 2
+    _assert_same(df, calls)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataUtil import DataTools
+
+
+def _frame(rows=1_000):
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({
+        "t": rng.permutation(rows).astype(float),
+        "g": rng.choice(["a", "b", "c"], rows),
+        "x": rng.normal(size=rows),
+        "y": rng.exponential(size=rows),
+    })
+    for c in ("g", "x", "y"):
+        df.loc[rng.random(rows) < 0.1, c] = None
+    return df
+
+
+@pytest.mark.parametrize("strategy", ["mean", "median", "min", "max"])
+def test_statistic_fills_match_pandas(strategy):
+    df = _frame()
+    dt = DataTools(df.copy())
+    dt.fillMissingValues(strategy, columns=["x", "y"])
+    expected = df[["x", "y"]].fillna(getattr(df[["x", "y"]], strategy)())
+    pd.testing.assert_frame_equal(dt.df[["x", "y"]], expected)
+
+
+def test_approx_median_fill_is_close():
+    df = _frame(50_000)
+    dt = DataTools(df.copy())
+    dt.fillMissingValues("median", columns=["y"], approx=True)
+    filled = dt.df.loc[df["y"].isna(), "y"].iloc[0]
+    rank = (df["y"].dropna() <= filled).mean()
+    assert abs(rank - 0.5) <= 0.001
+
+
+@pytest.mark.parametrize("strategy", ["ffill", "bfill", "interpolate"])
+def test_ordered_fills_follow_time_col(strategy):
+    df = _frame()
+    dt = DataTools(df.copy())
+    dt.fillMissingValues(strategy, columns=["x"], time_col="t")
+    ordered = df.sort_values("t")
+    if strategy == "interpolate":
+        # linear in the time values, gaps between known values only (like limit_area="inside")
+        by_time = ordered.set_index("t")["x"].interpolate(method="index", limit_area="inside")
+        expected = pd.Series(by_time.to_numpy(), index=ordered.index, name="x")
+    else:
+        expected = getattr(ordered["x"], strategy)()
+    pd.testing.assert_series_equal(dt.df["x"], expected.reindex(df.index))
+
+
+def test_group_fill_matches_groupby_transform():
+    df = _frame()
+    dt = DataTools(df.copy())
+    dt.fillMissingGroupBy("g", "x", strategy="mean", fallback=False)
+    expected = df["x"].fillna(df.groupby("g")["x"].transform("mean"))
+    pd.testing.assert_series_equal(dt.df["x"], expected)
+
+
+def test_masks_and_patterns_match_isna():
+    df = _frame()
+    dt = DataTools(df)
+    na = df.isna()
+    pd.testing.assert_series_equal(dt.missingMask(["x", "y"]), (na["x"] & na["y"]).rename("missing"))
+    pd.testing.assert_series_equal(dt.missingMask(["x", "y"], how="any", present="g"),
+                                   ((na["x"] | na["y"]) & ~na["g"]).rename("missing"))
+    patterns = dt.missingPatterns()
+    expected = na.value_counts()
+    assert patterns["count"].tolist() == sorted(expected.tolist(), reverse=True)
+    assert patterns["count"].sum() == len(df)
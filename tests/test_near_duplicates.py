@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from DataUtil import DataTools
+from near_duplicates import minhash_signatures, shingle_hashes
+
+
+def _exact_jaccard(hashes, starts, i, j):
+    a = set(hashes[starts[i]:starts[i + 1]].tolist())
+    b = set(hashes[starts[j]:starts[j + 1]].tolist())
+    return len(a & b) / len(a | b)
+
+
+def test_minhash_estimates_jaccard():
+    texts = [
+        "the quick brown fox jumps over the lazy dog",
+        "the quick brown fox jumped over the lazy dog",
+        "the quick brown cat jumps over a lazy dog",
+        "a completely different sentence about data",
+    ]
+    hashes, starts = shingle_hashes(texts, 5)
+    signatures = minhash_signatures(hashes, starts, num_perm=512)
+    for i in range(len(texts)):
+        for j in range(i + 1, len(texts)):
+            estimate = float((signatures[i] == signatures[j]).mean())
+            assert abs(estimate - _exact_jaccard(hashes, starts, i, j)) <= 0.1
+
+
+def test_clusters_group_near_duplicates_only():
+    df = pd.DataFrame({"review": [
+        "Great product, works as described!!!",
+        "great product works as described??",
+        "Terrible support, never again.",
+        None,
+        "Great product, works as described",
+        "Shipping was fast and the box was intact.",
+    ]})
+    clusters = DataTools(df).nearDuplicateClusters("review", threshold=0.8)
+    assert clusters.tolist() == [0, 0, 1, -1, 0, 2]
+
+
+def test_drop_keeps_one_row_per_cluster():
+    rng = np.random.default_rng(0)
+    base = [f"sentence number {i} with enough text to shingle" for i in range(50)]
+    texts = [base[i] + rng.choice(["", "!", "!!", "?"]) for i in rng.integers(0, 50, 400)]
+    dt = DataTools(pd.DataFrame({"t": texts}))
+    dt.dropNearDuplicates("t", threshold=0.9)
+    normalized = pd.Series(texts).str.rstrip("!?")
+    assert len(dt.df) == normalized.nunique()
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataUtil import DataTools
+from preprocessing import Preprocessor
+
+
+def _frame(rows=600, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "age": rng.normal(40, 10, rows),
+        "salary": rng.normal(5e4, 1e4, rows),
+        "city": rng.choice(["rome", "oslo", "lima", None], rows),
+        "dept": rng.choice(["x", "y", "z"], rows),
+    })
+    df.loc[rng.random(rows) < 0.1, "age"] = np.nan
+    return df
+
+
+def _recorded(target):
+    target.fillMissingValues("median", columns=["age"])
+    target.clip_outliers_iqr(columns=["salary"])
+    target.scale(columns=["age", "salary"])
+    target.labelEncode("city")
+    target.oneHotEncode(["dept"])
+    return target
+
+
+def test_fit_transform_matches_eager_datatools():
+    df = _frame()
+    fitted = _recorded(Preprocessor()).fit_transform(df)
+    eager = _recorded(DataTools(df.copy())).df
+    assert fitted["city"].dtype == "Int64"
+    pd.testing.assert_frame_equal(fitted.astype({"city": "float64"}), eager.astype({"city": "float64"}))
+
+
+def test_label_codes_are_integers_with_na_for_unseen():
+    pre = Preprocessor().labelEncode("city").fit(_frame())
+    batch = pd.DataFrame({"city": ["oslo", "paris", None, "rome"]})
+    out = pre.transform(batch)["city"]
+    assert out.dtype == "Int64"
+    assert out.tolist()[0] == 1 and out.isna().tolist() == [False, True, True, False]
+
+
+@pytest.mark.parametrize("name", ["prep.json", "prep.json.gz"])
+def test_save_load_round_trip(tmp_path, name):
+    df = _frame()
+    pre = _recorded(Preprocessor().fillMissingGroupBy("dept", "salary")).fit(df)
+    path = tmp_path / name
+    pre.save(str(path))
+    loaded = Preprocessor.load(str(path))
+    batch = _frame(seed=1)
+    pd.testing.assert_frame_equal(loaded.transform(batch), pre.transform(batch))
+
+
+def test_load_rejects_pickles(tmp_path):
+    path = tmp_path / "prep.pkl"
+    pd.to_pickle({"version": Preprocessor.FORMAT_VERSION, "steps": []}, str(path))
+    with pytest.raises(ValueError):
+        Preprocessor.load(str(path))
+
+
+def test_fit_chunks_matches_fit_for_exact_statistics():
+    df = _frame()
+    full = Preprocessor().fillMissingValues("mean", columns=["age"]).scale(columns=["age", "salary"])
+    full.labelEncode("city").fit(df)
+    chunked = Preprocessor().fillMissingValues("mean", columns=["age"]).scale(columns=["age", "salary"])
+    chunked.labelEncode("city").fit_chunks(lambda: (df.iloc[i:i + 128] for i in range(0, len(df), 128)))
+    pd.testing.assert_frame_equal(chunked.transform(df), full.transform(df), rtol=1e-9)
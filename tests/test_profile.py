@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import eda
+from DataUtil import DataTools
+
+
+def _frame(rows=2_000):
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "a": rng.integers(0, 5, rows).astype(float),
+        "b": rng.choice(["x", "y", None], rows),
+        "c": rng.choice([0.0, -0.0, np.nan], rows),
+    })
+    df.loc[rng.random(rows) < 0.1, "a"] = np.nan
+    return df
+
+
+def test_overview_matches_pandas():
+    df = _frame()
+    summary, table = DataTools(df.copy()).overview()
+    assert summary["duplicates"] == int(df.duplicated().sum())
+    pd.testing.assert_series_equal(table["missing_count"].sort_index(), df.isna().sum().sort_index(),
+                                   check_names=False)
+    pd.testing.assert_series_equal(table["unique"].sort_index(), df.nunique().sort_index(),
+                                   check_names=False)
+
+
+def test_duplicates_are_exact_under_hash_collisions(monkeypatch):
+    df = pd.DataFrame({"a": [1.0, 2.0, 1.0, 3.0], "b": ["x", "y", "x", "x"]})
+    # every row hash collides: only the exact comparison can tell rows apart
+    monkeypatch.setattr(eda, "hash_values", lambda s: np.zeros(len(s), dtype=np.uint64))
+    monkeypatch.setattr(eda, "_mix64", lambda h: np.zeros(len(h), dtype=np.uint64))
+    summary, _ = DataTools(df).overview()
+    assert summary["duplicates"] == 1
+
+
+@pytest.mark.parametrize("approx", [False, True])
+def test_overview_after_change_rescans(approx):
+    df = _frame()
+    dt = DataTools(df.copy())
+    dt.overview(approx=approx)
+    dt.fillMissingValues("value", value=1.0, columns=["a"])
+    summary, table = dt.overview(approx=approx)
+    expected = int(dt.df.duplicated().sum())
+    if approx:
+        assert abs(summary["duplicates"] - expected) <= 0.01 * len(df)
+    else:
+        assert summary["duplicates"] == expected
+    assert table.loc["a", "missing_count"] == 0
+
+
+def _sampled_tools(tmp_path):
+    path = tmp_path / "data.csv"
+    _frame(5_000).to_csv(path, index=False)
+    dt = DataTools(pd.DataFrame())
+    dt.importData(str(path), sample=0.2, seed=0)
+    assert dt.sample_population == 5_000
+    return dt
+
+
+def test_sample_population_survives_row_preserving_transforms(tmp_path):
+    dt = _sampled_tools(tmp_path)
+    dt.fillMissingValues("mean", columns=["a"])
+    assert dt.sample_population == 5_000
+    assert "sample_rows" in dt.overview()[0]
+
+
+def test_sample_population_resets_when_rows_change(tmp_path):
+    dt = _sampled_tools(tmp_path)
+    dt.dropDuplicates()
+    assert dt.sample_population is None
+    assert "sample_rows" not in dt.overview()[0]
+
+
+def test_sample_population_resets_when_frame_replaced(tmp_path):
+    dt = _sampled_tools(tmp_path)
+    dt.df = _frame(10)
+    assert dt.sample_population is None
+
+
+@pytest.mark.parametrize("numpy2", [True, False])
+def test_null_counts_match_pandas(monkeypatch, numpy2):
+    if not numpy2:
+        monkeypatch.delattr(np, "bitwise_count", raising=False)
+    df = _frame(1_003)  # not a multiple of 8: padding bits must not count
+    dt = DataTools(df)
+    assert dt._null_counts(df.columns).to_dict() == df.isna().sum().to_dict()
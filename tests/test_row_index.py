@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from row_index import RowHashIndex, hash_rows
+
+
+def _batch(rows, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": rng.integers(0, 50, rows),
+        "x": rng.choice([0.0, -0.0, 1.5, np.nan], rows),
+        "s": rng.choice(["a", "b", None], rows),
+    })
+
+
+def test_hash_rows_matches_row_equality():
+    df = _batch(2_000, 0)
+    h = hash_rows(df)
+    assert len(pd.unique(h)) == len(df.drop_duplicates())
+    np.testing.assert_array_equal(pd.Series(h).duplicated().to_numpy(), df.duplicated().to_numpy())
+
+
+@pytest.mark.parametrize("verify", [False, True])
+def test_index_matches_duplicated_over_batches(tmp_path, verify):
+    batches = [_batch(500, seed) for seed in range(4)]
+    index = RowHashIndex(verify=verify)
+    seen = [index.update(b) for b in batches[:3]]
+    expected = pd.concat(batches[:3], ignore_index=True).duplicated().to_numpy()
+    np.testing.assert_array_equal(np.concatenate(seen), expected)
+
+    path = tmp_path / "index.npz"
+    index.save(str(path))
+    loaded = RowHashIndex.load(str(path))
+    everything = pd.concat(batches, ignore_index=True)
+    expected = everything.duplicated().to_numpy()[1500:]
+    np.testing.assert_array_equal(loaded.duplicated(batches[3]), expected)
+    assert len(loaded) == len(pd.concat(batches[:3]).drop_duplicates())
+
+
+def test_index_uses_only_its_columns():
+    index = RowHashIndex(columns=["id"])
+    first, second = _batch(200, 1), _batch(200, 2)
+    index.update(first)
+    np.testing.assert_array_equal(index.contains(second), second["id"].isin(first["id"]).to_numpy())
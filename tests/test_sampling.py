@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from sampling import ReservoirSampler, proportion_ci, sample_frame
+
+
+def _frame(rows=20_000):
+    rng = np.random.default_rng(5)
+    return pd.DataFrame({"k": rng.choice(["a", "b", "c"], rows, p=[0.6, 0.3, 0.1]), "v": rng.normal(size=rows)})
+
+
+def test_stratified_sample_keeps_group_shares():
+    df = _frame()
+    sub = sample_frame(df, 0.1, stratify="k", seed=0)
+    assert abs(len(sub) - 2_000) <= 3
+    shares = sub["k"].value_counts(normalize=True)
+    expected = df["k"].value_counts(normalize=True)
+    assert (shares - expected).abs().max() <= 0.002
+
+
+def test_reservoir_sample_is_uniform_over_chunks():
+    df = _frame().reset_index()
+    counts = np.zeros(len(df))
+    for seed in range(40):
+        sampler = ReservoirSampler(500, seed=seed)
+        for start in range(0, len(df), 3_000):
+            sampler.update(df.iloc[start:start + 3_000])
+        sub = sampler.result()
+        assert len(sub) == 500 and sub["index"].is_unique
+        counts[sub["index"].to_numpy()] += 1
+    # first and last chunks are sampled at the same rate
+    first, last = counts[:3_000].mean(), counts[-2_000:].mean()
+    assert abs(first - last) <= 0.3 * 40 * 500 / len(df)
+
+
+def test_proportion_interval_covers_the_truth():
+    rng = np.random.default_rng(6)
+    population = rng.random(100_000) < 0.2
+    covered = 0
+    for _ in range(200):
+        sample = rng.choice(population, 1_000, replace=False)
+        low, high = proportion_ci(sample.sum(), len(sample), population=len(population))
+        covered += low <= population.mean() <= high
+    assert covered >= 180  # ~95% nominal coverage
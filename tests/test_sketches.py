@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataUtil import DataTools
+from incremental import IncrementalProfiler
+from sketches import HyperLogLog, QuantileSketch, approx_quantile
+
+
+def _rank_error(values, estimates, qs):
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, estimates, side="right") / len(ordered)
+    return np.abs(ranks - np.asarray(qs)).max()
+
+
+@pytest.mark.parametrize("rank_error", [0.01, 0.001])
+def test_quantile_sketch_rank_error(rank_error):
+    values = np.random.default_rng(0).lognormal(size=300_000)
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    estimates = approx_quantile(values, qs, rank_error=rank_error)
+    assert _rank_error(values, estimates, qs) <= rank_error
+
+
+def test_quantile_sketch_merge_and_small_inputs():
+    values = np.random.default_rng(1).normal(size=200_000)
+    parts = [QuantileSketch(seed=i).update(chunk) for i, chunk in enumerate(np.array_split(values, 8))]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+    qs = [0.1, 0.5, 0.9]
+    assert _rank_error(values, merged.quantile(qs), qs) <= 0.001
+    small = values[:500]
+    np.testing.assert_allclose(QuantileSketch().update(small).quantile(qs), np.quantile(small, qs))
+
+
+@pytest.mark.parametrize("distinct", [100, 10_000, 500_000])
+def test_hyperloglog_error(distinct):
+    values = np.random.default_rng(2).integers(0, distinct, 3 * distinct)
+    exact = len(np.unique(values))
+    hll = HyperLogLog(p=14).update(values)
+    assert abs(hll.count() - exact) <= 3 * 1.04 / np.sqrt(2 ** 14) * exact
+
+
+def test_incremental_profiler_matches_exact_overview():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({
+        "a": rng.normal(size=20_000),
+        "b": rng.choice(["x", "y", "z", None], 20_000),
+        "c": rng.integers(0, 1_000, 20_000).astype(float),
+    })
+    df.loc[rng.random(len(df)) < 0.05, "a"] = np.nan
+    profiler = IncrementalProfiler()
+    for start in range(0, len(df), 3_000):
+        profiler.update(df.iloc[start:start + 3_000])
+    summary, table = profiler.overview()
+    exact_summary, exact_table = DataTools(df).overview()
+    assert summary["rows"] == exact_summary["rows"]
+    pd.testing.assert_series_equal(table["missing_count"].sort_index(),
+                                   exact_table["missing_count"].sort_index())
+    assert table.loc["b", "unique"] == exact_table.loc["b", "unique"]
+    assert abs(table.loc["c", "unique"] - exact_table.loc["c", "unique"]) <= 0.03 * 1_000
+
+    insights = profiler.insights()
+    assert insights.loc["a", "mean"] == pytest.approx(df["a"].mean())
+    assert insights.loc["a", "std"] == pytest.approx(df["a"].std())
+    assert insights.loc["c", "max"] == df["c"].max()
@@ -0,0 +1,77 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataUtil import DataTools
+from sql_tools import ConnectionPool
+
+
+def _sorted(df):
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "test.db"
+    rng = np.random.default_rng(0)
+    key = rng.integers(0, 100, size=100).astype(float)
+    key[::9] = np.nan  # NULL keys
+    df = pd.DataFrame({
+        "id": np.arange(100),
+        "key": key,
+        "value": rng.normal(size=100),
+        "day": pd.date_range("2024-01-01", periods=100, freq="D").strftime("%Y-%m-%d"),
+    })
+    with sqlite3.connect(path) as con:
+        df.to_sql("t", con, index=False)
+    return f"sqlite:///{path}"
+
+
+def _read(url, **kwargs):
+    dt = DataTools(pd.DataFrame())
+    dt.readSQL("SELECT * FROM t", url, **kwargs)
+    return dt.df
+
+
+def test_partitioned_read_matches_single_read(db):
+    single = _read(db)
+    parts = _read(db, partition_column="key", partitions=4)
+    assert len(single) == 100
+    pd.testing.assert_frame_equal(_sorted(parts), _sorted(single))
+    assert parts["key"].dtype == np.float64
+    assert parts["key"].isna().sum() == single["key"].isna().sum() > 0
+
+
+def test_bounds_only_place_split_points(db):
+    single = _read(db)
+    parts = _read(db, partition_column="key", partitions=4, bounds=(10, 50))
+    pd.testing.assert_frame_equal(_sorted(parts), _sorted(single))
+
+
+def test_date_partitions_and_pool(db):
+    single = _read(db)
+    with ConnectionPool(db, size=2) as pool:
+        parts = _read(pool, partition_column="day", partitions=3)
+    pd.testing.assert_frame_equal(_sorted(parts), _sorted(single))
+
+
+def test_text_partition_column_is_rejected(tmp_path):
+    url = f"sqlite:///{tmp_path / 'text.db'}"
+    DataTools(pd.DataFrame({"name": ["a", "b"]})).writeSQL("t", url)
+    with pytest.raises(TypeError, match="partition_column 'name'"):
+        _read(url, partition_column="name")
+
+
+def test_write_read_round_trip(tmp_path):
+    url = f"sqlite:///{tmp_path / 'out.db'}"
+    df = pd.DataFrame({"a": np.arange(2_500), "b": np.linspace(0, 1, 2_500), "c": ["x", None] * 1_250})
+    written = DataTools(df).writeSQL("out", url, batch_size=1_000)
+    assert written == len(df)
+    dt = DataTools(pd.DataFrame())
+    dt.readSQL("SELECT * FROM out", url)
+    pd.testing.assert_frame_equal(dt.df, df, check_dtype=False)
+    DataTools(df.head(10)).writeSQL("out", url, if_exists="append")
+    dt.readSQL("SELECT COUNT(*) AS n FROM out", url)
+    assert dt.df["n"].iloc[0] == len(df) + 10
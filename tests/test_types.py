@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from types_tools import _optimal_dtype
+
+
+@pytest.mark.parametrize("values, dtype, expected", [
+    ([0, 200], "int64", "uint8"),
+    ([-1, 100], "int64", "int8"),
+    ([0, 70_000], "int64", "uint32"),
+    ([0, 300, None], "Int64", "UInt16"),
+    ([1, 2], "uint16", "uint8"),
+    ([1, 2], "int8", None),
+    ([0, 200], "uint8", None),
+])
+def test_integers_only_narrow(values, dtype, expected):
+    assert _optimal_dtype(pd.Series(values, dtype=dtype)) == expected
+
+
+def test_category_needs_few_distinct_values():
+    mostly_unique = pd.Series([f"v{i % 30}" for i in range(100)], dtype=object)
+    assert _optimal_dtype(mostly_unique) != "category"
+    repeated = pd.Series([f"v{i % 3}" for i in range(100)], dtype=object)
+    assert _optimal_dtype(repeated) == "category"
+
+
+def test_optimize_memory_keeps_values():
+    from DataUtil import DataTools
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"a": rng.integers(0, 250, 1000), "b": rng.integers(-100, 100, 1000)})
+    dt = DataTools(df.copy())
+    dt.optimizeMemory()
+    assert str(dt.df["a"].dtype) == "uint8" and str(dt.df["b"].dtype) == "int8"
+    pd.testing.assert_frame_equal(dt.df.astype("int64"), df)
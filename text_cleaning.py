@@ -10,7 +10,9 @@ class TextCleaningTools:
         strip: bool = True,
         remove_punct: bool = False,
         remove_extra_spaces: bool = True,
-        inplace: bool = True
+        inplace: bool = True,
+        copy: bool = None,
+        n_jobs: int = None
     ):
         """
         Basic text cleaning for one or more columns.
@@ -20,12 +22,16 @@ class TextCleaningTools:
             strip: strip leading/trailing spaces
             remove_punct: remove punctuation
             remove_extra_spaces: collapse multiple spaces to one
+
+        n_jobs > 1 cleans columns on threads; the regex replacements mostly hold
+        the GIL, so expect little speedup here compared to numeric transforms.
         """
         cols = self._ensure_list(columns)
         self._require_columns(cols)
 
-        new_df = self.df.copy()
-        for c in cols:
+        new_df = self._working_df(inplace, copy)
+
+        def cleaned(c):
             s = new_df[c].astype("string")
 
             if strip:
@@ -36,7 +42,9 @@ class TextCleaningTools:
                 s = s.str.replace(r"[^\w\s]", "", regex=True)
             if remove_extra_spaces:
                 s = s.str.replace(r"\s+", " ", regex=True).str.strip()
+            return s
 
-            new_df[c] = s
+        for c, s in self._map_columns(new_df, cleaned, cols, n_jobs):
+            self._set_column(new_df, c, s)
 
-        return self._apply(new_df, inplace)
+        return self._apply(new_df, inplace, changed=cols)
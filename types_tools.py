@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -5,44 +6,221 @@ class TypeTools:
     # ==========================================================
     """SECTION: Column Type Transformations"""
     # ==========================================================
-    def to_int(self, column: str, *, inplace: bool = True):
+    def to_int(self, column: str, *, inplace: bool = True, copy: bool = None):
         """Convert column to int64."""
         self._require_columns(column)
-        new_df = self.df.copy()
-        new_df[column] = new_df[column].astype("int64")
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        self._set_column(new_df, column, new_df[column].astype("int64"))
+        return self._apply(new_df, inplace, changed=[column])
 
-    def to_float(self, column: str, *, inplace: bool = True):
+    def to_float(self, column: str, *, inplace: bool = True, copy: bool = None):
         """Convert column to float64."""
         self._require_columns(column)
-        new_df = self.df.copy()
-        new_df[column] = new_df[column].astype("float64")
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        self._set_column(new_df, column, new_df[column].astype("float64"))
+        return self._apply(new_df, inplace, changed=[column])
 
-    def to_string(self, column: str, *, inplace: bool = True):
+    def to_string(self, column: str, *, inplace: bool = True, copy: bool = None):
         """Convert column to pandas StringDtype."""
         self._require_columns(column)
-        new_df = self.df.copy()
-        new_df[column] = new_df[column].astype("string")
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        self._set_column(new_df, column, new_df[column].astype("string"))
+        return self._apply(new_df, inplace, changed=[column])
 
-    def to_bool(self, column: str, *, inplace: bool = True):
+    def to_bool(self, column: str, *, inplace: bool = True, copy: bool = None):
         """Convert column to bool."""
         self._require_columns(column)
-        new_df = self.df.copy()
-        new_df[column] = new_df[column].astype("bool")
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        self._set_column(new_df, column, new_df[column].astype("bool"))
+        return self._apply(new_df, inplace, changed=[column])
 
-    def to_datetime(self, column: str, *, inplace: bool = True):
+    def to_datetime(self, column: str, *, inplace: bool = True, copy: bool = None):
         """Convert column to datetime (invalid values become NaT)."""
         self._require_columns(column)
-        new_df = self.df.copy()
-        new_df[column] = pd.to_datetime(new_df[column], errors="coerce")
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        self._set_column(new_df, column, pd.to_datetime(new_df[column], errors="coerce"))
+        return self._apply(new_df, inplace, changed=[column])
 
-    def to_category(self, column: str, *, inplace: bool = True):
+    def to_category(self, column: str, *, inplace: bool = True, copy: bool = None):
         """Convert column to pandas 'category' dtype."""
         self._require_columns(column)
-        new_df = self.df.copy()
-        new_df[column] = new_df[column].astype("category")
-        return self._apply(new_df, inplace)
+        new_df = self._working_df(inplace, copy)
+        self._set_column(new_df, column, new_df[column].astype("category"))
+        return self._apply(new_df, inplace, changed=[column])
+
+    # ==========================================================
+    """SECTION: Memory Optimization"""
+    # ==========================================================
+    def optimizeMemory(
+        self,
+        columns=None,
+        *,
+        float32: bool = False,
+        category_ratio: float = 0.05,
+        inplace: bool = True,
+        copy: bool = None,
+        return_report: bool = False
+    ):
+        """
+        Shrink column dtypes.
+        - integers => smallest width that holds their range, unsigned when there
+                      are no negatives (uint8..uint32 / int8..int32); never wider
+        - floats   => float32 when no value changes (float32=True => always)
+        - text     => 'category' when unique/rows <= category_ratio,
+                      else Arrow-backed strings (when pyarrow is installed)
+        columns=None => all columns. Other dtypes are left alone.
+
+        If return_report=True returns (df, report) where report holds
+        before_MB / after_MB (same measure as overview()) and a per-column table.
+        """
+        cols = list(self.df.columns) if columns is None else self._ensure_list(columns)
+        self._require_columns(cols)
+        if not 0 <= category_ratio <= 1:
+            raise ValueError("category_ratio must be between 0 and 1.")
+
+        new_df = self._working_df(inplace, copy)
+        before = self._memory_by_column(new_df)
+
+        changed = []
+        for c in cols:
+            target = _optimal_dtype(
+                new_df[c], float32=float32, category_ratio=category_ratio,
+                nunique=lambda: self._stat(c, "nunique", lambda: self.df[c].nunique(dropna=True))
+            )
+            if target is not None:
+                self._set_column(new_df, c, new_df[c].astype(target))
+                changed.append(c)
+
+        after = self._memory_by_column(new_df)
+        result = self._apply(new_df, inplace, changed=changed)
+        if not return_report:
+            return result
+
+        columns_table = pd.DataFrame({
+            "dtype": new_df.dtypes.astype(str),
+            "before_MB": before[new_df.columns] / (1024 ** 2),
+            "after_MB": after[new_df.columns] / (1024 ** 2),
+        }).loc[cols]
+        report = {
+            "before_MB": float(before.sum() / (1024 ** 2)),
+            "after_MB": float(after.sum() / (1024 ** 2)),
+            "columns": columns_table,
+        }
+        report["ratio"] = report["before_MB"] / report["after_MB"] if report["after_MB"] else float("inf")
+        return result, report
+
+    @staticmethod
+    def _memory_by_column(df: pd.DataFrame) -> pd.Series:
+        """memory_usage(deep=True) per column, index included (as in overview())."""
+        return df.memory_usage(deep=True, index=True)
+
+
+def _arrow_string_dtype():
+    """Arrow-backed string dtype, or None when pyarrow is not installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    return pd.StringDtype("pyarrow")
+
+
+def _is_text(s: pd.Series) -> bool:
+    if isinstance(s.dtype, pd.StringDtype):
+        return True
+    return s.dtype == object and pd.api.types.infer_dtype(s, skipna=True) in ("string", "empty")
+
+
+def _optimal_dtype(s: pd.Series, *, float32: bool = False, category_ratio: float = 0.05, nunique=None):
+    """
+    Smallest safe dtype for a column, or None if it should stay as it is.
+    nunique: optional zero-argument function returning the distinct count (for caching).
+    """
+    dtype = s.dtype
+    if pd.api.types.is_bool_dtype(dtype):
+        return None
+
+    if pd.api.types.is_integer_dtype(dtype):
+        if s.notna().sum() == 0:
+            return None
+        lo, hi = s.min(), s.max()
+        if lo >= 0:
+            widths = (np.uint8, np.uint16, np.uint32)
+        else:
+            widths = (np.int8, np.int16, np.int32)
+        for width in widths:
+            info = np.iinfo(width)
+            if info.min <= lo and hi <= info.max:
+                if np.dtype(width).itemsize >= dtype.itemsize:
+                    return None  # only ever narrow
+                name = np.dtype(width).name
+                # keep nullable integers nullable
+                if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+                    return "UInt" + name[4:] if name.startswith("uint") else name.capitalize()
+                return name
+        return None
+
+    if pd.api.types.is_float_dtype(dtype):
+        if str(dtype) != "float64":
+            return None
+        if float32:
+            return "float32"
+        values = s.to_numpy()
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32)
+        same = (narrowed.astype(np.float64) == values) | np.isnan(values)
+        return "float32" if same.all() else None
+
+    if _is_text(s):
+        n = len(s)
+        distinct = nunique() if nunique is not None else s.nunique(dropna=True)
+        if n and distinct / n <= category_ratio:
+            return "category"
+        arrow = _arrow_string_dtype()
+        if arrow is None or dtype == arrow:
+            return None
+        if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+            return None  # already Arrow-backed
+        return arrow
+
+    return None
+
+
+def _looks_like_dates(s: pd.Series) -> bool:
+    """Text column whose (non-null) sample values all parse as dates."""
+    values = s.dropna()
+    if len(values) == 0 or not _is_text(s):
+        return False
+    text = values.astype(str)
+    if not text.str.contains(r"\d[-/.:]\d|\d{4}-\d", regex=True).all():
+        return False
+    parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+    return bool(parsed.notna().all())
+
+
+def _infer_schema(sample: pd.DataFrame, *, category_ratio: float = 0.05, float32: bool = False) -> dict:
+    """
+    Reader options (dtype=..., parse_dates=[...]) inferred from a sample of a source.
+    Only choices that stay correct for rows outside the sample are made here:
+    - low-cardinality text => 'category' (unseen values just add categories)
+    - text that parses as dates => parse_dates
+    - whole-number floats (ints with gaps) => nullable 'Int64' (a fractional value
+      later in the file makes the read fail, so the caller can fall back)
+    - float64 => float32 only when float32=True
+    Integer widths are not taken from the sample (readers wrap out-of-range
+    values silently); narrow them after the read with _optimal_dtype.
+    """
+    dtype, parse_dates = {}, []
+    for c in sample.columns:
+        s = sample[c]
+        if _looks_like_dates(s):
+            parse_dates.append(c)
+        elif _is_text(s):
+            if _optimal_dtype(s, category_ratio=category_ratio) == "category":
+                dtype[c] = "category"
+        elif pd.api.types.is_float_dtype(s.dtype) and str(s.dtype) == "float64":
+            values = s.dropna()
+            if len(values) and s.isna().any() and (values == np.round(values)).all():
+                dtype[c] = "Int64"
+            elif float32:
+                dtype[c] = "float32"
+    return {"dtype": dtype, "parse_dates": parse_dates}